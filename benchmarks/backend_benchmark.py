@@ -0,0 +1,304 @@
+"""
+backend_benchmark.py
+
+This module compares the CPU inference backends of the summarizer. Every backend loads the
+model in its own process, so the peak memory reported belongs to that backend alone, then
+summarizes the same top-15 headline sets one query at a time. Latency, load time, peak
+memory and model size are reported per backend, together with the ROUGE-1, ROUGE-2 and
+ROUGE-L F1 scores of its summaries against the fp32 torch summaries. A ROUGE-L below 1.0
+is the drift the quantized or exported model introduces.
+
+Unlike run_benchmarks, this benchmark downloads and runs the real model, so it needs torch
+and transformers, and optimum with onnxruntime for the onnx backend.
+
+Functions:
+    - rouge_n: ROUGE-N F1 score of a summary against a reference.
+    - rouge_l: ROUGE-L F1 score of a summary against a reference.
+    - measure_backend: Loads a backend and times its summaries.
+    - compare_backends: Compares backend measurements against the fp32 baseline.
+    - main: Command line entry point.
+
+Example Usage:
+    python -m benchmarks.backend_benchmark --samples 20 --threads 4
+    python -m benchmarks.backend_benchmark --backends torch torch-int8 --output benchmarks/backends.json
+"""
+
+# Import Relevant Packages
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+# Import Benchmark Corpora
+from src.corpus import generate_articles, load_history_articles
+
+# Import Inference Backends
+from src.inference_backend import BACKENDS, load_backend_pipeline
+from src.model_registry import estimate_model_bytes
+from src.utils.stage_timer import peak_rss_mb
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_BACKEND = "torch"
+TITLES_PER_SUMMARY = 15  # Like the top 15 headlines of a query
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercase word tokens of a text"""
+    return re.findall(r"\w+", text.lower())
+
+
+def _f1(overlap: int, candidate_total: int, reference_total: int) -> float:
+    """F1 score from an overlap count and the totals it is relative to"""
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(candidate: str, reference: str, n: int = 1) -> float:
+    """
+    Return the ROUGE-N F1 score of a summary against a reference summary.
+
+    Args:
+        candidate (str): The summary to score.
+        reference (str): The reference summary.
+        n (int): Length of the compared n-grams. Default is 1.
+
+    Returns:
+        float: The F1 score of the shared n-grams, 1.0 for identical texts.
+    """
+    candidate_tokens, reference_tokens = _tokens(candidate), _tokens(reference)
+    candidate_grams = Counter(zip(*[candidate_tokens[i:] for i in range(n)]))
+    reference_grams = Counter(zip(*[reference_tokens[i:] for i in range(n)]))
+    overlap = sum((candidate_grams & reference_grams).values())
+    return _f1(overlap, sum(candidate_grams.values()), sum(reference_grams.values()))
+
+
+def rouge_l(candidate: str, reference: str) -> float:
+    """
+    Return the ROUGE-L F1 score of a summary against a reference summary.
+
+    Args:
+        candidate (str): The summary to score.
+        reference (str): The reference summary.
+
+    Returns:
+        float: The F1 score of the longest common token subsequence, 1.0 for identical texts.
+    """
+    candidate_tokens, reference_tokens = _tokens(candidate), _tokens(reference)
+    previous = [0] * (len(reference_tokens) + 1)
+    for token in candidate_tokens:
+        current = [0]
+        for index, other in enumerate(reference_tokens):
+            current.append(
+                previous[index] + 1 if token == other else max(previous[index + 1], current[index])
+            )
+        previous = current
+    return _f1(previous[-1], len(candidate_tokens), len(reference_tokens))
+
+
+def measure_backend(
+    backend: str,
+    model_id: str,
+    contents: List[str],
+    *,
+    pipeline_kwargs: Dict[str, Any],
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+    loader: Callable[..., Any] = load_backend_pipeline,
+) -> Dict[str, Any]:
+    """
+    Load a backend and summarize every content, one query at a time.
+
+    One summary is generated before timing, so one-off initialization is not counted as latency.
+
+    Args:
+        backend (str): The backend to measure.
+        model_id (str): The model ID for the Hugging Face pipeline.
+        contents (List[str]): The contents to summarize.
+        pipeline_kwargs (Dict[str, Any]): Keyword arguments passed to the pipeline.
+        intra_op_threads (Optional[int]): Threads of a single operator. Default is the runtime default.
+        inter_op_threads (Optional[int]): Threads running independent operators. Default is the runtime default.
+        loader (Callable[..., Any]): Loads a pipeline like load_backend_pipeline.
+
+    Returns:
+        Dict[str, Any]: Load time, latencies, summaries, model size and peak memory of the backend.
+    """
+    start = time.perf_counter()
+    hf_llm = loader(
+        model_id,
+        dict(pipeline_kwargs),
+        backend=backend,
+        intra_op_threads=intra_op_threads,
+        inter_op_threads=inter_op_threads,
+    )
+    load_seconds = time.perf_counter() - start
+
+    hf_llm.invoke(contents[0])
+    latencies = []
+    summaries = []
+    for content in contents:
+        start = time.perf_counter()
+        summaries.append(hf_llm.invoke(content))
+        latencies.append(time.perf_counter() - start)
+
+    return {
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "latencies": latencies,
+        "summaries": summaries,
+        "model_mb": estimate_model_bytes(hf_llm) / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def compare_backends(
+    measurements: List[Dict[str, Any]], *, baseline: str = BASELINE_BACKEND
+) -> List[Dict[str, Any]]:
+    """
+    Summarize backend measurements and compare them against the baseline backend.
+
+    Args:
+        measurements (List[Dict[str, Any]]): Results of measure_backend, including the baseline.
+        baseline (str): The backend the others are compared with. Default is "torch".
+
+    Returns:
+        List[Dict[str, Any]]: One row per backend with latency percentiles, speedup, memory and
+                              mean ROUGE F1 scores against the baseline summaries.
+
+    Raises:
+        ValueError: If the baseline backend was not measured.
+    """
+    by_backend = {measurement["backend"]: measurement for measurement in measurements}
+    if baseline not in by_backend:
+        raise ValueError(f"The baseline backend >>{baseline}<< was not measured")
+    references = by_backend[baseline]["summaries"]
+    baseline_p50 = statistics.median(by_backend[baseline]["latencies"])
+
+    rows = []
+    for measurement in measurements:
+        latencies = sorted(measurement["latencies"])
+        p50 = statistics.median(latencies)
+        pairs = list(zip(measurement["summaries"], references))
+        rows.append(
+            {
+                "backend": measurement["backend"],
+                "load_seconds": round(measurement["load_seconds"], 3),
+                "p50_seconds": round(p50, 4),
+                "p95_seconds": round(latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))], 4),
+                "mean_seconds": round(statistics.fmean(latencies), 4),
+                "speedup": round(baseline_p50 / p50, 2) if p50 else None,
+                "model_mb": round(measurement["model_mb"], 1),
+                "peak_rss_mb": (
+                    round(measurement["peak_rss_mb"], 1)
+                    if measurement["peak_rss_mb"] is not None
+                    else None
+                ),
+                "rouge1": round(statistics.fmean(rouge_n(c, r, 1) for c, r in pairs), 4),
+                "rouge2": round(statistics.fmean(rouge_n(c, r, 2) for c, r in pairs), 4),
+                "rougeL": round(statistics.fmean(rouge_l(c, r) for c, r in pairs), 4),
+            }
+        )
+    return rows
+
+
+def _format_rows(rows: List[Dict[str, Any]]) -> str:
+    """Format compared backends as a plain text table"""
+    lines = [
+        f"{'Backend':<12} {'Load s':>8} {'p50 s':>8} {'p95 s':>8} {'Speedup':>8} "
+        f"{'Model MB':>9} {'Peak MB':>9} {'ROUGE-1':>8} {'ROUGE-2':>8} {'ROUGE-L':>8}"
+    ]
+    for row in rows:
+        peak = f"{row['peak_rss_mb']:.1f}" if row["peak_rss_mb"] is not None else "-"
+        lines.append(
+            f"{row['backend']:<12} {row['load_seconds']:>8.2f} {row['p50_seconds']:>8.3f} "
+            f"{row['p95_seconds']:>8.3f} {row['speedup'] or 0:>8.2f} {row['model_mb']:>9.1f} "
+            f"{peak:>9} {row['rouge1']:>8.3f} {row['rouge2']:>8.3f} {row['rougeL']:>8.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the backend comparison from the command line.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv.
+
+    Returns:
+        int: Exit status, 1 if a backend failed to load or summarize.
+    """
+    parser = argparse.ArgumentParser(description="Compare the CPU inference backends of the summarizer")
+    parser.add_argument("--backends", nargs="*", choices=BACKENDS, default=list(BACKENDS), help="Backends to compare")
+    parser.add_argument("--model", default="facebook/bart-large-cnn", help="Model ID to summarize with")
+    parser.add_argument("--samples", type=int, default=20, help="Number of headline sets summarized per backend")
+    parser.add_argument("--history-folder", type=Path, default=Path("history"), help="Folder of saved searches")
+    parser.add_argument("--threads", type=int, help="Intra-op threads of every backend")
+    parser.add_argument("--inter-op-threads", type=int, help="Inter-op threads of every backend")
+    parser.add_argument("--max-length", type=int, default=100, help="Maximum summary length in tokens")
+    parser.add_argument("--min-length", type=int, default=30, help="Minimum summary length in tokens")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    # Headline sets like the top 15 of a query, from saved searches if there are enough
+    articles = load_history_articles(args.history_folder)
+    if len(articles) < args.samples * TITLES_PER_SUMMARY:
+        articles = generate_articles(args.samples * TITLES_PER_SUMMARY)
+    titles = [article["title"] for article in articles]
+    contents = [
+        "\n".join(titles[start : start + TITLES_PER_SUMMARY])
+        for start in range(0, args.samples * TITLES_PER_SUMMARY, TITLES_PER_SUMMARY)
+    ]
+
+    backends = [BASELINE_BACKEND] + [backend for backend in args.backends if backend != BASELINE_BACKEND]
+    measurements = []
+    for backend in backends:
+        print(f"Measuring {backend}...")
+        # A fresh Process per Backend keeps the Peak Memory of one Backend apart from the others
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+            try:
+                measurements.append(
+                    executor.submit(
+                        measure_backend,
+                        backend,
+                        args.model,
+                        contents,
+                        pipeline_kwargs={
+                            "max_length": args.max_length,
+                            "min_length": args.min_length,
+                            "do_sample": False,
+                        },
+                        intra_op_threads=args.threads,
+                        inter_op_threads=args.inter_op_threads,
+                    ).result()
+                )
+            except Exception as e:
+                print(f"{backend} failed: {e}")
+                if backend == BASELINE_BACKEND:
+                    return 1
+
+    rows = compare_backends(measurements)
+    print(f"\n{_format_rows(rows)}")
+    if args.output:
+        payload = {
+            "model": args.model,
+            "samples": len(contents),
+            "threads": {"intra_op": args.threads, "inter_op": args.inter_op_threads},
+            "results": rows,
+        }
+        args.output.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nResults written to Path('{args.output}')")
+    return 0 if len(measurements) == len(backends) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
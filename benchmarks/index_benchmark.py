@@ -0,0 +1,161 @@
+"""
+index_benchmark.py
+
+This module measures the query latency of the embedding index. It fills an index with
+random normalized vectors in the dimension of all-MiniLM-L6-v2, so no model is needed,
+then times exact and approximate top-k searches and reports the recall of the approximate
+mode against the exact results.
+
+Functions:
+    - build_random_index: Fills an index with random normalized vectors.
+    - measure_queries: Times searches and compares them with exact search.
+    - main: Command line entry point.
+
+Example Usage:
+    python -m benchmarks.index_benchmark --rows 1000000
+    python -m benchmarks.index_benchmark --rows 100000 --probes 8 32
+"""
+
+# Import Relevant Packages
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Import Embedding Index
+from src.embedding_index import EmbeddingIndex
+
+# Type Hints
+from typing import Any, Dict, List, Optional
+
+DIMENSIONS = 384  # Embedding size of all-MiniLM-L6-v2
+ADD_BATCH = 100_000
+TOPICS = 2_000
+TOPIC_SEED = 42
+
+
+def _random_vectors(rng: np.random.Generator, count: int, dim: int) -> np.ndarray:
+    """Random normalized vectors, scattered around a few thousand topics like real titles"""
+    # Index and queries share the same Topics, as searches ask about stories that were saved
+    topics = np.random.default_rng(TOPIC_SEED).normal(size=(TOPICS, dim)).astype(np.float32)
+    vectors = topics[rng.integers(0, len(topics), count)] + rng.normal(size=(count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def build_random_index(folder: Path, rows: int, *, dim: int = DIMENSIONS, seed: int = 0) -> EmbeddingIndex:
+    """
+    Fill an index with random normalized vectors.
+
+    Args:
+        folder (Path): Folder of the index.
+        rows (int): Number of vectors.
+        dim (int): Dimension of the vectors. Default is 384.
+        seed (int): Seed of the vectors. Default is 0.
+
+    Returns:
+        EmbeddingIndex: The filled index.
+    """
+    rng = np.random.default_rng(seed)
+    index = EmbeddingIndex(folder, embed=lambda titles: _random_vectors(rng, len(titles), dim), model_id="random")
+    for start in range(0, rows, ADD_BATCH):
+        count = min(ADD_BATCH, rows - start)
+        index.add(
+            ({"title": f"Headline {row}", "url": f"https://example.com/{row}"} for row in range(start, start + count)),
+            vectors=_random_vectors(rng, count, dim),
+        )
+    return index
+
+
+def measure_queries(
+    index: EmbeddingIndex,
+    queries: np.ndarray,
+    *,
+    k: int = 10,
+    approximate: bool = False,
+    probes: int = 16,
+    exact: Optional[List[List[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Time searches for every query, after one untimed warm-up search.
+
+    Args:
+        index (EmbeddingIndex): The index to search.
+        queries (np.ndarray): Normalized query vectors, one per row.
+        k (int): Number of results per search. Default is 10.
+        approximate (bool): Whether to search approximately. Default is False.
+        probes (int): Cells searched in approximate mode. Default is 16.
+        exact (Optional[List[List[str]]]): URLs found by exact search per query, to compute recall.
+
+    Returns:
+        Dict[str, Any]: p50 and p95 latency in milliseconds, the found URLs and the recall.
+    """
+    index.search(queries[0], k, approximate=approximate, probes=probes)
+    latencies = []
+    found = []
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search(query, k, approximate=approximate, probes=probes)
+        latencies.append((time.perf_counter() - start) * 1000)
+        found.append([hit.url for hit in hits])
+    latencies.sort()
+    recall = None
+    if exact is not None:
+        recall = statistics.fmean(len(set(a) & set(b)) / max(1, len(b)) for a, b in zip(found, exact))
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))],
+        "found": found,
+        "recall": recall,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the index benchmark from the command line.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(description="Query latency of the embedding index")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of indexed vectors")
+    parser.add_argument("--queries", type=int, default=50, help="Number of timed searches")
+    parser.add_argument("--k", type=int, default=10, help="Results per search")
+    parser.add_argument("--probes", type=int, nargs="*", default=[16], help="Cells searched in approximate mode")
+    parser.add_argument("--folder", type=Path, help="Keep the index in this folder. Default is a temporary folder")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temporary:
+        folder = args.folder or Path(temporary)
+        start = time.perf_counter()
+        index = build_random_index(folder, args.rows)
+        print(f"Indexed {len(index)} vectors in {time.perf_counter() - start:.1f}s")
+        start = time.perf_counter()
+        cells = index.build_approximate()
+        print(f"Built {cells} cells for approximate search in {time.perf_counter() - start:.1f}s")
+
+        queries = _random_vectors(np.random.default_rng(1), args.queries, DIMENSIONS)
+        exact = measure_queries(index, queries, k=args.k)
+        print(f"\n{'Mode':<16} {'p50 ms':>8} {'p95 ms':>8} {'Recall':>8}")
+        print(f"{'exact':<16} {exact['p50_ms']:>8.2f} {exact['p95_ms']:>8.2f} {1.0:>8.3f}")
+        for probes in args.probes:
+            result = measure_queries(
+                index, queries, k=args.k, approximate=True, probes=probes, exact=exact["found"]
+            )
+            print(
+                f"{f'approx {probes}':<16} {result['p50_ms']:>8.2f} "
+                f"{result['p95_ms']:>8.2f} {result['recall']:>8.3f}"
+            )
+        print(f"\n{index.stats()}")
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
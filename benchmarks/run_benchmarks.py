@@ -0,0 +1,491 @@
+"""
+run_benchmarks.py
+
+This module runs the offline benchmark suite of the article pipeline. Every stage of a query
+is timed on the saved searches in the history folder and on generated corpora of 1k, 10k
+and 100k articles: fetching and parsing result pages through a mocked NewsAPI, filtering
+removed articles, CSV export, near-duplicate detection, named entity recognition and batched
+summarization. Summaries come from a tiny randomly initialised BART model with a tokenizer
+trained on generated headlines, built on the fly and run through the same pipeline, tokenizer
+and generation path as the real model. No network access or model download is needed.
+
+Every stage counts with the median of several runs. Results are written as JSON with one
+entry per corpus and stage, sorted and rounded so that runs can be diffed. Comparing against
+a stored baseline reports every stage that got slower than the tolerance allows and exits
+with status 1. Stages too fast to time reliably are not checked.
+
+Classes:
+    - FakeNewsApi: Stand-in for requests.Session serving a corpus as NewsAPI result pages.
+
+Functions:
+    - build_tiny_summarizer: Saves a tiny randomly initialised BART model and its tokenizer.
+    - time_stage: Runs a stage several times and returns the median run.
+    - run_suite: Runs all stages on all corpora.
+    - compare_results: Compares results against a baseline.
+    - main: Command line entry point.
+
+Example Usage:
+    python -m benchmarks.run_benchmarks --output benchmarks/results.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --sizes 1000 --save-baseline
+"""
+
+# Import Relevant Packages
+import argparse
+import json
+import importlib.util
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+
+# Import Benchmark Corpora
+from src.corpus import corpus_label, generate_articles, load_history_articles
+
+# Import Pipeline Stages
+from src.dedupe_articles import deduplicate_articles
+from src.model_registry import ModelRegistry
+from src.save_articles import filter_removed_articles, save_articles_csv
+from src.search_news import iter_news_pages
+from src.summarize_content import extract_named_entities_batch, summarize_contents_batch
+from src.utils.http_session import PooledSession
+from src.utils.nltk_resources import missing_resources
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+TITLES_PER_SUMMARY = 15  # Like the top 15 headlines of a query
+SUMMARY_TOKENS = 32  # Fixed, so the generation cost does not depend on the random weights
+SUMMARIZER_PACKAGES = ("torch", "transformers", "tokenizers")
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_SECONDS = 0.05  # Faster stages vary by more than the tolerance between runs
+
+
+class FakeResponse:
+    """A NewsAPI response holding its JSON body as text"""
+
+    status_code = 200
+    headers: Dict[str, str] = {}
+
+    def __init__(self, body: str) -> None:
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeNewsApi:
+    def __init__(self, articles: List[Dict[str, str]]) -> None:
+        """
+        Serve a corpus as NewsAPI result pages
+
+        Args:
+            articles (List[Dict[str, str]]): The corpus.
+        """
+        self.articles = articles
+        self._bodies: Dict[Tuple[int, int], str] = {}
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> FakeResponse:
+        """Return the requested page like the /v2/everything endpoint"""
+        params = params or {}
+        page_size = params.get("pageSize", 100)
+        page = params.get("page", 1)
+        # Bodies are built once, so repeated runs only time the client side
+        if (page, page_size) not in self._bodies:
+            start = (page - 1) * page_size
+            articles = [
+                {**article, "source": {"id": None, "name": "Example"}, "description": None}
+                for article in self.articles[start : start + page_size]
+            ]
+            self._bodies[page, page_size] = json.dumps(
+                {"status": "ok", "totalResults": len(self.articles), "articles": articles}
+            )
+        return FakeResponse(self._bodies[page, page_size])
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def build_tiny_summarizer(folder: Path) -> Path:
+    """
+    Save a tiny randomly initialised BART model and a byte-level BPE tokenizer trained on
+    generated headlines, loadable by model ID like a downloaded model.
+
+    Args:
+        folder (Path): Folder to save the model and tokenizer to.
+
+    Returns:
+        Path: The folder, usable as model ID.
+    """
+    import torch
+    from tokenizers import ByteLevelBPETokenizer  # type: ignore[import-untyped]
+    from transformers import (  # type: ignore[import-untyped]
+        BartConfig,
+        BartForConditionalGeneration,
+        BartTokenizerFast,
+    )
+
+    folder.mkdir(parents=True, exist_ok=True)
+    bpe = ByteLevelBPETokenizer()
+    bpe.train_from_iterator(
+        (article["title"] for article in generate_articles(1_000)),
+        vocab_size=1_000,
+        special_tokens=["<s>", "<pad>", "</s>", "<unk>", "<mask>"],
+        show_progress=False,
+    )
+    bpe.save_model(str(folder))
+    tokenizer = BartTokenizerFast(
+        vocab_file=str(folder / "vocab.json"),
+        merges_file=str(folder / "merges.txt"),
+        model_max_length=512,
+    )
+    tokenizer.save_pretrained(folder)
+
+    torch.manual_seed(0)  # The same weights on every run
+    config = BartConfig(
+        vocab_size=len(tokenizer),
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        max_position_embeddings=512,
+    )
+    BartForConditionalGeneration(config).eval().save_pretrained(folder)
+    return folder
+
+
+def time_stage(run: Callable[[], Any], repeat: int) -> float:
+    """
+    Run a stage several times and return the median run.
+
+    Args:
+        run (Callable[[], Any]): The stage.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Seconds of the median run.
+    """
+    seconds = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds)
+
+
+def _stages(
+    articles: List[Dict[str, str]],
+    workdir: Path,
+    ner_limit: int,
+    summarize_limit: int,
+    summarizer: Optional[Tuple[str, ModelRegistry]],
+) -> List[Tuple[str, int, Optional[Callable[[], Any]], Optional[str]]]:
+    """Return (stage, items, run, skip reason) for every stage of a corpus"""
+    session = PooledSession(session=FakeNewsApi(articles), max_retries=0)  # type: ignore[arg-type]
+    filtered = filter_removed_articles(articles)
+    titles = [article["title"] for article in filtered]
+    contents = [
+        "\n".join(titles[start : start + TITLES_PER_SUMMARY])
+        for start in range(0, len(titles), TITLES_PER_SUMMARY)
+    ][:summarize_limit]
+    missing = missing_resources()
+    summarize = None
+    if summarizer:
+        model_id, registry = summarizer
+        summarize = partial(
+            summarize_contents_batch,
+            contents,
+            model_id,
+            max_length=SUMMARY_TOKENS,
+            min_length=SUMMARY_TOKENS,
+            registry=registry,
+        )
+
+    return [
+        (
+            "fetch_parse",
+            len(articles),
+            lambda: [
+                article
+                for page in iter_news_pages(
+                    "benchmark",
+                    "benchmark-key",
+                    max_articles=len(articles),
+                    session=session,
+                )
+                for article in page
+            ],
+            None,
+        ),
+        ("filter", len(articles), lambda: filter_removed_articles(articles), None),
+        (
+            "csv_export",
+            len(filtered),
+            lambda: save_articles_csv(filtered, workdir / "export.csv"),
+            None,
+        ),
+        ("dedupe", len(filtered), lambda: deduplicate_articles(filtered), None),
+        (
+            "ner",
+            min(len(titles), ner_limit),
+            lambda: extract_named_entities_batch(titles[:ner_limit]),
+            f"missing NLTK resources: {', '.join(missing)}" if missing else None,
+        ),
+        (
+            "summarize",
+            len(contents),
+            summarize,
+            None if summarizer else f"{', '.join(SUMMARIZER_PACKAGES)} not installed",
+        ),
+    ]
+
+
+def run_suite(
+    corpora: Dict[str, List[Dict[str, str]]],
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    ner_limit: int = 2_000,
+    summarize_limit: int = 128,
+) -> Dict[str, Any]:
+    """
+    Run all stages on all corpora.
+
+    Args:
+        corpora (Dict[str, List[Dict[str, str]]]): Corpora keyed by label.
+        repeat (int): Runs per stage, the median counts. Default is 5.
+        ner_limit (int): Maximum number of titles tagged per corpus. Default is 2000.
+        summarize_limit (int): Maximum number of contents summarized per corpus. Default is 128.
+
+    Returns:
+        Dict[str, Any]: Schema version, environment and one result per corpus and stage.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        summarizer = None
+        if all(importlib.util.find_spec(package) for package in SUMMARIZER_PACKAGES):
+            model_id = str(build_tiny_summarizer(Path(workdir) / "tiny-bart"))
+            registry = ModelRegistry()
+            # Loaded and run once up front, so the stage only times summarizing
+            summarize_contents_batch(
+                ["Benchmark warm-up"],
+                model_id,
+                max_length=SUMMARY_TOKENS,
+                min_length=SUMMARY_TOKENS,
+                registry=registry,
+            )
+            summarizer = (model_id, registry)
+        for label, articles in corpora.items():
+            stages = _stages(articles, Path(workdir), ner_limit, summarize_limit, summarizer)
+            for stage, items, run, skipped in stages:
+                result: Dict[str, Any] = {"corpus": label, "stage": stage, "items": items}
+                if skipped or run is None or not items:
+                    result.update(seconds=None, items_per_second=None, skipped=skipped or "empty corpus")
+                else:
+                    seconds = time_stage(run, repeat)
+                    result.update(
+                        seconds=round(seconds, 6),
+                        items_per_second=round(items / seconds, 1) if seconds else None,
+                    )
+                results.append(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "repeat": repeat,
+        "results": sorted(results, key=lambda result: (result["corpus"], result["stage"])),
+    }
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    *,
+    tolerance: float = 0.25,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        current (Dict[str, Any]): Results of this run.
+        baseline (Dict[str, Any]): Stored baseline results.
+        tolerance (float): Allowed relative slowdown before a stage counts as regressed. Default is 0.25.
+        min_seconds (float): Stages faster than this in the baseline are too noisy to regress. Default is 50 ms.
+
+    Returns:
+        List[Dict[str, Any]]: Corpus, stage, baseline and current seconds, ratio, regressed flag,
+                              skipped flag and missing flag for every stage of this run. A stage
+                              skipped in either run could not be checked. A missing stage was
+                              not recorded in the baseline, such as NER without the NLTK resources.
+    """
+    stored = {
+        (result["corpus"], result["stage"]): result["seconds"]
+        for result in baseline.get("results", [])
+    }
+    comparison = []
+    for result in current["results"]:
+        key = (result["corpus"], result["stage"])
+        if key not in stored:
+            comparison.append(
+                {
+                    "corpus": result["corpus"],
+                    "stage": result["stage"],
+                    "baseline_seconds": None,
+                    "seconds": result["seconds"],
+                    "ratio": None,
+                    "regressed": False,
+                    "skipped": False,
+                    "missing": True,
+                }
+            )
+            continue
+        before = stored[key]
+        skipped = before is None or result["seconds"] is None
+        ratio = None if skipped or not before else result["seconds"] / before
+        comparison.append(
+            {
+                "corpus": result["corpus"],
+                "stage": result["stage"],
+                "baseline_seconds": before,
+                "seconds": result["seconds"],
+                "ratio": round(ratio, 3) if ratio is not None else None,
+                "regressed": ratio is not None and before >= min_seconds and ratio > 1 + tolerance,
+                "skipped": skipped,
+                "missing": False,
+            }
+        )
+    return comparison
+
+
+def _format_results(results: Dict[str, Any]) -> str:
+    """Format results as a plain text table"""
+    lines = [f"{'Corpus':<10} {'Stage':<16} {'Items':>8} {'Seconds':>10} {'Items/s':>12}"]
+    for result in results["results"]:
+        if result["seconds"] is None:
+            lines.append(
+                f"{result['corpus']:<10} {result['stage']:<16} {result['items']:>8} "
+                f"skipped ({result['skipped']})"
+            )
+            continue
+        lines.append(
+            f"{result['corpus']:<10} {result['stage']:<16} {result['items']:>8} "
+            f"{result['seconds']:>10.4f} {result['items_per_second'] or 0:>12.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _format_comparison(comparison: List[Dict[str, Any]]) -> str:
+    """Format a baseline comparison as a plain text table"""
+    lines = [f"{'Corpus':<10} {'Stage':<16} {'Baseline s':>10} {'Now s':>10} {'Ratio':>7}"]
+    for row in comparison:
+        if row["missing"]:
+            lines.append(f"{row['corpus']:<10} {row['stage']:<16} not checked, not in baseline")
+            continue
+        if row["skipped"]:
+            side = "baseline" if row["baseline_seconds"] is None else "this run"
+            lines.append(f"{row['corpus']:<10} {row['stage']:<16} NOT CHECKED, skipped in {side}")
+            continue
+        if row["ratio"] is None:
+            continue
+        lines.append(
+            f"{row['corpus']:<10} {row['stage']:<16} {row['baseline_seconds']:>10.4f} "
+            f"{row['seconds']:>10.4f} {row['ratio']:>7.2f}{'  REGRESSED' if row['regressed'] else ''}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite from the command line.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv.
+
+    Returns:
+        int: Exit status, 1 if a stage regressed against the baseline or could not be compared.
+    """
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the article pipeline")
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES, help="Sizes of generated corpora")
+    parser.add_argument("--history-folder", type=Path, default=Path("history"), help="Folder of saved searches")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per stage, the median counts")
+    parser.add_argument("--ner-limit", type=int, default=2_000, help="Maximum titles tagged per corpus")
+    parser.add_argument(
+        "--summarize-limit", type=int, default=128, help="Maximum contents summarized per corpus"
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=DEFAULT_MIN_SECONDS,
+        help="Stages faster than this in the baseline are not checked",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help=f"Store results as {DEFAULT_BASELINE.name}")
+    args = parser.parse_args(argv)
+
+    corpora = {}
+    history = load_history_articles(args.history_folder)
+    if history:
+        corpora["history"] = history
+    for size in args.sizes:
+        corpora[corpus_label(size)] = generate_articles(size)
+
+    results = run_suite(
+        corpora, repeat=args.repeat, ner_limit=args.ner_limit, summarize_limit=args.summarize_limit
+    )
+    print(_format_results(results))
+
+    payload = json.dumps(results, indent=2, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+        print(f"\nResults written to Path('{args.output}')")
+    if args.save_baseline:
+        # A baseline only keeps timings, later runs list skipped stages as not in the baseline
+        measured = [result for result in results["results"] if result["seconds"] is not None]
+        baseline_payload = json.dumps({**results, "results": measured}, indent=2, sort_keys=True) + "\n"
+        DEFAULT_BASELINE.write_text(baseline_payload, encoding="utf-8")
+        print(f"\nBaseline written to Path('{DEFAULT_BASELINE}')")
+        skipped = sorted({result["stage"] for result in results["results"] if result["seconds"] is None})
+        if skipped:
+            print(f"WARNING: {', '.join(skipped)} skipped and left out, later runs can not check these stages")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparison = compare_results(
+            results, baseline, tolerance=args.tolerance, min_seconds=args.min_seconds
+        )
+        print(f"\n{_format_comparison(comparison)}")
+        if any(row["regressed"] for row in comparison):
+            print(f"\nStages slower than the baseline by more than {args.tolerance:.0%} ❌")
+            return 1
+        if any(row["skipped"] for row in comparison):
+            print("\nStages skipped in the baseline or this run were not checked ❌")
+            print("Provision the NLTK resources with 'python main.py --prefetch' and save the baseline again")
+            return 1
+        missing = sorted({row["stage"] for row in comparison if row["missing"]})
+        if missing:
+            print(f"\nWARNING: {', '.join(missing)} not in the baseline, save it where these stages run")
+        print("\nNo stage regressed against the baseline ✅")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
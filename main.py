@@ -1,24 +1,60 @@
 # Import Relevant Packages
-import pandas as pd  # type: ignore[import-untyped]
+# tabulate, LangChain and NLTK are imported by the stages that use them,
+# so startup and commands like !help do not pay for loading them
+import csv
 import time
-from datetime import datetime
 from pathlib import Path
-import yaml, re  # type: ignore[import-untyped]
-from tabulate import tabulate  # type: ignore[import-untyped]
-from collections import Counter
+import argparse
+import yaml  # type: ignore[import-untyped]
 
 # Import News Search Modules
-from src.search_news import search_news_articles
+from src.search_news import iter_news_pages, cached_iter_news_pages, news_api_url
+
+# Import Article Saving Modules
+from src.save_articles import ARTICLE_FIELDS, filter_removed_articles, history_csv_path
+from src.history_store import HistoryStore, import_history_csvs
+from src.embedding_index import EmbeddingIndex
+from src.dedupe_articles import deduplicate_articles
+from src.cluster_articles import cluster_articles, embed_titles
 
 # Import Summarization Modules
 from src.summarize_content import (
+    load_summarizer,
     summarize_content_pipeline,
-    extract_named_entities_nltk,
+    stream_summary,
+    summarize_map_reduce,
+    summarize_contents_batch,
+    extract_named_entities_batch,
+    warm_up_nltk,
 )
 
+# Import Watch Mode
+from src.watch import format_watch_update, make_topic_watch, parse_interval, run_watches
+
+# Import Pooled HTTP Session
+from src.utils.http_session import configure_session
+
+# Import Response, Entity and Summary Caches
+from src.utils.response_cache import ResponseCache
+from src.utils.entity_cache import EntityCache
+from src.utils.summary_cache import SummaryCache
+
+# Import Model Registry
+from src.inference_backend import missing_backend_packages
+from src.model_registry import ModelRegistry, configure_model_registry, get_model_registry
+
 # Import Console Animation
 from src.utils.spinner import Spinner
 
+# Import NLTK Resource Provisioning
+from src.utils.nltk_resources import ensure_resources, missing_resources, set_offline
+
+# Import Background Warm-Up
+from src.utils.warmup import WarmUp
+
+# Import Stage Timing
+from src.utils.stage_timer import StageTimer
+
 # Import ENV Utils
 from src.utils.get_keys import get_env
 
@@ -31,14 +67,277 @@ from src.cli_help import help_command_output
 # Import Enum for Descriptive Constants
 from enum import Enum
 
+# Type Hints
+from typing import Any, Dict, List, Optional
+
 
 # Set Descriptive Constants
 class ApplicationMode(Enum):
     RUN = True
 
 
+# Parse Command Line Flags
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line flags of the CLI application.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed flags.
+    """
+    parser = argparse.ArgumentParser(description="News Topic Aggregator")
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Do not preload the summarization model and NLTK resources at startup",
+    )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Download missing NLTK resources and exit",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never download NLTK resources or models, use only what is stored locally",
+    )
+    parser.add_argument(
+        "--topics-file",
+        type=Path,
+        help="Run without prompting: process every topic in this file, one per line",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="JSONL file for batch results. Defaults to a timestamped file in the output folder",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Report the import cost of each package loaded at startup and exit",
+    )
+    parser.add_argument(
+        "--import-history",
+        action="store_true",
+        help="Import CSV files of earlier searches into the history store and exit",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Poll every topic of --topics-file for new articles until interrupted",
+    )
+    parser.add_argument(
+        "--interval",
+        default="15m",
+        help="Time between two polls of --watch, in seconds or with a unit like 5m or 1h",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        help="Stop --watch after this many polls of every topic, e.g. 1 for a cron job",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve a synthetic or recorded corpus from a local NewsAPI stand-in and search it instead of newsapi.org",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Run every query under cProfile and dump the statistics to the output folder. Only the "
+            "main thread is profiled, not the threads fetching pages or streaming summaries"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+# Build the Response Cache configured in config.yaml
+def build_response_cache(config: Dict[str, Any]) -> Optional[ResponseCache]:
+    """
+    Build the NewsAPI response cache from the config.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        Optional[ResponseCache]: The cache, or None if it is disabled.
+    """
+    cache_config = config.get("cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+    return ResponseCache(
+        Path(config["output"]["folder"]) / ".cache" / "news_api.sqlite",
+        ttl=cache_config.get("ttl_seconds", 600),
+        stale_ttl=cache_config.get("stale_seconds", 3600),
+        max_entries=cache_config.get("max_entries", 500),
+    )
+
+
+# Start the local NewsAPI Stand-in configured in config.yaml
+def start_replay_server(config: Dict[str, Any]) -> Any:
+    """
+    Serve the replay corpus locally and point the config at it.
+
+    The news_api base URL is replaced by the local server, and results are saved to the
+    replay output folder, so replayed searches stay apart from real ones.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml, changed in place.
+
+    Returns:
+        MockNewsApiServer: The running server.
+    """
+    from src.mock_news_api import MockNewsApiServer, load_corpus
+
+    replay_config = config.get("replay", {})
+    server = MockNewsApiServer(
+        load_corpus(
+            replay_config.get("corpus", "synthetic"),
+            size=replay_config.get("size", 10_000),
+            seed=replay_config.get("seed", 0),
+        ),
+        port=replay_config.get("port", 8765),
+        latency=replay_config.get("latency_ms", 0) / 1000,
+        jitter=replay_config.get("jitter_ms", 0) / 1000,
+        error_rate=replay_config.get("error_rate", 0.0),
+        max_requests=replay_config.get("max_requests"),
+        seed=replay_config.get("seed", 0),
+    ).start()
+    config["news_api"]["base_url"] = server.url.rsplit("/", 1)[0]
+    config["news_api"]["endpoint"] = "everything"
+    config["output"]["folder"] = replay_config.get("output_folder", "history/replay")
+    print(f"\nReplaying {len(server.articles)} articles from {server.url}")
+    return server
+
+
+# Open the History Store configured in config.yaml
+def build_history_store(config: Dict[str, Any]) -> HistoryStore:
+    """
+    Open the SQLite history store inside the output folder.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        HistoryStore: The store.
+    """
+    output = config["output"]
+    return HistoryStore(Path(output["folder"]) / output.get("store", "history.sqlite"))
+
+
+# Open the Embedding Index configured in config.yaml
+def build_embedding_index(config: Dict[str, Any]) -> Optional[EmbeddingIndex]:
+    """
+    Open the embedding index of saved articles inside the output folder.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        Optional[EmbeddingIndex]: The index, or None if it is disabled or was built with another model.
+    """
+    similar_config = config.get("similar", {})
+    if not similar_config.get("enabled", False):
+        return None
+    model_id = similar_config.get("model", "sentence-transformers/all-MiniLM-L6-v2")
+    try:
+        return EmbeddingIndex(
+            Path(config["output"]["folder"]) / similar_config.get("folder", "index"),
+            embed=lambda titles: embed_titles(
+                titles, model_id, batch_size=similar_config.get("batch_size", 64)
+            ),
+            model_id=model_id,
+        )
+    except ValueError as e:
+        print(f"\nWARNING: {e}")
+        print("Set similar.model back or remove the index folder to rebuild it")
+        return None
+
+
+# Build the Named Entity Cache configured in config.yaml
+def build_entity_cache(config: Dict[str, Any]) -> Optional[EntityCache]:
+    """
+    Build the per-title named entity cache from the config.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        Optional[EntityCache]: The cache, or None if caching is disabled.
+    """
+    cache_config = config.get("cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+    entity_config = cache_config.get("entities", {})
+    return EntityCache(
+        Path(config["output"]["folder"]) / ".cache" / "entities.sqlite",
+        memory_entries=entity_config.get("memory_entries", 4096),
+        max_entries=entity_config.get("max_entries", 100_000),
+    )
+
+
+# Build the Summary Cache configured in config.yaml
+def build_summary_cache(config: Dict[str, Any]) -> Optional[SummaryCache]:
+    """
+    Build the summary cache from the config.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        Optional[SummaryCache]: The cache, or None if caching is disabled.
+    """
+    cache_config = config.get("cache", {})
+    if not cache_config.get("enabled", False):
+        return None
+    summary_config = cache_config.get("summaries", {})
+    return SummaryCache(
+        Path(config["output"]["folder"]) / ".cache" / "summaries.sqlite",
+        max_age=summary_config.get("max_age_seconds", 7 * 24 * 3600),
+        max_bytes=summary_config.get("max_mb", 50) * 1024 * 1024,
+    )
+
+
+# Set up the Model Registry and Inference Backend configured in config.yaml
+def configure_summarizer(config: Dict[str, Any]) -> ModelRegistry:
+    """
+    Replace the process-wide model registry with one using the configured limits, inference
+    backend and thread counts. ONNX exports are kept in the output folder. A backend whose
+    packages are not installed is reported and replaced by torch.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+
+    Returns:
+        ModelRegistry: The new shared registry.
+    """
+    hf_config = config["hugging_face"]
+    threads = hf_config.get("threads", {})
+    backend = hf_config.get("backend", "torch")
+    missing = missing_backend_packages(backend)
+    if missing:
+        print(f"The {backend} backend needs {' and '.join(missing)}, summarizing with torch instead")
+        print(f"Install them with 'pip install {' '.join(missing)}'")
+        backend = "torch"
+    return configure_model_registry(
+        **hf_config.get("registry", {}),
+        backend=backend,
+        intra_op_threads=threads.get("intra_op"),
+        inter_op_threads=threads.get("inter_op"),
+        onnx_dir=Path(config["output"]["folder"]) / ".cache" / "onnx",
+    )
+
+
 # Main Script for CLI Application
-def main():
+def main(args: Optional[argparse.Namespace] = None):
+
+    args = args or parse_args([])
+
+    if args.offline:
+        set_offline()
 
     # Initialize settings and configurations
     NEWS_API_KEY = get_env("NEWS_API_KEY")  # Extract API Key for NewsAPI
@@ -46,16 +345,248 @@ def main():
     with open("config.yaml", "r") as f:
         config = yaml.safe_load(f)
 
+    # Search a local NewsAPI stand-in, which accepts any key
+    replay_server = start_replay_server(config) if args.replay else None
+    if replay_server is not None:
+        NEWS_API_KEY = NEWS_API_KEY or "replay"
+
     language = config["default_language"]  # Default to English
 
     model_id = config["hugging_face"]["model"]  # Default is "facebook/bart-large-cnn"
 
+    # Reuse connections to NewsAPI and retry throttled requests
+    session = configure_session(**config["news_api"].get("http", {}))
+
+    # Answer repeated queries from disk instead of spending NewsAPI quota
+    cache = build_response_cache(config)
+
+    # Keep all searched Articles in one indexed database, CSV export is optional
+    store = build_history_store(config)
+    save_csv = config["output"].get("csv", False)
+    if not store.stats()["runs"] and any(Path(config["output"]["folder"]).glob("*.csv")):
+        print("\nFound CSV files from earlier searches")
+        print("Run 'python main.py --import-history' to add them to the history store")
+
+    # Find saved Articles by Meaning, new Articles are embedded as they are saved
+    similar_config = config.get("similar", {})
+    embedding_index = build_embedding_index(config)
+
+    # Skip tagging headlines that were seen in earlier searches
+    entity_cache = build_entity_cache(config)
+
+    # Skip generating a summary for headline sets that were summarized before
+    summary_cache = build_summary_cache(config)
+    caches = {
+        "responses": cache,
+        "entities": entity_cache,
+        "summaries": summary_cache,
+    }
+
+    # Summarize one Article per wire story instead of many copies of its Headline
+    dedupe_config = config.get("dedupe", {})
+
+    # Summarize all Headlines of a Query in Chunks instead of only the Top 15
+    map_reduce_config = config.get("map_reduce", {})
+
+    # Group the Articles of a Query into Sub-Topics instead of one flat Top 15 List
+    clustering_config = config.get("clustering", {})
+    clustering = clustering_config.get("enabled", False)
+    encoder_id = clustering_config.get("model", "sentence-transformers/all-MiniLM-L6-v2")
+
+    # Keep loaded models in memory across queries within the configured budget
+    configure_summarizer(config)
+
+    # Check once for local NLTK resources instead of downloading them on every start
+    missing = missing_resources()
+    if missing:
+        print(f"\nWARNING: Missing NLTK resources: {', '.join(missing)}")
+        print("Run 'python main.py --prefetch' to download them")
+
+    # Preload model, tokenizer and NLTK resources while the user types the first topic
+    warmup = WarmUp()
+    if not args.no_warmup:
+        warmup.add(
+            "model",
+            lambda: load_summarizer(
+                model_id,
+                max_length=config["hugging_face"]["max_length"],
+                min_length=config["hugging_face"]["min_length"],
+                do_sample=config["hugging_face"]["do_sample"],
+            ),
+        )
+        warmup.add("nltk", warm_up_nltk)
+        if clustering:
+            warmup.add("encoder", lambda: embed_titles(["Warm Up Headline"], encoder_id))
+        elif embedding_index is not None:
+            warmup.add("encoder", lambda: embedding_index.embed(["Warm Up Headline"]))
+        warmup.start()
+    warmup_reported = args.no_warmup
+
+    # Time every stage of a query, optionally profiling the whole query
+    metrics_config = config.get("metrics", {})
+    timer = StageTimer(
+        metrics_path=(
+            Path(config["output"]["folder"]) / metrics_config.get("file", "metrics.jsonl")
+            if metrics_config.get("enabled", False)
+            else None
+        ),
+        profile_dir=(
+            Path(config["output"]["folder"]) / "profiles" if args.profile else None
+        ),
+        show_table=metrics_config.get("show_table", True),
+    )
+
+    def select_top_articles(
+        articles: List[Dict[str, str]], limit: int = 15
+    ) -> List[Dict[str, str]]:
+        """Return the most relevant articles, skipping near-duplicate headlines"""
+        if not dedupe_config.get("enabled", False):
+            return articles[:limit]
+        with timer.stage("dedupe"):
+            deduped = deduplicate_articles(
+                articles,
+                threshold=dedupe_config.get("threshold", 0.8),
+                num_perm=dedupe_config.get("num_perm", 64),
+            )
+        if deduped.removed:
+            print(f"Skipped {deduped.removed} near-duplicate headlines")
+        return deduped.kept[:limit]
+
+    def summarize_clusters(articles: List[Dict[str, str]]) -> bool:
+        """Summarize the largest sub-topics of the articles, False if they could not be grouped"""
+        with timer.stage("warmup_encoder"), Spinner("Finishing warm-up..."):
+            warmup.wait("encoder")
+        try:
+            selected = select_top_articles(
+                articles, limit=clustering_config.get("max_articles", 1000)
+            )
+            with timer.stage("cluster"), Spinner("Grouping Articles into Sub-Topics..."):
+                clusters = cluster_articles(
+                    selected,
+                    threshold=clustering_config.get("threshold", 0.6),
+                    embed=lambda titles: embed_titles(
+                        titles,
+                        encoder_id,
+                        batch_size=clustering_config.get("batch_size", 64),
+                    ),
+                )
+        except Exception as e:
+            print(f"\nCould not group articles into sub-topics: {e}")
+            return False
+
+        shown = clusters[: clustering_config.get("max_clusters", 5)]
+        with timer.stage("summarize"), Spinner("Summarizing Sub-Topics..."):
+            try:
+                summaries = summarize_contents_batch(
+                    [
+                        "\n".join(article["title"] for article in cluster.articles[:15])
+                        for cluster in shown
+                    ],
+                    model_id,
+                    batch_size=config["hugging_face"].get("batch_size", 8),
+                    max_length=config["hugging_face"]["max_length"],
+                    min_length=config["hugging_face"]["min_length"],
+                    do_sample=config["hugging_face"]["do_sample"],
+                    cache=summary_cache,
+                )
+            except Exception as e:
+                summaries = []
+                print(f"\nCould not summarize the sub-topics: {e}")
+                print("If the model ID seems to be faulty, use !sethf for valid model IDs")
+
+        print(f"\nGrouped {len(selected)} articles into {len(clusters)} sub-topics")
+        for number, cluster in enumerate(shown, start=1):
+            print(f"\n*--Sub-Topic {number}: {len(cluster.articles)} Articles--*")
+            for article in cluster.articles[: clustering_config.get("titles_per_cluster", 5)]:
+                print(f"  - {article['title']}")
+            if summaries:
+                print(summaries[number - 1])
+        return True
+
+    def summarize_top_articles(
+        top_articles: List[Dict[str, str]],
+        articles: Optional[List[Dict[str, str]]] = None,
+    ) -> None:
+        """Summarize the top headlines, or all of them in map-reduce mode, and list named entities"""
+        # * Requirement 3: Summarize Headlines of Top 15  Articles
+        with timer.stage("warmup_model"), Spinner("Finishing warm-up..."):
+            warmup.wait("model")
+        if articles and clustering and summarize_clusters(articles):
+            list_named_entities(top_articles)
+            return
+        content = "\n".join([article["title"] for article in top_articles])
+        generation = {
+            "model_id": model_id,
+            "max_length": config["hugging_face"]["max_length"],
+            "min_length": config["hugging_face"]["min_length"],
+            "do_sample": config["hugging_face"]["do_sample"],
+            "cache": summary_cache,
+        }
+        try:
+            if articles and map_reduce_config.get("enabled", False):
+                # Digest all Headlines in Chunks that fit the Model instead of only the Top 15
+                digest = select_top_articles(
+                    articles, limit=map_reduce_config.get("max_articles", 500)
+                )
+                with timer.stage("map_reduce"), Spinner(
+                    f"Summarizing {len(digest)} Headlines..."
+                ):
+                    result = summarize_map_reduce(
+                        [article["title"] for article in digest],
+                        max_input_tokens=map_reduce_config.get("max_input_tokens") or None,
+                        batch_size=config["hugging_face"].get("batch_size", 8),
+                        max_rounds=map_reduce_config.get("max_rounds", 3),
+                        **generation,
+                    )
+                print(f"\n*--Summary of {len(digest)} Articles Headlines--*")
+                print(result.summary)
+                print(f"({result.chunks} chunks reduced in {result.rounds} passes)")
+            elif config["hugging_face"].get("stream", False):
+                # Print the Summary while it is generated instead of behind a Spinner
+                pieces = stream_summary(content, **generation)
+                with timer.stage("first_token"), Spinner("Summarizing Headlines..."):
+                    first = next(pieces, "")
+                print("\n*--Summary of Top 15 Articles Headlines--*")
+                print(first, end="", flush=True)
+                with timer.stage("summarize"):
+                    for piece in pieces:
+                        print(piece, end="", flush=True)
+                print()
+            else:
+                with timer.stage("summarize"), Spinner("Summarizing Headlines..."):
+                    summary = summarize_content_pipeline(content, **generation)
+                print("\n*--Summary of Top 15 Articles Headlines--*")
+                print(summary)
+        except Exception as e:
+            print(f"\nCould not summarize the headlines: {e}")
+            print("If the model ID seems to be faulty, use !sethf for valid model IDs")
+            return
+        list_named_entities(top_articles)
+
+    def list_named_entities(top_articles: List[Dict[str, str]]) -> None:
+        """List the named entities of the top headlines by frequency"""
+        # * Requirement 4: List Named Entities in Descending Order
+        with timer.stage("warmup_nltk"), Spinner("Finishing warm-up..."):
+            warmup.wait("nltk")
+        with timer.stage("entities"), Spinner("Listing Named Entities..."):
+            _, named_entities_counter = extract_named_entities_batch(
+                [article["title"] for article in top_articles], cache=entity_cache
+            )
+        print("\n*--Named Entities in Top 15 Articles Headlines--*")
+        for entity, freq in named_entities_counter.most_common():
+            print(f"{entity}: {freq}")
+
     # Usage Hints
     print(
         "\nEnter a topic to search. Or..\n"
         "Type '!help' to get usage instructions\n"
         "Type '!setlang' to change query language\n"
         "Type '!sethf' to change HuggingFace parameters\n"
+        "Type '!models' to show loaded models and registry statistics\n"
+        "Type '!cache' to show cache statistics, '!cache clear' to empty the caches\n"
+        "Type '!history <query>' to search saved articles without calling NewsAPI\n"
+        "Type '!similar <text>' to find saved articles similar in meaning\n"
+        "Type '!watch <topic> <interval>' to poll a topic for new articles, e.g. !watch spacex 5m\n"
         "Type '!exit' or '!quit' to close application"
     )
 
@@ -102,8 +633,158 @@ def main():
                     language = "en"
                     continue
 
+        # - Show Model Registry Statistics
+        if topic.strip().lower() == "!models":
+            for key, value in get_model_registry().stats().items():
+                print(f"{key}: {value}")
+            continue
+
+        # - Show or Clear Caches
+        if topic.strip().lower().split()[:1] == ["!cache"]:
+            for name, named_cache in caches.items():
+                if named_cache is None:
+                    print(f"The {name} cache is disabled in config.yaml")
+                elif topic.strip().lower().split()[1:] == ["clear"]:
+                    print(f"Removed {named_cache.clear()} cached {name}")
+                else:
+                    print(f"\n{name.capitalize()} cache")
+                    for key, value in named_cache.stats().items():
+                        print(f"{key}: {value}")
+            continue
+
+        # - Search saved Articles without spending NewsAPI quota
+        if topic.strip().lower().split()[:1] == ["!history"]:
+            query = topic.strip()[len("!history") :].strip()
+            if not query:
+                print("\nType a query after !history, e.g. !history \"elon musk\" starship")
+                continue
+            with timer.query(f"history {query}"):
+                with timer.stage("history_search"):
+                    start = time.perf_counter()
+                    matches = store.search(
+                        query,
+                        language=language,
+                        limit=config["news_api"].get("max_articles", 100),
+                    )
+                    search_ms = (time.perf_counter() - start) * 1000
+                if not matches:
+                    print(f"\nNo saved articles match >>{query}<<")
+                    continue
+                print(f"\nFound {len(matches)} saved articles in {search_ms:.1f} ms")
+
+                top_articles = select_top_articles(matches)
+                with timer.stage("tabulate"):
+                    from tabulate import tabulate  # type: ignore[import-untyped]
+
+                    print(
+                        "\n#######################Top 15 Saved Articles#######################"
+                    )
+                    print(
+                        tabulate(
+                            top_articles,
+                            headers="keys",
+                            tablefmt="grid",
+                            showindex=range(1, len(top_articles) + 1),
+                        )
+                    )
+                summarize_top_articles(top_articles, matches)
+            continue
+
+        # - Find saved Articles similar in Meaning to a Text
+        if topic.strip().lower().split()[:1] == ["!similar"]:
+            text = topic.strip()[len("!similar") :].strip()
+            if embedding_index is None:
+                if similar_config.get("enabled", False):
+                    print("\nThe embedding index is unavailable, see the warning above")
+                else:
+                    print("\nSet similar.enabled in config.yaml to search saved articles by meaning")
+                continue
+            if not text:
+                print("\nType a text after !similar, e.g. !similar rocket launch in texas")
+                continue
+            with timer.query(f"similar {text}"):
+                try:
+                    warmup.wait("encoder")
+                    # Articles saved while the index was off are embedded, each only once
+                    with timer.stage("index"), Spinner("Indexing saved articles..."):
+                        added = embedding_index.backfill(store)
+                    if added:
+                        print(f"\nIndexed {added} saved articles")
+                    with timer.stage("embed_query"), Spinner("Embedding text..."):
+                        query = embedding_index.embed([text])[0]
+                    with timer.stage("similar_search"):
+                        start = time.perf_counter()
+                        hits = embedding_index.search(
+                            query,
+                            k=similar_config.get("top_k", 10),
+                            approximate=similar_config.get("approximate", False),
+                        )
+                        search_ms = (time.perf_counter() - start) * 1000
+                except Exception as e:
+                    print(f"\nCould not search the embedding index: {e}")
+                    continue
+                print(f"\nSearched {len(embedding_index)} saved articles in {search_ms:.1f} ms")
+                if not hits:
+                    continue
+                from tabulate import tabulate  # type: ignore[import-untyped]
+
+                print(
+                    tabulate(
+                        [
+                            {
+                                "score": f"{hit.score:.2f}",
+                                "title": hit.title,
+                                "url": hit.url,
+                                "publishedAt": hit.publishedAt,
+                            }
+                            for hit in hits
+                        ],
+                        headers="keys",
+                        tablefmt="grid",
+                        showindex=range(1, len(hits) + 1),
+                    )
+                )
+            continue
+
+        # - Watch a Topic, handling only Articles published since the last Poll
+        if topic.strip().lower().split()[:1] == ["!watch"]:
+            words = topic.strip().split()[1:]
+            try:
+                interval = parse_interval(words[-1]) if len(words) > 1 else None
+            except ValueError:
+                interval = None
+            if interval is None:
+                print("\nType a topic and an interval after !watch, e.g. !watch spacex 5m")
+                continue
+            watch_topic = " ".join(words[:-1])
+            print(
+                f"\nWatching >>{watch_topic}<< every {words[-1]}, "
+                "press Ctrl+C to return to the prompt"
+            )
+            topic_watch = make_topic_watch(
+                config,
+                store,
+                watch_topic,
+                language=language,
+                api_key=NEWS_API_KEY,
+                model_id=model_id,
+                entity_cache=entity_cache,
+                summary_cache=summary_cache,
+                embedding_index=embedding_index,
+            )
+            try:
+                run_watches(
+                    [topic_watch],
+                    interval,
+                    on_update=lambda update: print(f"\n{format_watch_update(update)}"),
+                )
+            except KeyboardInterrupt:
+                print(f"\nStopped watching >>{watch_topic}<<")
+            continue
+
         # - Change Hugging Face Parameters
         if topic.strip().lower() == "!sethf":
+            previous_model_id = model_id
             model_id = (
                 input(
                     "\nChange the Model you use to summarize content\n"
@@ -126,107 +807,314 @@ def main():
                 case "default":
                     model_id = config["hugging_face"]["model"]
                     print(f"Model is set to default >>{model_id}<<")
-                    continue
                 case "":
                     print("That is not a valid model ID. Switching to Default...")
                     model_id = config["hugging_face"]["model"]
                     print(f"Model is set to default >>{model_id}<<")
-                    continue
                 case _:
-                    continue
+                    pass
+            # Free the memory of the replaced model
+            if model_id != previous_model_id:
+                get_model_registry().release(previous_model_id)
+            continue
 
-        # Search Articles from News API
-        print(f"\nAlright! Searching for articles on >>{topic}<<")
+        with timer.query(topic):
+            # Search Articles from News API
+            print(f"\nAlright! Searching for articles on >>{topic}<<")
 
-        with Spinner("Fetching Articles..."):
-            try:
-                articles = search_news_articles(
-                    topic,
-                    NEWS_API_KEY,
-                    language=language,
+            # Pages are requested concurrently and handled as soon as each one arrives
+            search_kwargs = {
+                "url": news_api_url(config["news_api"]),
+                "language": language,
+                "page_size": config["news_api"].get("page_size", 100),
+                "max_articles": config["news_api"].get("max_articles", 100),
+                "max_workers": config["news_api"].get("max_workers", 4),
+            }
+            if cache is not None:
+                pages = cached_iter_news_pages(
+                    topic, NEWS_API_KEY, cache=cache, **search_kwargs
                 )
-            except Exception as e:
-                print(f"\n{e}")
-                print("\nPlease Try Again")
+            else:
+                pages = iter_news_pages(topic, NEWS_API_KEY, **search_kwargs)
+
+            with timer.stage("fetch"), Spinner("Fetching Articles..."):
+                try:
+                    articles = next(pages, [])
+                except Exception as e:
+                    print(f"\n{e}")
+                    print("\nPlease Try Again")
+                    continue
+            if cache is not None and cache.last_outcome != "miss":
+                print(f"\nServed from cache ({cache.last_outcome})")
+            elif session.last:
+                print(
+                    f"\nFirst page fetched in {session.last.latency:.2f}s "
+                    f"with {session.last.retries} retries"
+                )
+
+            # If no articles found, let us know some details and skip iteration
+            if not articles:
+                print(f"No articles found.\nTopic >>{topic}<<\nLanguage >>{language}<<.")
                 continue
 
-        # If no articles found, let us know some details and skip iteration
-        if not articles:
-            print(f"No articles found.\nTopic >>{topic}<<\nLanguage >>{language}<<.")
-            continue
+            # Remove deleted articles
+            with timer.stage("filter"):
+                filtered_articles = filter_removed_articles(articles)
+
+            # * Requirement 1: Save Articles right after search
+            # Store the first Page right away, later Pages are added as they arrive
+            with timer.stage("save"):
+                run_id = store.start_run(topic, language)
+                store.add_articles(run_id, filtered_articles, language=language)
+                save_file = csv_file = writer = None
+                if save_csv:
+                    save_file = history_csv_path(
+                        Path(config["output"]["folder"]), topic, language
+                    )
+                    csv_file = open(save_file, "w", newline="", encoding="utf-8")
+                    writer = csv.DictWriter(csv_file, fieldnames=ARTICLE_FIELDS)
+                    writer.writeheader()
+                    writer.writerows(filtered_articles)
+
+            # Keep one Article per cluster of near-identical Headlines, all of them stay saved
+            top_articles = select_top_articles(filtered_articles)
 
-        # Remove deleted articles
-        with Spinner("Filtering removed articles..."):
-            time.sleep(3)
-            filtered_articles = [
-                article for article in articles if not "remove" in article["url"]
-            ]
-
-        # * Requirement 1: Save Articles as a CSV file right after search
-        with Spinner("Saving articles locally..."):
-            df_articles = pd.DataFrame(filtered_articles)
-            # Define the destination path
-            destination_path = Path(config["output"]["folder"])
-
-            # Create a folder for the output if it doesn't exist
-            if not destination_path.exists():
-                print(f"Path:('{destination_path}') not found")
-                print(f"Making '{destination_path}'")
-                destination_path.mkdir(parents=True, exist_ok=True)
-            # Set Filename and Save Path; Save File from df to CSV
-            topic_alnum = re.sub(
-                r"[^a-zA-Z0-9\s]", "", topic
-            )  # Remove any speicals chars to avoid save issues
-            topic_alnum = topic_alnum.replace(" ", "_")
-            csv_filename = f"{str(topic_alnum).lower()}_articles_{language}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            save_file = destination_path / csv_filename
-            df_articles.to_csv(save_file, index=False)
-        print(f"\nAll articles saved to Path('{save_file}') ✅")
-
-        # * Requirement 2: Print Top 15 Articles in Terminal by Sorting Relevance
-        # Reset Index to begin at 1
-        df_articles.index = df_articles.index + 1
-        # Set pandas display options to show all columns and full width
-        pd.set_option("display.max_columns", None)
-        pd.set_option("display.width", None)
-
-        # Print the first 15 rows of the filtered DataFrame using tabulate for better formatting
-        print("\n##########################Top 15 Articles##########################")
-        print(
-            tabulate(
-                df_articles.head(15), headers="keys", tablefmt="grid", showindex=True
+            # * Requirement 2: Print Top 15 Articles in Terminal by Sorting Relevance
+            # Print the first 15 articles using tabulate for better formatting, index beginning at 1
+            # With clustering, sub-topics are listed once all pages have arrived instead
+            if not clustering:
+                with timer.stage("tabulate"):
+                    from tabulate import tabulate  # type: ignore[import-untyped]
+
+                    print(
+                        "\n##########################Top 15 Articles##########################"
+                    )
+                    print(
+                        tabulate(
+                            top_articles,
+                            headers="keys",
+                            tablefmt="grid",
+                            showindex=range(1, len(top_articles) + 1),
+                        )
+                    )
+
+            # Filter and save the remaining Pages while they are still arriving
+            with timer.stage("remaining_pages"), Spinner("Fetching remaining pages..."):
+                try:
+                    for page in pages:
+                        page = filter_removed_articles(page)
+                        store.add_articles(run_id, page, language=language)
+                        if writer is not None:
+                            writer.writerows(page)
+                        filtered_articles.extend(page)
+                except Exception as e:
+                    print(f"\n{e}")
+                    print("Continuing with the articles fetched so far")
+                finally:
+                    if csv_file is not None:
+                        csv_file.close()
+            print(
+                f"\nAll {len(filtered_articles)} articles saved to Path('{store.path}') ✅"
             )
-        )
 
-        # * Requirement 3: Summarize Headlines of Top 15  Articles
-        with Spinner("Summarizing Headlines..."):
-            try:
-                summary = summarize_content_pipeline(
-                    "\n".join([article["title"] for article in filtered_articles[:15]]),
-                    model_id=model_id,
+            # Embed the new Articles for !similar, Articles indexed before are skipped
+            if embedding_index is not None:
+                with timer.stage("index"), Spinner("Indexing articles..."):
+                    try:
+                        embedding_index.add(
+                            {**article, "language": language} for article in filtered_articles
+                        )
+                    except Exception as e:
+                        print(f"\nCould not update the embedding index: {e}")
+                        embedding_index = None
+            if save_file is not None:
+                print(f"Exported as CSV to Path('{save_file}')")
+
+            # * Requirement 3 and 4: Summarize Headlines and List Named Entities
+            summarize_top_articles(top_articles, filtered_articles)
+
+            # Report how much loading time the warm-up hid behind the first prompt
+            if not warmup_reported:
+                report = warmup.report()
+                print(
+                    f"\nWarm-up loaded resources in {report['total_seconds']:.1f}s, "
+                    f"{report['hidden_seconds']:.1f}s of it hidden behind the prompt"
                 )
-            except Exception as e:
-                print("\nThe model ID seems to be faulty")
-                print("Use !sethf for valid model IDs")
-                continue
+                for name, error in warmup.errors.items():
+                    print(f"Warm-up of the {name} failed: {error}")
+                warmup_reported = True
 
-        print("\n*--Summary of Top 15 Articles Headlines--*")
-        print(summary)
+    if replay_server is not None:
+        replay_server.stop()
+        print(f"Replay server: {replay_server.stats()}")
 
-        # * Requirement 4: List Named Entities in Descending Order
-        with Spinner("Listing Named Entities..."):
-            time.sleep(3)
-            all_named_entities = []  # Empty list to store entities
-            for title in df_articles.head(15)["title"]:
-                named_entities = extract_named_entities_nltk(title)
-                all_named_entities.extend(named_entities)
-            named_entities_counter = Counter(all_named_entities)
-        print("\n*--Named Entities in Top 15 Articles Headlines--*")
-        for entity, freq in named_entities_counter.most_common():
-            print(f"{entity}: {freq}")
+
+# Download missing NLTK Resources
+def prefetch(args: argparse.Namespace) -> None:
+    """
+    Download the NLTK resources that are missing locally.
+
+    Args:
+        args (argparse.Namespace): The parsed command line flags.
+    """
+    if args.offline:
+        set_offline()
+    missing = ensure_resources(download=True)
+    if missing:
+        print(f"Could not provision NLTK resources: {', '.join(missing)}")
+    else:
+        print("All NLTK resources are available locally ✅")
+
+
+# Import CSV Files of earlier Searches into the History Store
+def import_history(args: argparse.Namespace) -> None:
+    """
+    Import the CSV files in the output folder into the history store, once per file.
+
+    Args:
+        args (argparse.Namespace): The parsed command line flags.
+    """
+    with open("config.yaml", "r") as f:
+        config = yaml.safe_load(f)
+
+    store = build_history_store(config)
+    report = import_history_csvs(store, Path(config["output"]["folder"]))
+    print(
+        f"\nImported {report.articles} articles from {report.files} CSV files "
+        f"({report.skipped} imported before) into Path('{store.path}') ✅"
+    )
+
+
+# Process a File of Topics without Prompting
+def batch(args: argparse.Namespace) -> None:
+    """
+    Run every topic of the topics file through the pipelined batch mode.
+
+    Args:
+        args (argparse.Namespace): The parsed command line flags.
+    """
+    from src.batch import make_default_stages, read_topics_file, run_batch
+
+    if args.offline:
+        set_offline()
+
+    with open("config.yaml", "r") as f:
+        config = yaml.safe_load(f)
+
+    replay_server = start_replay_server(config) if args.replay else None
+    configure_session(**config["news_api"].get("http", {}))
+    configure_summarizer(config)
+
+    topics = read_topics_file(args.topics_file)
+    output = args.output or (
+        Path(config["output"]["folder"])
+        / f"batch_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+    )
+    stages = make_default_stages(
+        config,
+        api_key=get_env("NEWS_API_KEY") or ("replay" if replay_server is not None else None),
+        model_id=config["hugging_face"]["model"],
+        cache=build_response_cache(config),
+        entity_cache=build_entity_cache(config),
+        summary_cache=build_summary_cache(config),
+        store=build_history_store(config),
+        embedding_index=build_embedding_index(config),
+    )
+
+    print(f"\nProcessing {len(topics)} topics from '{args.topics_file}'")
+    report = run_batch(
+        topics,
+        stages,
+        output,
+        language=config["default_language"],
+        on_result=lambda job: print(
+            f"{'✅' if job.error is None else '❌'} {job.topic}: "
+            f"{job.error or f'{len(job.articles)} articles'}"
+            + (f" (WARNING: {job.warning})" if job.warning else "")
+        ),
+    )
+    print(
+        f"\n{report.topics} topics ({report.failed} failed) in {report.seconds:.1f}s, "
+        f"{report.topics_per_minute:.1f} topics per minute"
+    )
+    print(f"Results written to Path('{report.output}')")
+    if replay_server is not None:
+        replay_server.stop()
+        print(f"Replay server: {replay_server.stats()}")
+
+
+# Poll standing Topics for new Articles
+def watch(args: argparse.Namespace) -> None:
+    """
+    Watch every topic of the topics file, handling only articles that are new.
+
+    Args:
+        args (argparse.Namespace): The parsed command line flags.
+    """
+    from src.batch import read_topics_file
+
+    if args.offline:
+        set_offline()
+
+    with open("config.yaml", "r") as f:
+        config = yaml.safe_load(f)
+
+    replay_server = start_replay_server(config) if args.replay else None
+    configure_session(**config["news_api"].get("http", {}))
+    configure_summarizer(config)
+
+    store = build_history_store(config)
+    entity_cache = build_entity_cache(config)
+    summary_cache = build_summary_cache(config)
+    embedding_index = build_embedding_index(config)
+    watches = [
+        make_topic_watch(
+            config,
+            store,
+            topic,
+            language=config["default_language"],
+            api_key=get_env("NEWS_API_KEY") or ("replay" if replay_server is not None else None),
+            model_id=config["hugging_face"]["model"],
+            entity_cache=entity_cache,
+            summary_cache=summary_cache,
+            embedding_index=embedding_index,
+        )
+        for topic in read_topics_file(args.topics_file)
+    ]
+
+    print(f"\nWatching {len(watches)} topics every {args.interval}, press Ctrl+C to stop")
+    try:
+        rounds = run_watches(
+            watches,
+            parse_interval(args.interval),
+            rounds=args.rounds,
+            on_update=lambda update: print(f"\n{format_watch_update(update)}"),
+        )
+        print(f"\nFinished {rounds} rounds")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        if replay_server is not None:
+            replay_server.stop()
 
 
 if __name__ == "__main__":
-    print("\nStarting Application...")
-    main()
+    args = parse_args()
+    if args.startup_profile:
+        from src.utils.startup_profile import format_startup_profile, profile_startup
+
+        print(format_startup_profile(profile_startup("main")))
+    elif args.prefetch:
+        prefetch(args)
+    elif args.import_history:
+        import_history(args)
+    elif args.watch and not args.topics_file:
+        print("\n--watch needs a --topics-file with the topics to watch")
+    elif args.topics_file and args.watch:
+        watch(args)
+    elif args.topics_file:
+        batch(args)
+    else:
+        print("\nStarting Application...")
+        main(args)
     print("Application closed.")
@@ -0,0 +1,157 @@
+"""
+async_search_news.py
+
+This module provides an asyncio interface to the News API search for fanning out over many
+topics at once. Requests still go through the pooled requests session, so all topics share
+one connection pool with its timeouts and retries; each blocking request runs on a worker
+thread while a semaphore caps how many are in flight.
+
+Classes:
+    - TopicResult: The articles found for one topic, or the error that prevented it.
+
+Functions:
+    - async_search_news_articles: Async counterpart of search_news_articles.
+    - search_many: Searches many topics concurrently and reports results and errors per topic.
+
+Example Usage:
+    api_key = "your_news_api_key"
+    results = asyncio.run(search_many(["technology", "climate"], api_key, concurrency=4))
+    for topic, result in results.items():
+        print(topic, len(result.articles), result.error)
+"""
+
+# Import Relevant Packages
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Import News Search Modules
+from src.search_news import Language, search_news_articles
+from src.utils.get_keys import get_env
+from src.utils.http_session import PooledSession, get_session
+
+# Type Hints
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass
+class TopicResult:
+    """Outcome of searching a single topic"""
+
+    topic: str
+    articles: List[Dict[str, str]] = field(default_factory=list)
+    error: Optional[Exception] = None
+    latency: float = 0.0  # Seconds including waiting for a free slot
+
+
+async def async_search_news_articles(
+    topic: str,
+    api_key: Optional[str],
+    *,
+    language: Optional[Language] = "en",
+    url: Optional[str] = "https://newsapi.org/v2/everything",
+    from_date: Optional[datetime] = None,
+    sort_type: Optional[str] = "relevancy",
+    session: Optional[PooledSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> List[Dict[str, str]]:
+    """
+    Search for news articles related to the given topic without blocking the event loop.
+
+    Args:
+        topic (str): The topic to search for.
+        api_key (str): Your News API key.
+        language (Optional[Language]): The language of the news articles.
+        url (Optional[str]): The URL endpoint for the News API.
+        from_date (Optional[datetime]): The start date for the news articles.
+        sort_type (Optional[str]): The sort type for the news articles. Default is "relevancy".
+        session (Optional[PooledSession]): Session to send the request with. Default is the process-wide session.
+        semaphore (Optional[asyncio.Semaphore]): Semaphore limiting concurrent requests.
+        executor (Optional[ThreadPoolExecutor]): Executor running the request. Default is the loop's executor.
+
+    Returns:
+        List[Dict[str, str]]: A list of dictionaries containing the title, URL, and publication date of the articles.
+
+    Raises:
+        AssertionError: If no API key is provided.
+        requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
+    """
+    loop = asyncio.get_running_loop()
+    async with semaphore or nullcontext():
+        return await loop.run_in_executor(
+            executor,
+            lambda: search_news_articles(
+                topic,
+                api_key,
+                language=language,
+                url=url,
+                from_date=from_date,
+                sort_type=sort_type,
+                session=session,
+            ),
+        )
+
+
+async def search_many(
+    topics: Iterable[str],
+    api_key: Optional[str],
+    *,
+    concurrency: int = 8,
+    session: Optional[PooledSession] = None,
+    **kwargs: Any,
+) -> Dict[str, TopicResult]:
+    """
+    Search many topics concurrently, collecting results and errors per topic.
+
+    A failing topic does not cancel the others; its exception is stored on its TopicResult.
+
+    Args:
+        topics (Iterable[str]): The topics to search for. Duplicates are searched once.
+        api_key (str): Your News API key.
+        concurrency (int): Maximum number of requests in flight. Default is 8.
+        session (Optional[PooledSession]): Session shared by all requests. Default is the process-wide session.
+        **kwargs (Any): Further keyword arguments of async_search_news_articles, such as language.
+
+    Returns:
+        Dict[str, TopicResult]: Results keyed by topic, in the order the topics were given.
+    """
+    if session is None:
+        session = get_session()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def search(topic: str, executor: ThreadPoolExecutor) -> TopicResult:
+        start = time.perf_counter()
+        try:
+            articles = await async_search_news_articles(
+                topic,
+                api_key,
+                session=session,
+                semaphore=semaphore,
+                executor=executor,
+                **kwargs,
+            )
+            return TopicResult(topic, articles, latency=time.perf_counter() - start)
+        except Exception as e:
+            return TopicResult(topic, error=e, latency=time.perf_counter() - start)
+
+    unique_topics = list(dict.fromkeys(topics))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = await asyncio.gather(
+            *(search(topic, executor) for topic in unique_topics)
+        )
+    return {result.topic: result for result in results}
+
+
+# Example Usage:
+if __name__ == "__main__":
+    api_key: Optional[str] = get_env("NEWS_API_KEY")
+    results = asyncio.run(
+        search_many(["technology", "climate", "space"], api_key, concurrency=4)
+    )
+    for topic, result in results.items():
+        status = f"error: {result.error}" if result.error else f"{len(result.articles)} articles"
+        print(f"{topic}: {status} in {result.latency:.2f}s")
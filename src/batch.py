@@ -0,0 +1,365 @@
+"""
+batch.py
+
+This module provides a non-interactive batch mode that runs a list of topics through the
+search, save, index, dedupe, summarize and named entity stages. Every stage runs on its own thread
+and hands topics to the next one through a bounded queue, so fetching topic N+1 overlaps
+with summarizing and tagging topic N while memory use stays bounded. The summarize stage takes
+the topics that queued up while the model was busy as one micro-batch, so several topics
+share a single model pass. Results are written as one JSON line per topic.
+
+Classes:
+    - TopicJob: A topic moving through the pipeline, collecting the output of every stage.
+    - BatchReport: Topic counts, duration and throughput of a batch run.
+
+Functions:
+    - read_topics_file: Reads topics from a text file, one per line.
+    - make_default_stages: Builds the fetch, save, index, dedupe, summarize and entities stages from config.
+    - run_batch: Runs topics through pipelined stages and writes JSONL results.
+
+Example Usage:
+    topics = read_topics_file(Path("topics.txt"))
+    stages = make_default_stages(config, api_key=api_key, model_id="facebook/bart-large-cnn")
+    report = run_batch(topics, stages, Path("history/batch.jsonl"))
+    print(f"{report.topics_per_minute:.1f} topics per minute")
+"""
+
+# Import Relevant Packages
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Import Pipeline Stages
+from src.dedupe_articles import deduplicate_articles
+from src.embedding_index import EmbeddingIndex
+from src.history_store import HistoryStore
+from src.save_articles import filter_removed_articles, history_csv_path, save_articles_csv
+from src.search_news import cached_iter_news_pages, iter_news_pages, news_api_url
+from src.summarize_content import extract_named_entities_batch, summarize_contents_batch
+from src.utils.entity_cache import EntityCache
+from src.utils.response_cache import ResponseCache
+from src.utils.summary_cache import SummaryCache
+from src.utils.secure_input import sanitize_input
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TypeAlias
+
+# Number of Articles summarized and tagged per Topic
+TOP_ARTICLES = 15
+
+
+@dataclass
+class TopicJob:
+    """A topic moving through the pipeline"""
+
+    topic: str
+    language: str
+    articles: List[Dict[str, str]] = field(default_factory=list)
+    top_articles: List[Dict[str, str]] = field(default_factory=list)  # Summarized and tagged
+    duplicates: int = 0  # Near-duplicate headlines skipped when picking the top articles
+    run_id: Optional[int] = None  # Run in the history store
+    csv_path: Optional[str] = None
+    summary: Optional[str] = None
+    entities: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None  # Set by the first failing stage, later stages are skipped
+    indexed: Optional[int] = None  # New articles added to the embedding index
+    warning: Optional[str] = None  # Set by a stage that failed without stopping the topic
+    seconds: Dict[str, float] = field(default_factory=dict)
+
+    def to_record(self) -> Dict[str, Any]:
+        """Return the job as a JSON serializable result record"""
+        return {
+            "topic": self.topic,
+            "language": self.language,
+            "article_count": len(self.articles),
+            "top_articles": self.top_articles,
+            "duplicates": self.duplicates,
+            "run_id": self.run_id,
+            "csv_path": self.csv_path,
+            "summary": self.summary,
+            "entities": self.entities,
+            "error": self.error,
+            "indexed": self.indexed,
+            "warning": self.warning,
+            "seconds": self.seconds,
+        }
+
+
+# Type Aliases
+Stage: TypeAlias = Callable[[TopicJob], None]
+BatchStage: TypeAlias = Callable[[List[TopicJob]], None]
+StageSpec: TypeAlias = Union[Tuple[str, Stage], Tuple[str, BatchStage, int]]
+
+
+@dataclass
+class BatchReport:
+    """Outcome of a batch run"""
+
+    topics: int
+    failed: int
+    seconds: float
+    output: Path
+
+    @property
+    def topics_per_minute(self) -> float:
+        """Processed topics per minute of wall time"""
+        return self.topics / self.seconds * 60 if self.seconds else 0.0
+
+
+def read_topics_file(path: Path) -> List[str]:
+    """
+    Read topics from a text file, one per line.
+
+    Blank lines and lines starting with '#' are skipped, and every topic is sanitized like
+    input typed at the prompt.
+
+    Args:
+        path (Path): The topics file.
+
+    Returns:
+        List[str]: The topics in file order.
+    """
+    topics = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        topic = sanitize_input(line).strip()
+        if topic:
+            topics.append(topic)
+    return topics
+
+
+def make_default_stages(
+    config: Dict[str, Any],
+    *,
+    api_key: Optional[str],
+    model_id: str,
+    cache: Optional[ResponseCache] = None,
+    entity_cache: Optional[EntityCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    store: Optional[HistoryStore] = None,
+    embedding_index: Optional[EmbeddingIndex] = None,
+) -> List[StageSpec]:
+    """
+    Build the fetch, save, index, dedupe, summarize and entities stages from the application config.
+
+    The summarize stage is a batch stage taking up to hugging_face.batch_size topics at once.
+    The index stage is only added with an embedding index. Failing to index a topic is kept
+    as a warning, so its summary and entities are still produced.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+        api_key (Optional[str]): Your News API key.
+        model_id (str): The model ID used for summarization.
+        cache (Optional[ResponseCache]): Response cache for searches. Default is no cache.
+        entity_cache (Optional[EntityCache]): Cache of named entities per title. Default is no cache.
+        summary_cache (Optional[SummaryCache]): Cache of earlier summaries. Default is no cache.
+        store (Optional[HistoryStore]): Store the articles are saved to. Default is CSV files only.
+        embedding_index (Optional[EmbeddingIndex]): Index the saved articles are added to. Default is no index.
+
+    Returns:
+        List[StageSpec]: Named stages in pipeline order.
+    """
+    batch_size = config["hugging_face"].get("batch_size", 8)
+    dedupe_config = config.get("dedupe", {})
+    search_kwargs = {
+        "url": news_api_url(config["news_api"]),
+        "page_size": config["news_api"].get("page_size", 100),
+        "max_articles": config["news_api"].get("max_articles", 100),
+        "max_workers": config["news_api"].get("max_workers", 4),
+    }
+
+    def fetch(job: TopicJob) -> None:
+        if cache is not None:
+            pages = cached_iter_news_pages(
+                job.topic, api_key, cache=cache, language=job.language, **search_kwargs
+            )
+        else:
+            pages = iter_news_pages(
+                job.topic, api_key, language=job.language, **search_kwargs
+            )
+        job.articles = filter_removed_articles(
+            article for page in pages for article in page
+        )
+
+    def save(job: TopicJob) -> None:
+        if not job.articles:
+            return
+        if store is not None:
+            job.run_id = store.start_run(job.topic, job.language, source="batch")
+            store.add_articles(job.run_id, job.articles, language=job.language)
+        if store is None or config["output"].get("csv", False):
+            save_file = history_csv_path(
+                Path(config["output"]["folder"]), job.topic, job.language
+            )
+            save_articles_csv(job.articles, save_file)
+            job.csv_path = str(save_file)
+
+    def index(job: TopicJob) -> None:
+        if not job.articles:
+            return
+        try:
+            job.indexed = embedding_index.add(  # type: ignore[union-attr]
+                {**article, "language": job.language} for article in job.articles
+            )
+        except Exception as e:
+            job.warning = f"index: {e}"
+
+    def dedupe(job: TopicJob) -> None:
+        if not dedupe_config.get("enabled", False):
+            job.top_articles = job.articles[:TOP_ARTICLES]
+            return
+        result = deduplicate_articles(
+            job.articles,
+            threshold=dedupe_config.get("threshold", 0.8),
+            num_perm=dedupe_config.get("num_perm", 64),
+        )
+        job.top_articles = result.kept[:TOP_ARTICLES]
+        job.duplicates = result.removed
+
+    def summarize(jobs: List[TopicJob]) -> None:
+        jobs = [job for job in jobs if job.top_articles]
+        if not jobs:
+            return
+        summaries = summarize_contents_batch(
+            [
+                "\n".join(article["title"] for article in job.top_articles)
+                for job in jobs
+            ],
+            model_id=model_id,
+            batch_size=batch_size,
+            max_length=config["hugging_face"]["max_length"],
+            min_length=config["hugging_face"]["min_length"],
+            do_sample=config["hugging_face"]["do_sample"],
+            cache=summary_cache,
+        )
+        for job, summary in zip(jobs, summaries):
+            job.summary = summary
+
+    def entities(job: TopicJob) -> None:
+        _, counter = extract_named_entities_batch(
+            [article["title"] for article in job.top_articles],
+            cache=entity_cache,
+        )
+        job.entities = dict(counter.most_common())
+
+    stages: List[StageSpec] = [("fetch", fetch), ("save", save)]
+    if embedding_index is not None:
+        stages.append(("index", index))
+    stages += [
+        ("dedupe", dedupe),
+        ("summarize", summarize, batch_size),
+        ("entities", entities),
+    ]
+    return stages
+
+
+def run_batch(
+    topics: List[str],
+    stages: List[StageSpec],
+    output: Path,
+    *,
+    language: str = "en",
+    queue_size: int = 2,
+    on_result: Optional[Callable[[TopicJob], None]] = None,
+) -> BatchReport:
+    """
+    Run topics through pipelined stages and append one JSON line per topic to a file.
+
+    Each stage runs on its own thread. A stage given as (name, stage, batch_size) receives
+    lists of up to batch_size topics: whatever has queued up when it becomes free, without
+    waiting for a full batch. A topic that fails in one stage keeps its error and skips the
+    remaining stages, but is still written to the output.
+
+    Args:
+        topics (List[str]): The topics to process.
+        stages (List[StageSpec]): Named stages in pipeline order, batch stages with their batch size.
+        output (Path): The JSONL file to append results to.
+        language (str): Language of the searches. Default is "en".
+        queue_size (int): Maximum number of topics waiting between two stages. Default is 2.
+        on_result (Optional[Callable[[TopicJob], None]]): Called for every finished topic.
+
+    Returns:
+        BatchReport: Topic counts, duration and throughput of the run.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    batch_sizes = [spec[2] if len(spec) > 2 else 1 for spec in stages]
+    # A batch stage's inbox must be able to hold a full batch
+    queues: List["queue.Queue[Optional[TopicJob]]"] = [
+        queue.Queue(maxsize=max([queue_size] + batch_sizes[index : index + 1]))
+        for index in range(len(stages) + 1)
+    ]
+
+    def work(
+        name: str,
+        stage: Callable[[Any], None],
+        batch_size: int,
+        inbox: queue.Queue,
+        outbox: queue.Queue,
+    ) -> None:
+        done = False
+        while not done:
+            jobs = [inbox.get()]
+            while len(jobs) < batch_size and jobs[-1] is not None:
+                try:
+                    jobs.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if jobs[-1] is None:
+                done = True
+                jobs.pop()
+
+            pending = [job for job in jobs if job.error is None]
+            if pending:
+                start = time.perf_counter()
+                try:
+                    stage(pending if batch_size > 1 else pending[0])
+                except Exception as e:
+                    for job in pending:
+                        job.error = f"{name}: {e}"
+                seconds = time.perf_counter() - start
+                for job in pending:
+                    job.seconds[name] = seconds
+            for job in jobs:
+                outbox.put(job)
+        outbox.put(None)
+
+    def feed() -> None:
+        for topic in topics:
+            queues[0].put(TopicJob(topic, language))
+        queues[0].put(None)
+
+    threads = [threading.Thread(target=feed, name="batch-feed", daemon=True)]
+    for index, (name, stage, *_) in enumerate(stages):
+        threads.append(
+            threading.Thread(
+                target=work,
+                args=(name, stage, batch_sizes[index], queues[index], queues[index + 1]),
+                name=f"batch-{name}",
+                daemon=True,
+            )
+        )
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+
+    processed = failed = 0
+    with open(output, "a", encoding="utf-8") as results:
+        while (job := queues[-1].get()) is not None:
+            results.write(json.dumps(job.to_record(), ensure_ascii=False) + "\n")
+            results.flush()
+            processed += 1
+            failed += job.error is not None
+            if on_result is not None:
+                on_result(job)
+
+    for thread in threads:
+        thread.join()
+    return BatchReport(processed, failed, time.perf_counter() - start, output)
@@ -35,8 +35,19 @@ def help_command_output() -> str:
     \t-- Type 'en' for English and 'de' for German\n\
 - Application Settings\n\
     \t-- Type in '!exit' or '!quit' to close application\n\
+- Cache Settings\n\
+    \t-- Type in '!cache' to show response, entity and summary cache statistics\n\
+    \t-- Type in '!cache clear' to remove all cached responses, entities and summaries\n\
+- Saved History\n\
+    \t-- Type in '!history <query>' to search saved articles by title and URL without calling NewsAPI\n\
+    \t-- Quote phrases for exact matches (eg: !history \"elon musk\" starship)\n\
+    \t-- Type in '!similar <text>' to find saved articles similar in meaning (eg: !similar rocket launch in texas)\n\
+- Watch Mode\n\
+    \t-- Type in '!watch <topic> <interval>' to poll a topic for new articles (eg: !watch spacex 5m)\n\
+    \t-- Only new articles are saved, summarized and tagged, press Ctrl+C to return to the prompt\n\
 - Summarization Settings\n\
     \t-- Type in '!sethf' to set Model IDs for HuggingFace\n\
+    \t-- Type in '!models' to list loaded models and registry hits, misses and load times\n\
 - Advanced Queries\n\
     \t--Put your topic in quotation marks for exact match. (eg: \"elon musk\")\n\
     \t--Use Boolean Operators. (eg: (crypto AND bitcoin) NOT ethereum)"""
@@ -0,0 +1,191 @@
+"""
+cluster_articles.py
+
+This module groups the articles of a query into sub-topics by the meaning of their
+headlines. Titles are embedded in batches with a sentence-transformers model, whose
+normalized embeddings make cosine similarity a plain dot product. Clusters are then formed
+around the headlines with the most similar neighbours: the headline above the similarity
+threshold to most others becomes the center of the first cluster and takes all of its
+unassigned neighbours, the next best remaining headline the next, and so on. Neighbour
+counts are computed with blocked matrix products, so memory stays bounded, and headlines
+without any neighbour become their own cluster without further work. Clusters are returned
+largest first, so the main sub-topics of a query can be summarized one by one.
+
+Classes:
+    - ArticleCluster: The articles of one sub-topic and its most central headline.
+
+Functions:
+    - load_sentence_encoder: Loads a sentence-transformers model.
+    - embed_titles: Embeds titles in batches as normalized vectors.
+    - cluster_embeddings: Clusters normalized embeddings by cosine similarity.
+    - cluster_articles: Groups articles into sub-topics, largest first.
+
+Example Usage:
+    clusters = cluster_articles(articles, threshold=0.6)
+    for cluster in clusters[:5]:
+        print(len(cluster.articles), cluster.center["title"])
+"""
+
+# Import Relevant Packages
+# numpy and sentence-transformers are imported inside the functions using them
+from dataclasses import dataclass, field
+
+# Import Model Registry
+from src.model_registry import ModelRegistry
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_ENCODER = "sentence-transformers/all-MiniLM-L6-v2"
+BLOCK_SIZE = 1024  # Rows of the similarity matrix computed at once
+
+
+@dataclass
+class ArticleCluster:
+    """Articles of one sub-topic, in the order they were returned"""
+
+    center: Dict[str, str]  # Article whose headline is closest to most others
+    articles: List[Dict[str, str]] = field(default_factory=list)
+
+
+def load_sentence_encoder(model_id: str, model_kwargs: Dict[str, Any]) -> Any:
+    """
+    Load a sentence-transformers model on the CPU. Encoding runs on all cores through
+    the intra-op threads of torch.
+
+    Args:
+        model_id (str): The model ID, such as "sentence-transformers/all-MiniLM-L6-v2".
+        model_kwargs (Dict[str, Any]): Keyword arguments passed to SentenceTransformer.
+
+    Returns:
+        SentenceTransformer: The loaded model.
+    """
+    from sentence_transformers import SentenceTransformer  # type: ignore[import-untyped]
+
+    return SentenceTransformer(model_id, device="cpu", **model_kwargs)
+
+
+# Loaded Encoders are kept like Summarization Models, the most recent one is enough
+_encoders = ModelRegistry(max_models=1, loader=load_sentence_encoder)
+
+
+def embed_titles(
+    titles: List[str],
+    model_id: str = DEFAULT_ENCODER,
+    *,
+    batch_size: int = 64,
+    registry: Optional[ModelRegistry] = None,
+) -> Any:
+    """
+    Embed titles in batches as vectors of unit length.
+
+    Args:
+        titles (List[str]): The titles to embed.
+        model_id (str): The sentence-transformers model. Default is "sentence-transformers/all-MiniLM-L6-v2".
+        batch_size (int): Titles encoded at once. Default is 64.
+        registry (Optional[ModelRegistry]): Registry to take the model from. Default is the module's encoder registry.
+
+    Returns:
+        numpy.ndarray: A float32 matrix with one normalized embedding per title.
+    """
+    import numpy as np
+
+    encoder = (registry if registry is not None else _encoders).get(model_id, {})
+    embeddings = encoder.encode(
+        titles,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def cluster_embeddings(embeddings: Any, *, threshold: float = 0.6) -> List[List[int]]:
+    """
+    Cluster normalized embeddings around the rows with the most similar neighbours.
+
+    Rows are visited by descending number of neighbours with a cosine similarity of at
+    least threshold. Each visited row not yet assigned opens a cluster holding itself and
+    all of its unassigned neighbours.
+
+    Args:
+        embeddings (numpy.ndarray): One normalized embedding per row.
+        threshold (float): Minimum cosine similarity to the center of a cluster. Default is 0.6.
+
+    Returns:
+        List[List[int]]: Row indices per cluster, largest cluster first. The first index of a
+                         cluster is its center, the others follow in row order.
+    """
+    import numpy as np
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    count = len(embeddings)
+    if count == 0:
+        return []
+
+    neighbours = np.empty(count, dtype=np.int64)
+    for start in range(0, count, BLOCK_SIZE):
+        block = embeddings[start : start + BLOCK_SIZE] @ embeddings.T
+        neighbours[start : start + BLOCK_SIZE] = (block >= threshold).sum(axis=1)
+
+    assigned = np.zeros(count, dtype=bool)
+    clusters: List[List[int]] = []
+    for center in np.argsort(-neighbours, kind="stable"):
+        if assigned[center]:
+            continue
+        if neighbours[center] <= 1:  # Only similar to itself
+            members = np.array([center])
+        else:
+            similar = (embeddings @ embeddings[center] >= threshold) & ~assigned
+            similar[center] = True
+            members = np.flatnonzero(similar)
+        assigned[members] = True
+        clusters.append([int(center)] + [int(index) for index in members if index != center])
+
+    clusters.sort(key=len, reverse=True)  # Stable, ties keep the order of their centers
+    return clusters
+
+
+def cluster_articles(
+    articles: List[Dict[str, str]],
+    *,
+    threshold: float = 0.6,
+    embed: Optional[Callable[[List[str]], Any]] = None,
+) -> List[ArticleCluster]:
+    """
+    Group articles into sub-topics by the meaning of their headlines, largest first.
+
+    Args:
+        articles (List[Dict[str, str]]): The articles, most relevant first.
+        threshold (float): Minimum cosine similarity of a headline to the center of its cluster. Default is 0.6.
+        embed (Optional[Callable[[List[str]], Any]]): Embeds titles as normalized vectors. Default is embed_titles.
+
+    Returns:
+        List[ArticleCluster]: The sub-topics, largest first, each listing its articles in their original order.
+    """
+    if not articles:
+        return []
+    embed = embed or embed_titles
+    clusters = cluster_embeddings(
+        embed([article["title"] for article in articles]), threshold=threshold
+    )
+    return [
+        ArticleCluster(
+            center=articles[members[0]],
+            articles=[articles[index] for index in sorted(members)],
+        )
+        for members in clusters
+    ]
+
+
+# Example Usage:
+if __name__ == "__main__":
+    articles = [
+        {"title": "SpaceX launches Starship on fifth test flight", "url": "https://example.com/1"},
+        {"title": "Starship rocket lifts off from Texas", "url": "https://example.com/2"},
+        {"title": "Tesla recalls Cybertruck over loose trim", "url": "https://example.com/3"},
+        {"title": "Cybertruck recall hits Tesla shares", "url": "https://example.com/4"},
+    ]
+    for cluster in cluster_articles(articles, threshold=0.5):
+        print(f"{len(cluster.articles)} articles: {cluster.center['title']}")
@@ -0,0 +1,127 @@
+"""
+corpus.py
+
+This module provides the article corpora used by the benchmarks and served by the local
+NewsAPI stand-in. Synthetic corpora are
+generated from a fixed seed, so every run and every machine benchmarks the same headlines.
+They mix people, organizations and places like real headlines do, repeat some syndicated
+titles and contain removed articles the way NewsAPI returns them. Saved searches from the
+history folder can be loaded as a further, real-world corpus.
+
+Functions:
+    - generate_articles: Generates a deterministic corpus of articles.
+    - load_history_articles: Loads all articles saved as CSV files in the history folder.
+    - corpus_label: Returns a short label such as 10k for a corpus size.
+
+Usage Example:
+    articles = generate_articles(1000)
+    print(articles[0])
+    history = load_history_articles(Path("history"))
+"""
+
+# Import Relevant Packages
+import csv
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Type Hints
+from typing import Dict, List
+
+PEOPLE = [
+    "Elon Musk", "Olaf Scholz", "Christine Lagarde", "Tim Cook", "Ursula von der Leyen",
+    "Sam Altman", "Satya Nadella", "Kamala Harris", "Emmanuel Macron", "Jensen Huang",
+]
+ORGANIZATIONS = [
+    "SpaceX", "Tesla", "Apple", "Microsoft", "Deutsche Bahn", "NASA", "OpenAI",
+    "European Central Bank", "Siemens", "Nvidia", "Reuters", "United Nations",
+]
+PLACES = [
+    "Berlin", "Brussels", "Washington", "Tokyo", "Paris", "London", "Munich",
+    "San Francisco", "Beijing", "Texas", "Frankfurt", "Hamburg",
+]
+VERBS = [
+    "unveils", "warns", "plans", "cuts", "launches", "rejects", "backs", "delays",
+    "expands", "investigates", "announces", "signs",
+]
+OBJECTS = [
+    "new rocket", "interest rates", "climate deal", "record profits", "layoffs",
+    "chip factory", "electric trucks", "AI model", "rail strike", "trade tariffs",
+    "solar subsidies", "data centre",
+]
+REMOVED_EVERY = 50  # NewsAPI returns about one removed article in fifty
+SYNDICATED_EVERY = 7  # Every seventh headline repeats an earlier one
+
+
+def generate_articles(count: int, *, seed: int = 0) -> List[Dict[str, str]]:
+    """
+    Generate a deterministic corpus of articles.
+
+    Args:
+        count (int): Number of articles.
+        seed (int): Seed of the random generator. Default is 0.
+
+    Returns:
+        List[Dict[str, str]]: Articles with title, URL, and publication date.
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 7, 1)
+    articles = []
+    for index in range(count):
+        published_at = (start + timedelta(minutes=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if index % REMOVED_EVERY == REMOVED_EVERY - 1:
+            articles.append(
+                {"title": "[Removed]", "url": "https://removed.com", "publishedAt": published_at}
+            )
+            continue
+        if index and index % SYNDICATED_EVERY == 0:
+            title = articles[rng.randrange(len(articles))]["title"]
+        else:
+            title = (
+                f"{rng.choice(PEOPLE + ORGANIZATIONS)} {rng.choice(VERBS)} "
+                f"{rng.choice(OBJECTS)} in {rng.choice(PLACES)}"
+            )
+        articles.append(
+            {
+                "title": title,
+                "url": f"https://news.example.com/{seed}/{index}",
+                "publishedAt": published_at,
+            }
+        )
+    return articles
+
+
+def load_history_articles(folder: Path) -> List[Dict[str, str]]:
+    """
+    Load all articles saved as CSV files in the history folder.
+
+    Args:
+        folder (Path): The history folder.
+
+    Returns:
+        List[Dict[str, str]]: The articles of all files, in file name order.
+    """
+    articles = []
+    for path in sorted(Path(folder).glob("*.csv")):
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            for row in csv.DictReader(csv_file):
+                articles.append(
+                    {
+                        "title": row.get("title") or "",
+                        "url": row.get("url") or "",
+                        "publishedAt": row.get("publishedAt") or "",
+                    }
+                )
+    return articles
+
+
+def corpus_label(count: int) -> str:
+    """Return a short label such as 1k or 100k for a corpus size"""
+    return f"{count // 1000}k" if count >= 1000 and count % 1000 == 0 else str(count)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    for article in generate_articles(10):
+        print(article)
+    print(f"{len(load_history_articles(Path('history')))} articles in history")
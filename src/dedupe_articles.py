@@ -0,0 +1,244 @@
+"""
+dedupe_articles.py
+
+This module provides near-duplicate detection for headlines. NewsAPI often returns the same
+wire story from many outlets with small edits to the title. Titles are broken into byte
+shingles and reduced to MinHash signatures, and locality sensitive hashing (LSH) with banding
+only compares titles that share a band, so the work grows linearly with the number of
+articles. Titles whose estimated Jaccard similarity reaches the threshold are clustered, and
+the first, most relevant article of every cluster is kept.
+
+Classes:
+    - DedupeResult: The kept articles and the clusters of near-duplicates.
+
+Functions:
+    - normalize_for_shingles: Lowercases a title and strips punctuation before shingling.
+    - minhash_signatures: Computes MinHash signatures of many titles.
+    - find_near_duplicates: Labels every title with the index of its cluster representative.
+    - deduplicate_articles: Keeps one article per cluster of near-identical titles.
+
+Example Usage:
+    result = deduplicate_articles(articles, threshold=0.8)
+    print(f"Removed {result.removed} near-duplicates")
+    top_articles = result.kept[:15]
+"""
+
+# Import Relevant Packages
+# numpy is imported inside the functions using it to keep module import fast
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Type Hints
+from typing import Any, Dict, List, Tuple
+
+SHINGLE_SIZE = 4  # Characters per shingle
+CHUNK_TITLES = 1000  # Titles hashed per vectorized step, bounds memory on large backfills
+
+
+@dataclass
+class DedupeResult:
+    """Outcome of near-duplicate detection"""
+
+    kept: List[Dict[str, str]]
+    clusters: List[List[int]] = field(default_factory=list)  # Indices of clusters with copies
+
+    @property
+    def removed(self) -> int:
+        """Number of articles dropped as near-duplicates"""
+        return sum(len(cluster) - 1 for cluster in self.clusters)
+
+
+def normalize_for_shingles(title: str) -> str:
+    """
+    Lowercase a title and reduce punctuation and whitespace to single spaces.
+
+    Args:
+        title (str): The title.
+
+    Returns:
+        str: The normalized title.
+    """
+    return re.sub(r"[\W_]+", " ", title.lower()).strip()
+
+
+def _shingle_values(titles: List[str]) -> Tuple[Any, Any]:
+    """
+    Return the shingles of many titles as one flat array, and where each title starts.
+
+    A shingle is a window of SHINGLE_SIZE bytes of the normalized UTF-8 title read as a 32 bit
+    integer. Titles shorter than a shingle are padded with zero bytes.
+    """
+    import numpy as np
+
+    encoded = [
+        normalize_for_shingles(title).encode("utf-8").ljust(SHINGLE_SIZE, b"\0")
+        for title in titles
+    ]
+    lengths = np.fromiter((len(text) for text in encoded), dtype=np.int64, count=len(encoded))
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+    counts = lengths - SHINGLE_SIZE + 1
+    title_starts = np.cumsum(lengths) - lengths
+    offsets = np.cumsum(counts) - counts
+
+    # Start of every window in the joined buffer, never crossing into the next title
+    positions = np.repeat(title_starts - offsets, counts) + np.arange(counts.sum())
+    values = np.zeros(len(positions), dtype=np.uint32)
+    for shift in range(SHINGLE_SIZE):
+        values = (values << np.uint32(8)) | buffer[positions + shift]
+    return values.astype(np.uint64), offsets
+
+
+def minhash_signatures(titles: List[str], *, num_perm: int = 64, seed: int = 1) -> Any:
+    """
+    Compute MinHash signatures of many titles.
+
+    Every permutation is a multiply-shift hash of the 32 bit shingles, whose products wrap
+    around in 64 bit arithmetic, so no modulo is needed.
+
+    Args:
+        titles (List[str]): The titles.
+        num_perm (int): Number of hash permutations per signature. Default is 64.
+        seed (int): Seed of the permutations. Default is 1.
+
+    Returns:
+        numpy.ndarray: One row of num_perm minimum hashes per title.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    # Odd multipliers keep the hash universal
+    a = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(titles), num_perm), dtype=np.uint32)
+    for start in range(0, len(titles), CHUNK_TITLES):
+        values, offsets = _shingle_values(titles[start : start + CHUNK_TITLES])
+        # The shift keeps the order, so it is applied after taking the minimum
+        minimums = np.minimum.reduceat(values[:, None] * a + b, offsets, axis=0)
+        signatures[start : start + len(offsets)] = minimums >> np.uint64(32)
+    return signatures
+
+
+def _choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Return the bands and rows per band whose LSH threshold is closest to the target"""
+    options = [
+        (bands, num_perm // bands)
+        for bands in range(1, num_perm + 1)
+        if num_perm % bands == 0
+    ]
+    return min(
+        options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - threshold)
+    )
+
+
+def find_near_duplicates(
+    titles: List[str],
+    *,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    seed: int = 1,
+) -> List[int]:
+    """
+    Label every title with the index of the first title of its near-duplicate cluster.
+
+    Titles sharing an LSH band with an earlier title are compared with that title only, and
+    joined when their estimated Jaccard similarity reaches the threshold. Each title is
+    compared a bounded number of times, so the run time is linear in the number of titles.
+
+    Args:
+        titles (List[str]): The titles, most relevant first.
+        threshold (float): Minimum estimated Jaccard similarity of shingles. Default is 0.8.
+        num_perm (int): Number of hash permutations per signature. Default is 64.
+        seed (int): Seed of the permutations. Default is 1.
+
+    Returns:
+        List[int]: For every title the index of its cluster representative, itself if unique.
+    """
+    if not titles:
+        return []
+    signatures = minhash_signatures(titles, num_perm=num_perm, seed=seed)
+    bands, rows = _choose_bands(num_perm, threshold)
+
+    import numpy as np
+
+    parents = list(range(len(titles)))
+
+    def root(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    indices = np.arange(len(titles))
+    for band in range(bands):
+        band_values = signatures[:, band * rows : (band + 1) * rows]
+        # Every title is compared with the first title sharing its band
+        _, first, inverse = np.unique(
+            band_values, axis=0, return_index=True, return_inverse=True
+        )
+        heads = first[inverse.reshape(-1)]
+        candidates = indices[heads != indices]
+        if not len(candidates):
+            continue
+        similarity = (
+            signatures[heads[candidates]] == signatures[candidates]
+        ).mean(axis=1)
+        for head, index in zip(
+            heads[candidates][similarity >= threshold].tolist(),
+            candidates[similarity >= threshold].tolist(),
+        ):
+            first_root, second_root = root(head), root(index)
+            # The earlier, more relevant title stays the representative
+            parents[max(first_root, second_root)] = min(first_root, second_root)
+
+    return [root(index) for index in range(len(titles))]
+
+
+def deduplicate_articles(
+    articles: List[Dict[str, str]],
+    *,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    seed: int = 1,
+) -> DedupeResult:
+    """
+    Keep one article per cluster of near-identical titles.
+
+    Args:
+        articles (List[Dict[str, str]]): Articles, most relevant first.
+        threshold (float): Minimum estimated Jaccard similarity of title shingles. Default is 0.8.
+        num_perm (int): Number of hash permutations per signature. Default is 64.
+        seed (int): Seed of the permutations. Default is 1.
+
+    Returns:
+        DedupeResult: The first article of every cluster in the original order, and the
+                      clusters that had near-duplicates.
+    """
+    labels = find_near_duplicates(
+        [article["title"] for article in articles],
+        threshold=threshold,
+        num_perm=num_perm,
+        seed=seed,
+    )
+    members: Dict[int, List[int]] = defaultdict(list)
+    for index, label in enumerate(labels):
+        members[label].append(index)
+    return DedupeResult(
+        kept=[article for index, article in enumerate(articles) if labels[index] == index],
+        clusters=[cluster for cluster in members.values() if len(cluster) > 1],
+    )
+
+
+# Example Usage:
+if __name__ == "__main__":
+    articles = [
+        {"title": "SpaceX launches Starship on fifth test flight", "url": "https://a.com/1", "publishedAt": ""},
+        {"title": "SpaceX Launches Starship on Fifth Test Flight!", "url": "https://b.com/1", "publishedAt": ""},
+        {"title": "SpaceX launches Starship on its fifth test flight", "url": "https://c.com/1", "publishedAt": ""},
+        {"title": "Tesla recalls Cybertruck over loose trim panels", "url": "https://d.com/1", "publishedAt": ""},
+    ]
+    result = deduplicate_articles(articles, threshold=0.7)
+    print(f"Removed {result.removed} near-duplicates, clusters: {result.clusters}")
+    for article in result.kept:
+        print(article["title"])
@@ -0,0 +1,526 @@
+"""
+embedding_index.py
+
+This module keeps a persistent semantic index over the saved articles. Title embeddings
+are appended to a float32 matrix file, which is memory-mapped for searching, so the index
+never has to be loaded or rewritten as a whole. A SQLite table keyed by URL maps every
+row of the matrix to its article, so an article is embedded once no matter how many
+searches find it. Saving a page of articles only embeds and appends the new ones, and
+articles saved while the index was not updated are caught up by a backfill that only reads
+the rows of the history store saved since the previous backfill.
+
+Searching compares the query embedding with every row in blocks, which is exact and needs
+no build step. For large stores an optional approximate mode clusters the rows into cells
+by spherical k-means and only compares the query with the rows of the cells closest to it.
+Rows added later are assigned to the existing cells, so the index stays incremental.
+
+Classes:
+    - SimilarArticle: A search result with its cosine similarity.
+    - EmbeddingIndex: The memory-mapped embedding matrix and its metadata.
+
+Functions:
+    - top_k_rows: Returns the best scoring rows of a matrix for a query, in blocks.
+    - spherical_kmeans: Clusters normalized vectors by cosine similarity.
+
+Example Usage:
+    index = EmbeddingIndex(Path("history/index"), embed=embed_titles, model_id="sentence-transformers/all-MiniLM-L6-v2")
+    index.add(articles)
+    for hit in index.search("rocket launch in texas", k=5):
+        print(f"{hit.score:.2f} {hit.title}")
+"""
+
+# Import Relevant Packages
+# numpy is imported inside the functions using it to keep module import fast
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+# Type Hints
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.history_store import HistoryStore
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vectors (
+    row INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    published_at TEXT,
+    language TEXT
+);
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+BLOCK_ROWS = 65_536  # Rows compared with the query at once
+MIN_APPROXIMATE_ROWS = 10_000  # Smaller stores are always searched exactly
+LOOKUP_CHUNK = 500  # URLs looked up per SQLite query, below the variable limit
+
+
+@dataclass
+class SimilarArticle:
+    """An indexed article and its similarity to the query"""
+
+    score: float  # Cosine similarity, 1.0 for the same meaning
+    title: str
+    url: str
+    publishedAt: Optional[str]
+    language: Optional[str]
+
+
+def top_k_rows(matrix: Any, query: Any, k: int, *, block_rows: int = BLOCK_ROWS) -> Tuple[Any, Any]:
+    """
+    Return the rows of a matrix with the highest dot product with the query.
+
+    The matrix is read in blocks, so a memory-mapped matrix is never loaded as a whole.
+
+    Args:
+        matrix (numpy.ndarray): One vector per row, possibly memory-mapped.
+        query (numpy.ndarray): The query vector.
+        k (int): Number of rows to return.
+        block_rows (int): Rows compared with the query at once. Default is 65536.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Row indices and their scores, best first.
+    """
+    import numpy as np
+
+    rows: List[Any] = []
+    scores: List[Any] = []
+    for start in range(0, len(matrix), block_rows):
+        block_scores = np.asarray(matrix[start : start + block_rows]) @ query
+        if len(block_scores) > k:
+            best = np.argpartition(-block_scores, k)[:k]
+        else:
+            best = np.arange(len(block_scores))
+        rows.append(best + start)
+        scores.append(block_scores[best])
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    all_rows, all_scores = np.concatenate(rows), np.concatenate(scores)
+    order = np.argsort(-all_scores, kind="stable")[:k]
+    return all_rows[order], all_scores[order]
+
+
+def spherical_kmeans(
+    vectors: Any, cells: int, *, iterations: int = 10, seed: int = 0
+) -> Any:
+    """
+    Cluster normalized vectors into cells by cosine similarity.
+
+    Args:
+        vectors (numpy.ndarray): Normalized vectors, one per row.
+        cells (int): Number of clusters.
+        iterations (int): Number of refinement steps. Default is 10.
+        seed (int): Seed of the initial centroid choice. Default is 0.
+
+    Returns:
+        numpy.ndarray: The normalized centroids, one per row.
+    """
+    import numpy as np
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=min(cells, len(vectors)), replace=False)]
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        # Empty cells keep their previous centroid
+        centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+    return centroids.astype(np.float32)
+
+
+class EmbeddingIndex:
+    def __init__(
+        self,
+        folder: Path,
+        *,
+        embed: Callable[[List[str]], Any],
+        model_id: str,
+    ) -> None:
+        """
+        Open or create an embedding index
+
+        A matrix file left longer than its metadata by an interrupted save is cut back to the
+        rows the metadata knows.
+
+        Args:
+            folder (Path): Folder of the matrix, cell and metadata files. Created as needed.
+            embed (Callable[[List[str]], Any]): Embeds titles as normalized vectors, such as embed_titles.
+            model_id (str): Model the embeddings are made with. An index only accepts the model it was built with.
+
+        Raises:
+            ValueError: If the index was built with another model.
+        """
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.embed = embed
+        self.model_id = model_id
+        self.matrix_path = self.folder / "embeddings.f32"
+        self.cells_path = self.folder / "cells.i32"
+        self.centroids_path = self.folder / "centroids.npy"
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.folder / "metadata.sqlite", check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(INDEX_SCHEMA)
+
+        settings = dict(self._connection.execute("SELECT name, value FROM settings").fetchall())
+        if settings.setdefault("model_id", model_id) != model_id:
+            raise ValueError(
+                f"The index in {self.folder} was built with >>{settings['model_id']}<<, not >>{model_id}<<"
+            )
+        self._connection.execute("INSERT OR IGNORE INTO settings VALUES ('model_id', ?)", (model_id,))
+        self._connection.commit()
+        self.dim: Optional[int] = int(settings["dim"]) if "dim" in settings else None
+        self._count = self._connection.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        self._matrix: Any = None
+        self._cell_lists: Any = None
+        self._centroids: Any = None
+        self._repair()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _repair(self) -> None:
+        """Cut the matrix and cell files back to the rows the metadata knows"""
+        if self.dim is None:
+            return
+        row_bytes = self.dim * 4
+        for path, size in ((self.matrix_path, row_bytes), (self.cells_path, 4)):
+            if path.exists() and path.stat().st_size > self._count * size:
+                with open(path, "r+b") as file:
+                    file.truncate(self._count * size)
+        stored = self.matrix_path.stat().st_size // row_bytes if self.matrix_path.exists() else 0
+        if stored < self._count:  # Rows whose embeddings never reached the disk
+            self._connection.execute("DELETE FROM vectors WHERE row >= ?", (stored,))
+            self._connection.commit()
+            self._count = stored
+        if self.centroids_path.exists() and (
+            not self.cells_path.exists() or self.cells_path.stat().st_size != self._count * 4
+        ):
+            self.centroids_path.unlink()  # Cells out of step, the approximate mode is rebuilt
+
+    def add(
+        self, articles: Iterable[Dict[str, str]], *, vectors: Any = None
+    ) -> int:
+        """
+        Embed and append the articles not indexed yet.
+
+        Args:
+            articles (Iterable[Dict[str, str]]): Articles with title, URL, and publication date.
+            vectors (Any): Precomputed normalized embeddings, one per article. Default is to embed the titles.
+
+        Returns:
+            int: The number of added articles.
+
+        Raises:
+            ValueError: If the embeddings do not have the dimension of the index.
+        """
+        import numpy as np
+
+        articles = list(articles)
+        chosen = {
+            article["url"]: index
+            for index, article in enumerate(articles)
+            if article.get("url") and article.get("title")
+        }
+
+        with self._lock:
+            for known in self._known_urls(list(chosen)):
+                chosen.pop(known, None)
+            if not chosen:
+                return 0
+            positions = sorted(chosen.values())
+            new = [articles[index] for index in positions]
+            if vectors is None:
+                embeddings = np.asarray(self.embed([article["title"] for article in new]), dtype=np.float32)
+            else:
+                embeddings = np.asarray(vectors, dtype=np.float32)[positions]
+            if embeddings.ndim != 2 or len(embeddings) != len(new):
+                raise ValueError("Expected one embedding per new article")
+            if self.dim is None:
+                self.dim = int(embeddings.shape[1])
+                self._connection.execute("INSERT INTO settings VALUES ('dim', ?)", (str(self.dim),))
+            elif embeddings.shape[1] != self.dim:
+                raise ValueError(f"Embeddings have {embeddings.shape[1]} dimensions, the index {self.dim}")
+
+            # Embeddings reach the disk before the metadata pointing at them
+            with open(self.matrix_path, "ab") as file:
+                file.write(np.ascontiguousarray(embeddings).tobytes())
+            centroids = self._load_centroids()
+            if centroids is not None:
+                with open(self.cells_path, "ab") as file:
+                    file.write(self._assign(embeddings, centroids).tobytes())
+            self._connection.executemany(
+                "INSERT INTO vectors VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        self._count + offset,
+                        article["url"],
+                        article["title"],
+                        article.get("publishedAt"),
+                        article.get("language"),
+                    )
+                    for offset, article in enumerate(new)
+                ],
+            )
+            self._connection.commit()
+            self._count += len(new)
+            self._matrix = None
+            self._cell_lists = None
+        return len(new)
+
+    def backfill(self, store: "HistoryStore", *, batch_size: int = 1000) -> int:
+        """
+        Index the articles of a history store saved since the previous backfill.
+
+        The last store row read is kept with the index, so a backfill only pages through the
+        articles saved since the one before, batch_size at a time. Articles indexed when they
+        were saved are not embedded again.
+
+        Args:
+            store (HistoryStore): The store the articles are saved in.
+            batch_size (int): Articles read and embedded at once. Default is 1000.
+
+        Returns:
+            int: The number of added articles.
+        """
+        with self._lock:
+            setting = self._connection.execute(
+                "SELECT value FROM settings WHERE name = 'store_row'"
+            ).fetchone()
+        row = int(setting[0]) if setting else 0
+        added = 0
+        while page := store.articles_after(row, limit=batch_size):
+            added += self.add(article for _, article in page)
+            row = page[-1][0]
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO settings VALUES ('store_row', ?)", (str(row),)
+                )
+                self._connection.commit()
+        return added
+
+    def _known_urls(self, urls: List[str]) -> List[str]:
+        """Return the URLs that are indexed already"""
+        known = []
+        for start in range(0, len(urls), LOOKUP_CHUNK):
+            chunk = urls[start : start + LOOKUP_CHUNK]
+            known += [
+                row[0]
+                for row in self._connection.execute(
+                    f"SELECT url FROM vectors WHERE url IN ({', '.join('?' * len(chunk))})", chunk
+                )
+            ]
+        return known
+
+    def matrix(self) -> Any:
+        """
+        Return the embedding matrix, memory-mapped read-only.
+
+        Returns:
+            numpy.ndarray: One normalized embedding per indexed article.
+        """
+        import numpy as np
+
+        with self._lock:
+            if self._matrix is None:
+                if not self._count:
+                    return np.empty((0, self.dim or 0), dtype=np.float32)
+                self._matrix = np.memmap(
+                    self.matrix_path, dtype=np.float32, mode="r", shape=(self._count, self.dim)
+                )
+            return self._matrix
+
+    def build_approximate(
+        self, *, cells: Optional[int] = None, sample: int = 50_000, iterations: int = 10, seed: int = 0
+    ) -> int:
+        """
+        Cluster the rows into cells for approximate search.
+
+        Centroids are trained on a sample of the rows and every row is assigned to its
+        closest centroid. Rows added later are assigned when they are added.
+
+        Args:
+            cells (Optional[int]): Number of cells. Default is the square root of the row count.
+            sample (int): Rows the centroids are trained on. Default is 50000.
+            iterations (int): K-means refinement steps. Default is 10.
+            seed (int): Seed of the sample and initial centroids. Default is 0.
+
+        Returns:
+            int: The number of cells.
+        """
+        import numpy as np
+
+        with self._lock:
+            matrix = self.matrix()
+            if not len(matrix):
+                return 0
+            cells = max(1, cells or int(np.sqrt(len(matrix))))
+            rng = np.random.default_rng(seed)
+            rows = np.sort(rng.choice(len(matrix), size=min(sample, len(matrix)), replace=False))
+            centroids = spherical_kmeans(matrix[rows], cells, iterations=iterations, seed=seed)
+            assignments = np.concatenate(
+                [
+                    self._assign(np.asarray(matrix[start : start + BLOCK_ROWS]), centroids)
+                    for start in range(0, len(matrix), BLOCK_ROWS)
+                ]
+            )
+            assignments.tofile(self.cells_path)
+            np.save(self.centroids_path, centroids)
+            self._centroids = centroids
+            self._cell_lists = None
+            return len(centroids)
+
+    @staticmethod
+    def _assign(vectors: Any, centroids: Any) -> Any:
+        """Return the closest centroid of every vector"""
+        import numpy as np
+
+        return np.argmax(vectors @ centroids.T, axis=1).astype(np.int32)
+
+    def _load_centroids(self) -> Any:
+        """Return the centroids of the approximate mode, or None if it was not built"""
+        import numpy as np
+
+        if self._centroids is None and self.centroids_path.exists():
+            self._centroids = np.load(self.centroids_path)
+        return self._centroids
+
+    def _rows_by_cell(self) -> Tuple[Any, Any]:
+        """Return the rows sorted by cell and where every cell starts"""
+        import numpy as np
+
+        if self._cell_lists is None:
+            cells = np.fromfile(self.cells_path, dtype=np.int32, count=self._count)
+            order = np.argsort(cells, kind="stable")
+            starts = np.searchsorted(cells[order], np.arange(len(self._centroids) + 1))
+            self._cell_lists = (order, starts)
+        return self._cell_lists
+
+    def search(
+        self,
+        query: Union[str, Any],
+        k: int = 10,
+        *,
+        approximate: bool = False,
+        probes: int = 16,
+    ) -> List[SimilarArticle]:
+        """
+        Return the indexed articles most similar in meaning to a text.
+
+        Exact search compares the query with every row. Approximate search only compares it
+        with the rows of the probes cells whose centroids are closest, building the cells on
+        first use; stores with fewer than 10000 rows are always searched exactly.
+
+        Args:
+            query (Union[str, numpy.ndarray]): The text to search for, or its normalized embedding.
+            k (int): Number of results. Default is 10.
+            approximate (bool): Whether to search only the closest cells. Default is False.
+            probes (int): Number of cells searched in approximate mode. Default is 16.
+
+        Returns:
+            List[SimilarArticle]: The most similar articles, best first.
+        """
+        import numpy as np
+
+        if not self._count or k <= 0:
+            return []
+        if isinstance(query, str):
+            query = np.asarray(self.embed([query]), dtype=np.float32)[0]
+        query = np.asarray(query, dtype=np.float32)
+
+        with self._lock:
+            matrix = self.matrix()
+            if approximate and self._count >= MIN_APPROXIMATE_ROWS:
+                if self._load_centroids() is None:
+                    self.build_approximate()
+                order, starts = self._rows_by_cell()
+                closest = top_k_rows(self._centroids, query, probes)[0]
+                candidates = np.sort(
+                    np.concatenate([order[starts[cell] : starts[cell + 1]] for cell in closest])
+                )
+                best, scores = top_k_rows(matrix[candidates], query, k)
+                rows = candidates[best]
+            else:
+                rows, scores = top_k_rows(matrix, query, k)
+            return self._articles(rows, scores)
+
+    def _articles(self, rows: Any, scores: Any) -> List[SimilarArticle]:
+        """Look up the articles of matrix rows"""
+        found = {}
+        rows = [int(row) for row in rows]
+        for start in range(0, len(rows), LOOKUP_CHUNK):
+            chunk = rows[start : start + LOOKUP_CHUNK]
+            for row in self._connection.execute(
+                f"SELECT * FROM vectors WHERE row IN ({', '.join('?' * len(chunk))})", chunk
+            ):
+                found[row["row"]] = row
+        return [
+            SimilarArticle(
+                score=float(score),
+                title=found[row]["title"],
+                url=found[row]["url"],
+                publishedAt=found[row]["published_at"],
+                language=found[row]["language"],
+            )
+            for row, score in zip(rows, scores)
+            if row in found
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of rows, their dimension, the size on disk and the approximate mode.
+
+        Returns:
+            Dict[str, Any]: Model, rows, dimension, bytes and number of cells.
+        """
+        centroids = self._load_centroids()
+        return {
+            "model_id": self.model_id,
+            "rows": self._count,
+            "dim": self.dim,
+            "bytes": sum(
+                path.stat().st_size for path in self.folder.iterdir() if path.is_file()
+            ),
+            "cells": len(centroids) if centroids is not None else 0,
+        }
+
+    def close(self) -> None:
+        """Close the metadata database and drop the memory map"""
+        with self._lock:
+            self._matrix = None
+            self._connection.close()
+
+
+# Example Usage:
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+
+    def embed(titles: List[str]) -> Any:
+        vectors = rng.normal(size=(len(titles), 384)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    with tempfile.TemporaryDirectory() as folder:
+        index = EmbeddingIndex(Path(folder), embed=embed, model_id="random")
+        index.add({"title": f"Headline {row}", "url": f"https://example.com/{row}"} for row in range(20_000))
+        for approximate in (False, True):
+            index.search("warm up", approximate=approximate)
+            start = time.perf_counter()
+            hits = index.search("rocket launch", k=5, approximate=approximate)
+            print(f"approximate={approximate}: {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(index.stats())
+        index.close()
@@ -0,0 +1,679 @@
+"""
+history_store.py
+
+This module provides a single SQLite database for all searched articles, replacing one CSV
+file per query. Articles are upserted by URL, so an article found by many searches is stored
+once, while every search is recorded as a run together with the articles it found. Articles
+are indexed by language and publication date and runs by topic and language, so saved
+results can be queried later. A full-text index over titles and URLs is kept up to date by
+triggers on every save, so saved articles can be searched by keywords without the API.
+Watched topics keep their newest publication date and running entity counts, so each poll
+only handles articles that are new. Searches can still be exported as CSV, and CSV files
+written by earlier versions can be imported once.
+
+Classes:
+    - ImportReport: Files and articles read by the CSV importer.
+    - HistoryStore: The SQLite article store.
+
+Functions:
+    - build_match_query: Turns search words and quoted phrases into an FTS5 query.
+    - parse_history_filename: Reads topic, language and time from a saved CSV file name.
+    - import_history_csvs: Imports CSV files from the history folder, skipping files imported before.
+
+Example Usage:
+    store = HistoryStore(Path("history/history.sqlite"))
+    run_id = store.start_run("elon musk", "en")
+    store.add_articles(run_id, articles, language="en")
+    print(store.articles_for_topic("elon musk", limit=15))
+    print(store.search('"elon musk" starship', limit=15))
+    store.export_csv(Path("history/elon_musk.csv"), run_id=run_id)
+"""
+
+# Import Relevant Packages
+import csv
+import re
+import sqlite3
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+# Import Article Saving Modules
+from src.save_articles import ARTICLE_FIELDS, filter_removed_articles
+
+# Type Hints
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    published_at TEXT,
+    language TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    language TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sightings (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    url TEXT NOT NULL REFERENCES articles (url),
+    rank INTEGER NOT NULL,
+    PRIMARY KEY (run_id, url)
+);
+CREATE TABLE IF NOT EXISTS imports (
+    file TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id)
+);
+CREATE TABLE IF NOT EXISTS watches (
+    topic TEXT NOT NULL,
+    language TEXT NOT NULL,
+    newest_published_at TEXT,
+    polls INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (topic, language)
+);
+CREATE TABLE IF NOT EXISTS watch_entities (
+    topic TEXT NOT NULL,
+    language TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (topic, language, entity)
+);
+CREATE INDEX IF NOT EXISTS articles_published_at ON articles (published_at);
+CREATE INDEX IF NOT EXISTS articles_language ON articles (language, published_at);
+CREATE INDEX IF NOT EXISTS runs_topic ON runs (topic, language);
+CREATE INDEX IF NOT EXISTS sightings_url ON sightings (url);
+"""
+
+# Full-text index of titles and URLs, kept in sync with the articles table by triggers
+FULL_TEXT_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5 (
+    title, url, content = 'articles', tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, url) VALUES (new.rowid, new.title, new.url);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, url)
+    VALUES ('delete', old.rowid, old.title, old.url);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, url ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, url)
+    VALUES ('delete', old.rowid, old.title, old.url);
+    INSERT INTO articles_fts (rowid, title, url) VALUES (new.rowid, new.title, new.url);
+END;
+"""
+
+# Title matches weigh more than URL matches when ranking search results
+TITLE_WEIGHT = 10.0
+URL_WEIGHT = 1.0
+
+# Saved CSV Files are named <topic>_articles_<language>_<YYYYmmdd_HHMMSS>.csv
+HISTORY_FILENAME = re.compile(r"^(?P<topic>.*)_articles_(?P<language>[a-z]{2})_(?P<stamp>\d{8}_\d{6})$")
+
+
+@dataclass
+class ImportReport:
+    """Outcome of importing CSV files"""
+
+    files: int
+    skipped: int  # Files imported before
+    articles: int
+
+
+class HistoryStore:
+    def __init__(self, path: Path) -> None:
+        """
+        Open or create the history database
+
+        Args:
+            path (Path): Location of the SQLite file. Parent folders are created as needed.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+        self.full_text = self._create_full_text_index()
+        self._connection.commit()
+
+    def _create_full_text_index(self) -> bool:
+        """
+        Create the full-text index, filling it from the stored articles on first use.
+
+        Returns:
+            bool: Whether SQLite supports FTS5. Without it search falls back to LIKE patterns.
+        """
+        existed = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone()
+        try:
+            self._connection.executescript(FULL_TEXT_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        if existed is None:
+            # Databases from before the index existed are indexed once
+            self._connection.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+        return True
+
+    def start_run(
+        self,
+        topic: str,
+        language: str,
+        *,
+        source: str = "search",
+        started_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Record a new search. Topics are stored in lower case.
+
+        Args:
+            topic (str): The searched topic.
+            language (str): The searched language.
+            source (str): What produced the run, such as "search", "batch" or "import". Default is "search".
+            started_at (Optional[datetime]): Time of the search. Default is now.
+
+        Returns:
+            int: The ID of the run.
+        """
+        started_at = started_at or datetime.now()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (topic, language, started_at, source) VALUES (?, ?, ?, ?)",
+                (
+                    topic.strip().lower(),
+                    language,
+                    started_at.isoformat(timespec="seconds"),
+                    source,
+                ),
+            )
+            self._connection.commit()
+        return int(cursor.lastrowid)
+
+    def add_articles(
+        self,
+        run_id: int,
+        articles: Iterable[Dict[str, str]],
+        *,
+        language: str,
+    ) -> int:
+        """
+        Upsert articles by URL and record that the run found them.
+
+        Articles keep the time they were first seen; title and last seen time are updated.
+        Ranks continue from the articles the run already found.
+
+        Args:
+            run_id (int): The run that found the articles.
+            articles (Iterable[Dict[str, str]]): Articles with title, URL, and publication date.
+            language (str): Language of the articles.
+
+        Returns:
+            int: The number of articles added to the run.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        articles = [article for article in articles if article.get("url")]
+        with self._lock:
+            start = self._connection.execute(
+                "SELECT COUNT(*) FROM sightings WHERE run_id = ?", (run_id,)
+            ).fetchone()[0]
+            self._connection.executemany(
+                "INSERT INTO articles VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET title = excluded.title, "
+                "published_at = excluded.published_at, last_seen = excluded.last_seen",
+                [
+                    (article["url"], article["title"], article.get("publishedAt"), language, now, now)
+                    for article in articles
+                ],
+            )
+            added = self._connection.executemany(
+                "INSERT OR IGNORE INTO sightings VALUES (?, ?, ?)",
+                [
+                    (run_id, article["url"], rank)
+                    for rank, article in enumerate(articles, start=start)
+                ],
+            ).rowcount
+            self._connection.commit()
+        return added
+
+    def articles_for_topic(
+        self,
+        topic: str,
+        *,
+        language: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Return the distinct articles any search for a topic found, newest first.
+
+        Args:
+            topic (str): The searched topic, in any case.
+            language (Optional[str]): Only articles in this language. Default is all languages.
+            since (Optional[str]): Only articles published at or after this ISO date. Default is all.
+            limit (Optional[int]): Maximum number of articles. Default is no limit.
+
+        Returns:
+            List[Dict[str, str]]: Articles with title, URL, and publication date.
+        """
+        query = (
+            "SELECT DISTINCT a.title, a.url, a.published_at FROM articles a "
+            "JOIN sightings s ON s.url = a.url JOIN runs r ON r.id = s.run_id "
+            "WHERE r.topic = ?"
+        )
+        params: List[Any] = [topic.strip().lower()]
+        if language is not None:
+            query += " AND r.language = ?"
+            params.append(language)
+        if since is not None:
+            query += " AND a.published_at >= ?"
+            params.append(since)
+        query += " ORDER BY a.published_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [self._article(row) for row in rows]
+
+    def search(
+        self,
+        query: str,
+        *,
+        language: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, str]]:
+        """
+        Return saved articles matching search words, best matches first.
+
+        Words must all appear in the title or URL, and quoted phrases must appear in order. If
+        no article contains all of them, articles containing any of them are returned. Matches
+        are ranked by BM25 with title matches weighing more, then by publication date.
+
+        Args:
+            query (str): Search words and quoted phrases, such as '"elon musk" starship'.
+            language (Optional[str]): Only articles in this language. Default is all languages.
+            limit (int): Maximum number of articles. Default is 100.
+
+        Returns:
+            List[Dict[str, str]]: Articles with title, URL, and publication date.
+        """
+        for any_term in (False, True):
+            match = build_match_query(query, any_term=any_term)
+            if not match:
+                return []
+            rows = (
+                self._search_full_text(match, language, limit)
+                if self.full_text
+                else self._search_like(query, language, limit, any_term=any_term)
+            )
+            if rows:
+                break
+        return [self._article(row) for row in rows]
+
+    def _search_full_text(
+        self, match: str, language: Optional[str], limit: int
+    ) -> List[sqlite3.Row]:
+        """Run an FTS5 query against the full-text index"""
+        query = (
+            "SELECT a.title, a.url, a.published_at FROM articles_fts f "
+            "JOIN articles a ON a.rowid = f.rowid WHERE articles_fts MATCH ?"
+        )
+        params: List[Any] = [match]
+        if language is not None:
+            query += " AND a.language = ?"
+            params.append(language)
+        query += (
+            f" ORDER BY bm25(articles_fts, {TITLE_WEIGHT}, {URL_WEIGHT}), "
+            "a.published_at DESC LIMIT ?"
+        )
+        params.append(limit)
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    def _search_like(
+        self, text: str, language: Optional[str], limit: int, *, any_term: bool
+    ) -> List[sqlite3.Row]:
+        """Match search terms with LIKE patterns where SQLite lacks FTS5"""
+        terms = _search_terms(text)
+        condition = (" OR " if any_term else " AND ").join(
+            "(a.title LIKE ? OR a.url LIKE ?)" for _ in terms
+        )
+        query = f"SELECT a.title, a.url, a.published_at FROM articles a WHERE ({condition})"
+        params: List[Any] = [f"%{term}%" for term in terms for _ in range(2)]
+        if language is not None:
+            query += " AND a.language = ?"
+            params.append(language)
+        query += " ORDER BY a.published_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return self._connection.execute(query, params).fetchall()
+
+    def all_articles(self) -> List[Dict[str, str]]:
+        """
+        Return every stored article with its language, newest first.
+
+        Returns:
+            List[Dict[str, str]]: Articles with title, URL, publication date and language.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT title, url, published_at, language FROM articles "
+                "ORDER BY published_at DESC"
+            ).fetchall()
+        return [{**self._article(row), "language": row["language"]} for row in rows]
+
+    def articles_after(self, row: int = 0, *, limit: int = 1000) -> List[Tuple[int, Dict[str, str]]]:
+        """
+        Return stored articles in the order they were first saved, starting after a row.
+
+        Rows never change once an article is saved, so a reader can page through the
+        store and later continue with the articles saved since.
+
+        Args:
+            row (int): Row of the last article read before. Default is 0, the first article.
+            limit (int): Maximum number of articles. Default is 1000.
+
+        Returns:
+            List[Tuple[int, Dict[str, str]]]: Row and article with its language, in row order.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT rowid, title, url, published_at, language FROM articles "
+                "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (row, limit),
+            ).fetchall()
+        return [(row["rowid"], {**self._article(row), "language": row["language"]}) for row in rows]
+
+    def unseen_articles(
+        self, topic: str, language: str, articles: Iterable[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """
+        Return the articles no earlier search for the topic has found, in their order.
+
+        Args:
+            topic (str): The searched topic, in any case.
+            language (str): The searched language.
+            articles (Iterable[Dict[str, str]]): Articles with title, URL, and publication date.
+
+        Returns:
+            List[Dict[str, str]]: The articles whose URL is new to the topic.
+        """
+        articles = list(articles)
+        with self._lock:
+            seen = {
+                row[0]
+                for row in self._connection.execute(
+                    "SELECT s.url FROM sightings s JOIN runs r ON r.id = s.run_id "
+                    "WHERE r.topic = ? AND r.language = ?",
+                    (topic.strip().lower(), language),
+                )
+            }
+        return [article for article in articles if article.get("url") not in seen]
+
+    def watch_state(self, topic: str, language: str) -> Tuple[Optional[str], Counter]:
+        """
+        Return the newest publication date and the entity counts of a watched topic.
+
+        Args:
+            topic (str): The watched topic, in any case.
+            language (str): The watched language.
+
+        Returns:
+            Tuple[Optional[str], Counter]: The newest publication date seen, None before the
+                                           first poll, and the entity counts so far.
+        """
+        key = (topic.strip().lower(), language)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT newest_published_at FROM watches WHERE topic = ? AND language = ?", key
+            ).fetchone()
+            entities = Counter(
+                dict(
+                    self._connection.execute(
+                        "SELECT entity, count FROM watch_entities "
+                        "WHERE topic = ? AND language = ?",
+                        key,
+                    ).fetchall()
+                )
+            )
+        return (row[0] if row else None), entities
+
+    def update_watch(
+        self,
+        topic: str,
+        language: str,
+        *,
+        newest_published_at: Optional[str],
+        entities: Counter,
+    ) -> None:
+        """
+        Record a poll of a watched topic and add the entities of its new articles.
+
+        Args:
+            topic (str): The watched topic, in any case.
+            language (str): The watched language.
+            newest_published_at (Optional[str]): Newest publication date seen so far.
+            entities (Counter): Entity counts of the new articles only.
+        """
+        key = (topic.strip().lower(), language)
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO watches VALUES (?, ?, ?, 1, ?) "
+                "ON CONFLICT (topic, language) DO UPDATE SET "
+                "newest_published_at = excluded.newest_published_at, "
+                "polls = polls + 1, updated_at = excluded.updated_at",
+                (*key, newest_published_at, now),
+            )
+            self._connection.executemany(
+                "INSERT INTO watch_entities VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (topic, language, entity) DO UPDATE SET count = count + excluded.count",
+                [(*key, entity, count) for entity, count in entities.items()],
+            )
+            self._connection.commit()
+
+    def run_articles(self, run_id: int) -> List[Dict[str, str]]:
+        """
+        Return the articles of a run in the order they were found.
+
+        Args:
+            run_id (int): The run.
+
+        Returns:
+            List[Dict[str, str]]: Articles with title, URL, and publication date.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT a.title, a.url, a.published_at FROM sightings s "
+                "JOIN articles a ON a.url = s.url WHERE s.run_id = ? ORDER BY s.rank",
+                (run_id,),
+            ).fetchall()
+        return [self._article(row) for row in rows]
+
+    def topics(self) -> List[Tuple[str, str, int, int]]:
+        """
+        Return every searched topic with its number of runs and distinct articles.
+
+        Returns:
+            List[Tuple[str, str, int, int]]: Topic, language, runs and articles, most searched first.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT r.topic, r.language, COUNT(DISTINCT r.id), COUNT(DISTINCT s.url) "
+                "FROM runs r LEFT JOIN sightings s ON s.run_id = r.id "
+                "GROUP BY r.topic, r.language ORDER BY COUNT(DISTINCT r.id) DESC, r.topic"
+            ).fetchall()
+        return [tuple(row) for row in rows]  # type: ignore[misc]
+
+    def export_csv(
+        self,
+        save_file: Path,
+        *,
+        run_id: Optional[int] = None,
+        topic: Optional[str] = None,
+    ) -> int:
+        """
+        Write the articles of a run or a topic to a CSV file with a header row.
+
+        Args:
+            save_file (Path): The file to write.
+            run_id (Optional[int]): Export the articles of this run.
+            topic (Optional[str]): Export all articles found for this topic.
+
+        Returns:
+            int: The number of exported articles.
+
+        Raises:
+            ValueError: If neither run_id nor topic is given.
+        """
+        if run_id is not None:
+            articles = self.run_articles(run_id)
+        elif topic is not None:
+            articles = self.articles_for_topic(topic)
+        else:
+            raise ValueError("Pass a run_id or a topic to export")
+        with open(save_file, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=ARTICLE_FIELDS)
+            writer.writeheader()
+            writer.writerows(articles)
+        return len(articles)
+
+    def is_imported(self, file: str) -> bool:
+        """Return whether a CSV file was imported before"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM imports WHERE file = ?", (file,)
+            ).fetchone()
+        return row is not None
+
+    def mark_imported(self, file: str, run_id: int) -> None:
+        """Remember that a CSV file was imported as a run"""
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO imports VALUES (?, ?)", (file, run_id))
+            self._connection.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of articles, runs and sightings and the size on disk.
+
+        Returns:
+            Dict[str, Any]: Articles, runs, sightings, topics and bytes.
+        """
+        with self._lock:
+            articles, runs, sightings, topics = self._connection.execute(
+                "SELECT (SELECT COUNT(*) FROM articles), (SELECT COUNT(*) FROM runs), "
+                "(SELECT COUNT(*) FROM sightings), (SELECT COUNT(DISTINCT topic) FROM runs)"
+            ).fetchone()
+        return {
+            "articles": articles,
+            "runs": runs,
+            "sightings": sightings,
+            "topics": topics,
+            "bytes": self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _article(row: sqlite3.Row) -> Dict[str, str]:
+        """Convert a database row to an article dictionary"""
+        return {"title": row["title"], "url": row["url"], "publishedAt": row["published_at"]}
+
+
+def _search_terms(text: str) -> List[str]:
+    """Split search text into quoted phrases and single words"""
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|([^\s"]+)', text):
+        term = " ".join(re.findall(r"\w+", phrase or word))
+        if term:
+            terms.append(term)
+    return terms
+
+
+def build_match_query(text: str, *, any_term: bool = False) -> str:
+    """
+    Turn search words and quoted phrases into an FTS5 query.
+
+    Every word and phrase is quoted, so operators and punctuation typed by the user are
+    searched as text instead of being parsed as query syntax.
+
+    Args:
+        text (str): Search words and quoted phrases, such as '"elon musk" starship'.
+        any_term (bool): Match articles containing any term instead of all. Default is False.
+
+    Returns:
+        str: The FTS5 query, empty if the text has no words.
+    """
+    return (" OR " if any_term else " ").join(f'"{term}"' for term in _search_terms(text))
+
+
+def parse_history_filename(path: Path) -> Tuple[str, str, Optional[datetime]]:
+    """
+    Read topic, language and search time from the name of a saved CSV file.
+
+    Args:
+        path (Path): A file named <topic>_articles_<language>_<YYYYmmdd_HHMMSS>.csv.
+
+    Returns:
+        Tuple[str, str, Optional[datetime]]: Topic with spaces, language and time of the search.
+                                             Unknown names give the file stem, "en" and None.
+    """
+    match = HISTORY_FILENAME.match(Path(path).stem)
+    if match is None:
+        return Path(path).stem, "en", None
+    topic = re.sub(r"_+", " ", match["topic"]).strip()
+    return topic, match["language"], datetime.strptime(match["stamp"], "%Y%m%d_%H%M%S")
+
+
+def import_history_csvs(store: HistoryStore, folder: Path) -> ImportReport:
+    """
+    Import CSV files from the history folder, one run per file.
+
+    Files are remembered by name, so running the importer again only imports new files.
+
+    Args:
+        store (HistoryStore): The store to import into.
+        folder (Path): The history folder.
+
+    Returns:
+        ImportReport: Imported and skipped files and the number of imported articles.
+    """
+    files = skipped = articles = 0
+    for path in sorted(Path(folder).glob("*.csv")):
+        if store.is_imported(path.name):
+            skipped += 1
+            continue
+        topic, language, started_at = parse_history_filename(path)
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            rows = filter_removed_articles(
+                {field: row.get(field) or "" for field in ARTICLE_FIELDS}
+                for row in csv.DictReader(csv_file)
+            )
+        run_id = store.start_run(topic, language, source="import", started_at=started_at)
+        articles += store.add_articles(run_id, rows, language=language)
+        store.mark_imported(path.name, run_id)
+        files += 1
+    return ImportReport(files, skipped, articles)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    store = HistoryStore(Path("history/history.sqlite"))
+    report = import_history_csvs(store, Path("history"))
+    print(f"Imported {report.files} files with {report.articles} articles, skipped {report.skipped}")
+    for topic, language, runs, count in store.topics():
+        print(f"{topic} ({language}): {runs} runs, {count} articles")
+    print(store.stats())
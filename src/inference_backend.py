@@ -0,0 +1,235 @@
+"""
+inference_backend.py
+
+This module loads summarization pipelines on one of several CPU inference backends. The
+default torch backend runs the fp32 model exactly as HuggingFacePipeline.from_model_id does.
+The torch-int8 backend applies dynamic quantization to the linear layers, which store their
+weights as int8 and quantize activations on the fly, roughly quartering their memory and
+speeding up the matrix multiplications on CPUs with int8 instructions. The onnx backend
+exports the model to an ONNX graph once, keeps the export on disk and runs it with ONNX
+Runtime. Every backend returns a HuggingFacePipeline, so summarizing, batching and streaming
+work the same on all of them.
+
+Functions:
+    - configure_threads: Sets the intra-op and inter-op thread counts of torch.
+    - onnx_session_options: Builds ONNX Runtime session options with the thread counts.
+    - onnx_export_dir: Returns the folder an ONNX export of a model is kept in.
+    - missing_backend_packages: Returns the packages a backend needs that are not installed.
+    - load_backend_pipeline: Loads a summarization pipeline on the selected backend.
+
+Example Usage:
+    hf_llm = load_backend_pipeline(
+        "facebook/bart-large-cnn",
+        {"max_length": 100, "min_length": 30, "do_sample": False},
+        backend="torch-int8",
+        intra_op_threads=4,
+    )
+    print(hf_llm.invoke("Some long text to summarize"))
+"""
+
+# Import Relevant Packages
+# torch, transformers, optimum and ONNX Runtime are imported by the backends using them
+import importlib.util
+import re
+import warnings
+from pathlib import Path
+
+# Type Hints
+from typing import Any, Dict, List, Optional, Tuple
+
+BACKENDS = ("torch", "torch-int8", "onnx")
+DEFAULT_ONNX_DIR = Path("history/.cache/onnx")
+# Packages beyond torch and transformers, which requirements.txt installs
+BACKEND_PACKAGES: Dict[str, Tuple[str, ...]] = {"onnx": ("optimum", "onnxruntime")}
+
+
+def configure_threads(
+    intra_op_threads: Optional[int] = None, inter_op_threads: Optional[int] = None
+) -> None:
+    """
+    Set the number of threads torch uses within and across operators.
+
+    Torch only accepts the inter-op thread count before its first parallel operation, so a
+    later change is skipped with a warning.
+
+    Args:
+        intra_op_threads (Optional[int]): Threads of a single operator, such as a matrix multiplication. Default is the torch default.
+        inter_op_threads (Optional[int]): Threads running independent operators in parallel. Default is the torch default.
+    """
+    if not intra_op_threads and not inter_op_threads:
+        return
+    import torch
+
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if inter_op_threads and torch.get_num_interop_threads() != inter_op_threads:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError:
+            warnings.warn(
+                "torch has already started parallel work, inter-op threads are left at "
+                f"{torch.get_num_interop_threads()}"
+            )
+
+
+def onnx_session_options(
+    intra_op_threads: Optional[int] = None, inter_op_threads: Optional[int] = None
+) -> Any:
+    """
+    Build ONNX Runtime session options using the given thread counts.
+
+    Args:
+        intra_op_threads (Optional[int]): Threads of a single operator. Default is one per physical core.
+        inter_op_threads (Optional[int]): Threads running independent operators. With more than one, operators run in parallel.
+
+    Returns:
+        onnxruntime.SessionOptions: The session options.
+    """
+    import onnxruntime  # type: ignore[import-untyped]
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if intra_op_threads:
+        options.intra_op_num_threads = intra_op_threads
+    if inter_op_threads:
+        options.inter_op_num_threads = inter_op_threads
+        if inter_op_threads > 1:
+            options.execution_mode = onnxruntime.ExecutionMode.ORT_PARALLEL
+    return options
+
+
+def onnx_export_dir(model_id: str, root: Path = DEFAULT_ONNX_DIR) -> Path:
+    """
+    Return the folder the ONNX export of a model is kept in.
+
+    Args:
+        model_id (str): The model ID for the Hugging Face pipeline.
+        root (Path): Folder holding all exports. Default is history/.cache/onnx.
+
+    Returns:
+        Path: The export folder of the model, such as history/.cache/onnx/facebook--bart-large-cnn.
+    """
+    return root / re.sub(r"[^\w.-]+", "--", model_id)
+
+
+def missing_backend_packages(backend: str) -> List[str]:
+    """
+    Return the packages a backend needs that are not installed, without importing them.
+
+    Args:
+        backend (str): One of "torch", "torch-int8" or "onnx".
+
+    Returns:
+        List[str]: Names of the missing packages, empty if the backend can be loaded.
+    """
+    return [
+        package
+        for package in BACKEND_PACKAGES.get(backend, ())
+        if importlib.util.find_spec(package) is None
+    ]
+
+
+def load_backend_pipeline(
+    model_id: str,
+    pipeline_kwargs: Dict[str, Any],
+    *,
+    backend: str = "torch",
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+    onnx_dir: Path = DEFAULT_ONNX_DIR,
+) -> Any:
+    """
+    Load a summarization pipeline on the selected inference backend.
+
+    Args:
+        model_id (str): The model ID for the Hugging Face pipeline.
+        pipeline_kwargs (Dict[str, Any]): Keyword arguments passed to the pipeline.
+        backend (str): One of "torch", "torch-int8" or "onnx". Default is "torch".
+        intra_op_threads (Optional[int]): Threads of a single operator. Default is the runtime default.
+        inter_op_threads (Optional[int]): Threads running independent operators. Default is the runtime default.
+        onnx_dir (Path): Folder keeping ONNX exports between runs. Default is history/.cache/onnx.
+
+    Returns:
+        HuggingFacePipeline: The loaded pipeline.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the onnx backend is selected without optimum and onnxruntime installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend >>{backend}<<, use one of {', '.join(BACKENDS)}")
+
+    if backend == "onnx":
+        model, tokenizer = _load_onnx_model(
+            model_id, onnx_export_dir(model_id, onnx_dir), intra_op_threads, inter_op_threads
+        )
+    else:
+        configure_threads(intra_op_threads, inter_op_threads)
+        if backend == "torch":
+            from src.model_registry import load_summarization_pipeline
+
+            return load_summarization_pipeline(model_id, pipeline_kwargs)
+        model, tokenizer = _load_int8_model(model_id)
+
+    from langchain_huggingface import HuggingFacePipeline
+    from transformers import pipeline  # type: ignore[import-untyped]
+
+    return HuggingFacePipeline(
+        pipeline=pipeline(
+            "summarization", model=model, tokenizer=tokenizer, **pipeline_kwargs
+        ),
+        model_id=model_id,
+        pipeline_kwargs=dict(pipeline_kwargs),
+    )
+
+
+def _load_int8_model(model_id: str) -> Any:
+    """Load the fp32 model and quantize its linear layers to int8"""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer  # type: ignore[import-untyped]
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_id).eval()
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    return quantized, AutoTokenizer.from_pretrained(model_id)
+
+
+def _load_onnx_model(
+    model_id: str,
+    export_dir: Path,
+    intra_op_threads: Optional[int],
+    inter_op_threads: Optional[int],
+) -> Any:
+    """Load the ONNX export of a model, exporting it on first use"""
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "The onnx backend needs optimum and onnxruntime: pip install optimum[onnxruntime]"
+        ) from e
+    from transformers import AutoTokenizer  # type: ignore[import-untyped]
+
+    options = onnx_session_options(intra_op_threads, inter_op_threads)
+    if not (export_dir / "config.json").exists():
+        exported = ORTModelForSeq2SeqLM.from_pretrained(model_id, export=True)
+        exported.save_pretrained(export_dir)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(export_dir)
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        export_dir, session_options=options, provider="CPUExecutionProvider"
+    )
+    return model, AutoTokenizer.from_pretrained(export_dir)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    content = """SpaceX launches Starship on its fifth test flight
+    Starship booster is caught by the launch tower for the first time
+    FAA clears SpaceX for the next Starship launch"""
+    for backend in BACKENDS:
+        hf_llm = load_backend_pipeline(
+            "facebook/bart-large-cnn",
+            {"max_length": 60, "min_length": 10, "do_sample": False},
+            backend=backend,
+        )
+        print(f"{backend}: {hf_llm.invoke(content)}")
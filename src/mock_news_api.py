@@ -0,0 +1,475 @@
+"""
+mock_news_api.py
+
+This module provides a local stand-in for the NewsAPI /v2/everything endpoint. It serves a
+synthetic or recorded corpus over HTTP with the same parameters (q, language, sortBy, from,
+to, page and pageSize), the same JSON bodies and the same error status codes as the real API,
+so the application can be run end to end, load tested and benchmarked without a key or
+network access. Latency, failing requests and a request quota can be configured to make
+slow or throttled runs reproducible.
+
+Queries support quoted phrases, AND, OR, NOT and the + and - prefixes. Articles match when
+the terms appear in their title or description. Articles without a language match every
+language.
+
+Classes:
+    - MockNewsApiServer: Serves a corpus like NewsAPI on a background thread.
+
+Functions:
+    - parse_query: Splits a NewsAPI query into alternatives of required and excluded terms.
+    - load_corpus: Loads a synthetic corpus, a history store, saved CSV files or recorded JSON.
+    - main: Command line entry point running the server in the foreground.
+
+Example Usage:
+    with MockNewsApiServer(load_corpus("synthetic", size=10_000), latency=0.05) as server:
+        articles = search_news_articles("spacex", "any-key", url=server.url)
+        print(len(articles), server.stats())
+
+    python -m src.mock_news_api --corpus synthetic --size 100000 --port 8765 --latency-ms 50
+"""
+
+# Import Relevant Packages
+import argparse
+import csv
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Import Article Corpora
+from src.corpus import generate_articles, load_history_articles
+
+# Type Hints
+from typing import Any, Dict, List, Optional, Tuple
+
+ENDPOINT = "/v2/everything"
+MAX_PAGE_SIZE = 100
+SORT_TYPES = ("relevancy", "popularity", "publishedAt")
+QUERY_CACHE_SIZE = 128  # Distinct searches kept, so paging through results does not rescan
+
+# Alternatives of (required terms, excluded terms)
+Query = List[Tuple[List[str], List[str]]]
+
+
+def parse_query(q: str) -> Query:
+    """
+    Split a NewsAPI query into alternatives of required and excluded terms.
+
+    Terms joined by OR form separate alternatives. Within an alternative every term is
+    required, except terms prefixed with - or preceded by NOT, which must not appear.
+    Parentheses are ignored, so nested groups are flattened.
+
+    Args:
+        q (str): The query, such as '"elon musk" +spacex -tesla'.
+
+    Returns:
+        Query: Alternatives of lowercased required and excluded terms.
+    """
+    alternatives: Query = [([], [])]
+    exclude_next = False
+    for phrase, word in re.findall(r'"([^"]*)"|([^\s"()]+)', q):
+        if word in ("AND", "&&"):
+            continue
+        if word in ("OR", "||"):
+            alternatives.append(([], []))
+            continue
+        if word == "NOT":
+            exclude_next = True
+            continue
+        excluded = exclude_next or word.startswith("-")
+        term = " ".join(re.findall(r"\w+", (phrase or word).lower()))
+        exclude_next = False
+        if term:
+            alternatives[-1][1 if excluded else 0].append(term)
+    return [alternative for alternative in alternatives if alternative[0] or alternative[1]]
+
+
+def _error(status: int, code: str, message: str) -> Tuple[int, Dict[str, Any]]:
+    """Return a NewsAPI error response"""
+    return status, {"status": "error", "code": code, "message": message}
+
+
+class MockNewsApiServer:
+    def __init__(
+        self,
+        articles: List[Dict[str, Any]],
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: Optional[str] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        max_requests: Optional[int] = None,
+        retry_after: int = 1,
+        seed: int = 0,
+    ) -> None:
+        """
+        Prepare a server for a corpus. Nothing is served until start is called.
+
+        Args:
+            articles (List[Dict[str, Any]]): Articles with title, URL, publication date and optionally description and language.
+            host (str): Interface to listen on. Defaults to "127.0.0.1".
+            port (int): Port to listen on. Defaults to 0, any free port.
+            api_key (Optional[str]): The only accepted key. Defaults to None, accepting any non-empty key.
+            latency (float): Seconds every response is delayed. Defaults to 0.
+            jitter (float): Up to this many seconds are randomly added to the latency. Defaults to 0.
+            error_rate (float): Share of requests answered with 500. Defaults to 0.
+            max_requests (Optional[int]): Requests answered before every further one gets 429. Defaults to no limit.
+            retry_after (int): Seconds sent in the Retry-After header of 429 responses. Defaults to 1.
+            seed (int): Seed of the latency jitter and the failing requests. Defaults to 0.
+        """
+        # Newest first, which is also the order of sortBy=publishedAt
+        self.articles = sorted(
+            articles, key=lambda article: article.get("publishedAt") or "", reverse=True
+        )
+        self._texts = [
+            f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+            for article in self.articles
+        ]
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.max_requests = max_requests
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._statuses: Counter = Counter()
+        self._results: "OrderedDict[Tuple[Any, ...], List[int]]" = OrderedDict()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the /v2/everything endpoint, pass it as url to the search functions"""
+        return f"http://{self.host}:{self.port}{ENDPOINT}"
+
+    def start(self) -> "MockNewsApiServer":
+        """
+        Start serving on a background thread.
+
+        Returns:
+            MockNewsApiServer: The server, with port set to the port it listens on.
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the pooled client expects
+
+            def do_GET(self) -> None:
+                request = urlparse(self.path)
+                params = {key: values[-1] for key, values in parse_qs(request.query).items()}
+                params.setdefault("apiKey", self.headers.get("X-Api-Key", ""))
+                status, body, headers = server.respond(request.path, params)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass  # Keep the console free for the application
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-news-api", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockNewsApiServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def respond(
+        self, path: str, params: Dict[str, str]
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        Answer one request like NewsAPI, after the configured latency.
+
+        Args:
+            path (str): The requested path.
+            params (Dict[str, str]): The query parameters, including apiKey.
+
+        Returns:
+            Tuple[int, Dict[str, Any], Dict[str, str]]: Status code, JSON body and extra headers.
+        """
+        with self._lock:
+            self._requests += 1
+            count = self._requests
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        headers: Dict[str, str] = {}
+        if path.rstrip("/") != ENDPOINT:
+            status, body = _error(404, "routeNotFound", f"Only {ENDPOINT} is served.")
+        elif not params.get("apiKey"):
+            status, body = _error(401, "apiKeyMissing", "Your API key is missing.")
+        elif self.api_key is not None and params["apiKey"] != self.api_key:
+            status, body = _error(401, "apiKeyInvalid", "Your API key is invalid or incorrect.")
+        elif self.max_requests is not None and count > self.max_requests:
+            status, body = _error(429, "rateLimited", "You have made too many requests.")
+            headers["Retry-After"] = str(self.retry_after)
+        elif fail:
+            status, body = _error(500, "unexpectedError", "This shouldn't happen, try again.")
+        else:
+            status, body = self.everything(params)
+
+        with self._lock:
+            self._statuses[status] += 1
+        return status, body, headers
+
+    def everything(self, params: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Answer a valid /v2/everything request.
+
+        Args:
+            params (Dict[str, str]): q, language, sortBy, from, page and pageSize.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: Status code and JSON body.
+        """
+        if not params.get("q"):
+            return _error(400, "parametersMissing", "Required parameters are missing: q.")
+        sort_by = params.get("sortBy") or "publishedAt"
+        if sort_by not in SORT_TYPES:
+            return _error(400, "parameterInvalid", f"sortBy must be one of {', '.join(SORT_TYPES)}.")
+        try:
+            page = int(params.get("page") or 1)
+            page_size = int(params.get("pageSize") or MAX_PAGE_SIZE)
+        except ValueError:
+            return _error(400, "parameterInvalid", "page and pageSize must be numbers.")
+        if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+            return _error(
+                400, "parameterInvalid", f"page must be positive and pageSize 1 to {MAX_PAGE_SIZE}."
+            )
+
+        # Dates may be sent as "YYYY-MM-DD HH:MM:SS", publication dates use "T"
+        from_date = (params.get("from") or "").replace(" ", "T") or None
+        to_date = (params.get("to") or "").replace(" ", "T") or None
+        matches = self._search(
+            params["q"], params.get("language") or None, from_date, sort_by, to_date
+        )
+        start = (page - 1) * page_size
+        return 200, {
+            "status": "ok",
+            "totalResults": len(matches),
+            "articles": [
+                self._response_article(self.articles[index])
+                for index in matches[start : start + page_size]
+            ],
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of requests and how they were answered.
+
+        Returns:
+            Dict[str, Any]: Articles served, requests and the count per status code.
+        """
+        with self._lock:
+            return {
+                "articles": len(self.articles),
+                "requests": self._requests,
+                "statuses": dict(sorted(self._statuses.items())),
+            }
+
+    def _search(
+        self,
+        q: str,
+        language: Optional[str],
+        from_date: Optional[str],
+        sort_by: str,
+        to_date: Optional[str] = None,
+    ) -> List[int]:
+        """Return the indices of matching articles in result order, cached per search"""
+        key = (q, language, from_date, sort_by, to_date)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+        alternatives = [
+            (
+                [re.compile(rf"\b{re.escape(term)}\b") for term in required],
+                [re.compile(rf"\b{re.escape(term)}\b") for term in excluded],
+            )
+            for required, excluded in parse_query(q)
+        ]
+        scores: Dict[int, int] = {}
+        for index, (article, text) in enumerate(zip(self.articles, self._texts)):
+            if language and article.get("language") not in (None, language):
+                continue
+            if from_date and (article.get("publishedAt") or "") < from_date:
+                continue
+            # The end date includes its last second, publication dates end with a Z
+            if to_date and (article.get("publishedAt") or "")[: len(to_date)] > to_date:
+                continue
+            for required, excluded in alternatives:
+                if all(pattern.search(text) for pattern in required) and not any(
+                    pattern.search(text) for pattern in excluded
+                ):
+                    scores[index] = sum(len(pattern.findall(text)) for pattern in required)
+                    break
+
+        matches = list(scores)  # Newest first
+        if sort_by == "relevancy":
+            matches.sort(key=lambda index: -scores[index])
+        elif sort_by == "popularity":
+            # Stand-in for share counts: a stable order that differs from the other two
+            matches.sort(
+                key=lambda index: zlib.crc32(str(self.articles[index].get("url")).encode()) % 1000
+            )
+
+        with self._lock:
+            self._results[key] = matches
+            if len(self._results) > QUERY_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return matches
+
+    @staticmethod
+    def _response_article(article: Dict[str, Any]) -> Dict[str, Any]:
+        """Return an article with all fields of a NewsAPI result"""
+        return {
+            "source": article.get("source") or {"id": None, "name": "Mock News"},
+            "author": article.get("author"),
+            "title": article.get("title"),
+            "description": article.get("description"),
+            "url": article.get("url"),
+            "urlToImage": article.get("urlToImage"),
+            "publishedAt": article.get("publishedAt"),
+            "content": article.get("content"),
+        }
+
+
+def load_corpus(source: str, *, size: int = 10_000, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Load the articles to serve.
+
+    Args:
+        source (str): "synthetic" for a generated corpus, or the path of a history store
+                      (.sqlite), a saved CSV file, a folder of saved CSV files or a JSON file
+                      with recorded NewsAPI responses or a list of articles.
+        size (int): Number of synthetic articles. Default is 10,000.
+        seed (int): Seed of the synthetic corpus. Default is 0.
+
+    Returns:
+        List[Dict[str, Any]]: The articles.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+        ValueError: If the file type is not supported.
+    """
+    if source == "synthetic":
+        return generate_articles(size, seed=seed)
+
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"No corpus at Path('{path}')")
+    if path.is_dir():
+        return load_history_articles(path)
+    if path.suffix == ".csv":
+        return _read_csv(path)
+    if path.suffix in (".sqlite", ".db"):
+        from src.history_store import HistoryStore
+
+        store = HistoryStore(path)
+        try:
+            return store.all_articles()
+        finally:
+            store.close()
+    if path.suffix == ".json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        responses = data if isinstance(data, list) else [data]
+        articles: List[Dict[str, Any]] = []
+        for item in responses:
+            # Either a recorded response holding articles, or an article itself
+            articles.extend(item.get("articles", [item]) if isinstance(item, dict) else [])
+        return articles
+    raise ValueError(f"Unsupported corpus Path('{path}'), use .sqlite, .csv, .json or a folder")
+
+
+def _read_csv(path: Path) -> List[Dict[str, str]]:
+    """Return the rows of a single saved CSV file"""
+    with open(path, newline="", encoding="utf-8") as csv_file:
+        return [
+            {
+                "title": row.get("title") or "",
+                "url": row.get("url") or "",
+                "publishedAt": row.get("publishedAt") or "",
+            }
+            for row in csv.DictReader(csv_file)
+        ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the server in the foreground until interrupted.
+
+    Args:
+        argv (Optional[List[str]]): Arguments to parse. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Local NewsAPI stand-in")
+    parser.add_argument("--corpus", default="synthetic", help="'synthetic' or a .sqlite, .csv, .json file or folder")
+    parser.add_argument("--size", type=int, default=10_000, help="Number of synthetic articles")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the corpus, latency jitter and errors")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--api-key", help="The only accepted key. Default accepts any key")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay of every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra delay of up to this much")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 500")
+    parser.add_argument("--max-requests", type=int, help="Answer 429 after this many requests")
+    args = parser.parse_args(argv)
+
+    server = MockNewsApiServer(
+        load_corpus(args.corpus, size=args.size, seed=args.seed),
+        host=args.host,
+        port=args.port,
+        api_key=args.api_key,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        max_requests=args.max_requests,
+        seed=args.seed,
+    ).start()
+    print(f"Serving {len(server.articles)} articles at {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"\n{server.stats()}")
+
+
+# Example Usage:
+if __name__ == "__main__":
+    main()
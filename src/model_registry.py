@@ -0,0 +1,367 @@
+"""
+model_registry.py
+
+This module provides a process-wide registry for Hugging Face summarization pipelines.
+Loading a model such as facebook/bart-large-cnn takes seconds and more than a gigabyte of
+memory, so pipelines are loaded once, kept in memory and reused on every query. The registry
+is keyed by model ID plus pipeline kwargs and evicts the least recently used pipeline when
+either the model count or the configured memory budget is exceeded.
+
+Classes:
+    - RegistryStats: Hit, miss, eviction and load-time counters of a registry.
+    - ModelRegistry: LRU registry of loaded Hugging Face pipelines.
+
+Functions:
+    - make_registry_key: Builds the hashable registry key for a model ID and pipeline kwargs.
+    - load_summarization_pipeline: Loads a summarization pipeline through LangChain.
+    - estimate_model_bytes: Estimates the memory a loaded pipeline occupies.
+    - release_model: Drops a pipeline and returns its memory to the allocator.
+    - get_model_registry: Returns the process-wide registry.
+    - configure_model_registry: Replaces the process-wide registry with new limits and backend.
+
+Example Usage:
+    registry = get_model_registry()
+    hf_llm = registry.get("facebook/bart-large-cnn", {"max_length": 100, "min_length": 30})
+    print(hf_llm.invoke("Some long text to summarize"))
+    print(registry.stats())
+"""
+
+# Import Relevant Packages
+import gc
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from functools import partial
+from pathlib import Path
+
+# Import Inference Backends
+from src.inference_backend import BACKENDS, DEFAULT_ONNX_DIR, load_backend_pipeline
+
+# Type Hints
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
+from typing import TypeAlias, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_huggingface import HuggingFacePipeline
+
+# Type Aliases
+RegistryKey: TypeAlias = Tuple[str, Tuple[Tuple[str, Any], ...]]
+Loader: TypeAlias = Callable[[str, Dict[str, Any]], Any]
+
+
+@dataclass
+class RegistryStats:
+    """Counters describing how a registry has been used"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    load_time: float = 0.0  # Total seconds spent loading models
+    last_load_time: float = 0.0  # Seconds spent on the most recent load
+
+
+def make_registry_key(model_id: str, pipeline_kwargs: Mapping[str, Any]) -> RegistryKey:
+    """
+    Build a hashable registry key from a model ID and its pipeline kwargs.
+
+    Args:
+        model_id (str): The model ID for the Hugging Face pipeline.
+        pipeline_kwargs (Mapping[str, Any]): Keyword arguments the pipeline is built with.
+
+    Returns:
+        RegistryKey: A tuple of the model ID and the sorted kwargs items.
+    """
+    return (model_id, tuple(sorted(pipeline_kwargs.items())))
+
+
+def load_summarization_pipeline(
+    model_id: str, pipeline_kwargs: Dict[str, Any]
+) -> "HuggingFacePipeline":
+    """
+    Load a summarization pipeline through LangChain's Hugging Face integration.
+    LangChain, transformers and torch are imported here rather than at module load,
+    as importing them takes seconds.
+
+    Args:
+        model_id (str): The model ID for the Hugging Face pipeline.
+        pipeline_kwargs (Dict[str, Any]): Keyword arguments passed to the pipeline.
+
+    Returns:
+        HuggingFacePipeline: The loaded pipeline.
+    """
+    from langchain_huggingface import HuggingFacePipeline
+
+    return HuggingFacePipeline.from_model_id(
+        model_id=model_id,
+        task="summarization",
+        pipeline_kwargs=dict(pipeline_kwargs),
+    )
+
+
+def estimate_model_bytes(hf_llm: Any) -> int:
+    """
+    Estimate the memory held by the parameters and buffers of a loaded pipeline.
+
+    Args:
+        hf_llm (Any): A loaded pipeline, usually a HuggingFacePipeline.
+
+    Returns:
+        int: Estimated size in bytes, or 0 if the size can not be determined.
+    """
+    model = getattr(getattr(hf_llm, "pipeline", None), "model", None)
+    if model is None:
+        return 0
+    # ONNX Runtime models hold their weights in the exported graph files
+    save_dir = getattr(model, "model_save_dir", None)
+    if save_dir is not None and not hasattr(model, "state_dict"):
+        return sum(path.stat().st_size for path in Path(save_dir).glob("*.onnx*"))
+    try:
+        # The state dict includes the packed int8 weights of quantized layers, which are
+        # not listed as parameters, but also lists tied weights once per name using them
+        seen: Set[int] = set()
+        return sum(_tensor_bytes(value, seen) for value in model.state_dict().values())
+    except Exception:
+        return 0
+
+
+def _tensor_bytes(value: Any, seen: Set[int]) -> int:
+    """Return the bytes of a tensor, or of the tensors in packed parameters, not counted yet"""
+    if isinstance(value, (tuple, list)):
+        return sum(_tensor_bytes(item, seen) for item in value)
+    try:
+        size = value.numel() * value.element_size()
+    except Exception:
+        return 0
+    try:
+        storage = value.data_ptr()
+    except Exception:
+        storage = id(value)
+    if storage in seen:
+        return 0
+    seen.add(storage)
+    return size
+
+
+def release_model(hf_llm: Any) -> None:
+    """
+    Release a pipeline so its memory can be reclaimed.
+
+    The pipeline's model and tokenizer references are dropped, the garbage collector is run
+    and, if torch is already imported, the CUDA cache is emptied as well.
+
+    Args:
+        hf_llm (Any): The pipeline to release.
+    """
+    pipeline = getattr(hf_llm, "pipeline", None)
+    if pipeline is not None:
+        for attribute in ("model", "tokenizer"):
+            try:
+                setattr(pipeline, attribute, None)
+            except Exception:
+                pass
+    del hf_llm
+    gc.collect()
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+class ModelRegistry:
+    def __init__(
+        self,
+        *,
+        max_models: int = 2,
+        memory_budget_mb: Optional[float] = None,
+        loader: Loader = load_summarization_pipeline,
+        sizer: Callable[[Any], int] = estimate_model_bytes,
+        backend: str = "torch",
+    ) -> None:
+        """
+        Initialize an empty registry
+
+        Args:
+            max_models (int): Maximum number of pipelines kept in memory. Defaults to 2.
+            memory_budget_mb (Optional[float]): Maximum estimated memory of all kept pipelines
+                in megabytes. None disables the budget. Defaults to None.
+            loader (Loader): Callable that loads a pipeline from a model ID and pipeline kwargs.
+            sizer (Callable[[Any], int]): Callable that estimates the size of a pipeline in bytes.
+            backend (str): Name of the inference backend the loader uses. Defaults to "torch".
+        """
+        self.max_models = max(1, max_models)
+        self.memory_budget_bytes: Optional[int] = (
+            int(memory_budget_mb * 1024 * 1024) if memory_budget_mb else None
+        )
+        self.loader = loader
+        self.sizer = sizer
+        self.backend = backend
+        self._entries: "OrderedDict[RegistryKey, Tuple[Any, int]]" = OrderedDict()
+        self._stats = RegistryStats()
+        self._lock = threading.RLock()
+
+    def __contains__(self, key: RegistryKey) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model_id: str, pipeline_kwargs: Mapping[str, Any]) -> Any:
+        """
+        Return a loaded pipeline, loading it on the first request.
+
+        Loading happens while holding the registry lock, so concurrent callers asking for the
+        same model wait for one load instead of loading it twice.
+
+        Args:
+            model_id (str): The model ID for the Hugging Face pipeline.
+            pipeline_kwargs (Mapping[str, Any]): Keyword arguments passed to the pipeline.
+
+        Returns:
+            Any: The loaded pipeline.
+        """
+        key = make_registry_key(model_id, pipeline_kwargs)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return self._entries[key][0]
+
+            self._stats.misses += 1
+            start = time.perf_counter()
+            hf_llm = self.loader(model_id, dict(pipeline_kwargs))
+            elapsed = time.perf_counter() - start
+            self._stats.load_time += elapsed
+            self._stats.last_load_time = elapsed
+
+            self._entries[key] = (hf_llm, self.sizer(hf_llm))
+            self._enforce_limits(keep=key)
+            return hf_llm
+
+    def release(self, model_id: Optional[str] = None) -> int:
+        """
+        Evict pipelines from the registry and release their memory.
+
+        Args:
+            model_id (Optional[str]): Only release pipelines of this model ID. None releases all.
+
+        Returns:
+            int: The number of released pipelines.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if model_id is None or key[0] == model_id
+            ]
+            for key in keys:
+                self._evict(key)
+            return len(keys)
+
+    def memory_bytes(self) -> int:
+        """Return the estimated memory held by all kept pipelines"""
+        return sum(size for _, size in self._entries.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the registry counters together with its current occupancy.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, evictions, load times, loaded models and memory.
+        """
+        with self._lock:
+            stats = asdict(self._stats)
+            stats["backend"] = self.backend
+            stats["models"] = [key[0] for key in self._entries]
+            stats["memory_mb"] = round(self.memory_bytes() / (1024 * 1024), 1)
+            return stats
+
+    def _enforce_limits(self, keep: RegistryKey) -> None:
+        """Evict least recently used pipelines until count and memory fit the limits"""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_models
+            or (
+                self.memory_budget_bytes is not None
+                and self.memory_bytes() > self.memory_budget_bytes
+            )
+        ):
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self._evict(oldest)
+
+    def _evict(self, key: RegistryKey) -> None:
+        """Remove one pipeline from the registry and release it"""
+        hf_llm, _ = self._entries.pop(key)
+        self._stats.evictions += 1
+        release_model(hf_llm)
+
+
+# Process-wide Registry shared by all Summarization Calls
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Return the process-wide model registry.
+
+    Returns:
+        ModelRegistry: The shared registry.
+    """
+    return _registry
+
+
+def configure_model_registry(
+    *,
+    max_models: int = 2,
+    memory_budget_mb: Optional[float] = None,
+    backend: str = "torch",
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+    onnx_dir: Path = DEFAULT_ONNX_DIR,
+) -> ModelRegistry:
+    """
+    Replace the process-wide registry with one using the given limits and backend.
+
+    Pipelines held by the previous registry are released.
+
+    Args:
+        max_models (int): Maximum number of pipelines kept in memory. Defaults to 2.
+        memory_budget_mb (Optional[float]): Memory budget in megabytes. Defaults to None.
+        backend (str): Inference backend, one of "torch", "torch-int8" or "onnx". Defaults to "torch".
+        intra_op_threads (Optional[int]): Threads of a single operator. Defaults to the runtime default.
+        inter_op_threads (Optional[int]): Threads running independent operators. Defaults to the runtime default.
+        onnx_dir (Path): Folder keeping ONNX exports between runs. Defaults to history/.cache/onnx.
+
+    Returns:
+        ModelRegistry: The new shared registry.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend >>{backend}<<, use one of {', '.join(BACKENDS)}")
+    global _registry
+    _registry.release()
+    _registry = ModelRegistry(
+        max_models=max_models,
+        memory_budget_mb=memory_budget_mb,
+        loader=partial(
+            load_backend_pipeline,
+            backend=backend,
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=inter_op_threads,
+            onnx_dir=onnx_dir,
+        ),
+        backend=backend,
+    )
+    return _registry
+
+
+# Example Usage:
+if __name__ == "__main__":
+    registry = get_model_registry()
+    kwargs = {"max_length": 100, "min_length": 30, "do_sample": False}
+    hf_llm = registry.get("facebook/bart-large-cnn", kwargs)
+    hf_llm = registry.get("facebook/bart-large-cnn", kwargs)
+    print(registry.stats())
@@ -0,0 +1,103 @@
+"""
+save_articles.py
+
+This module provides functions to filter search results and save them to the history folder
+as CSV files. They are shared by the interactive prompt and the batch mode.
+
+Constants:
+    - ARTICLE_FIELDS: Column order of saved article files.
+
+Functions:
+    - filter_removed_articles: Drops articles that were removed by their publisher.
+    - history_csv_path: Builds the timestamped CSV path for a topic, creating the folder if needed.
+    - save_articles_csv: Writes articles to a CSV file.
+
+Example Usage:
+    articles = filter_removed_articles(articles)
+    save_file = history_csv_path(Path("history"), "elon musk", "en")
+    save_articles_csv(articles, save_file)
+"""
+
+# Import Relevant Packages
+import csv
+import re
+from datetime import datetime
+from pathlib import Path
+
+# Type Hints
+from typing import Dict, Iterable, List, Optional
+
+# Column Order of saved Articles
+ARTICLE_FIELDS: List[str] = ["title", "url", "publishedAt"]
+
+
+def filter_removed_articles(articles: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    Drop articles whose URL marks them as removed.
+
+    Args:
+        articles (Iterable[Dict[str, str]]): Articles as returned by the search.
+
+    Returns:
+        List[Dict[str, str]]: The articles that were not removed.
+    """
+    return [article for article in articles if not "remove" in article["url"]]
+
+
+def history_csv_path(
+    folder: Path,
+    topic: str,
+    language: str,
+    timestamp: Optional[datetime] = None,
+) -> Path:
+    """
+    Build the CSV path for a search, creating the output folder if it does not exist.
+
+    Args:
+        folder (Path): The output folder.
+        topic (str): The searched topic. Special characters are removed.
+        language (str): The searched language.
+        timestamp (Optional[datetime]): Time of the search. Default is now.
+
+    Returns:
+        Path: The path of the form <topic>_articles_<language>_<YYYYmmdd_HHMMSS>.csv.
+    """
+    folder = Path(folder)
+    if not folder.exists():
+        print(f"Path:('{folder}') not found")
+        print(f"Making '{folder}'")
+        folder.mkdir(parents=True, exist_ok=True)
+    topic_alnum = re.sub(
+        r"[^a-zA-Z0-9\s]", "", topic
+    )  # Remove any speicals chars to avoid save issues
+    topic_alnum = topic_alnum.replace(" ", "_")
+    timestamp = timestamp or datetime.now()
+    return (
+        folder
+        / f"{topic_alnum.lower()}_articles_{language}_{timestamp.strftime('%Y%m%d_%H%M%S')}.csv"
+    )
+
+
+def save_articles_csv(articles: Iterable[Dict[str, str]], save_file: Path) -> None:
+    """
+    Write articles to a CSV file with a header row.
+
+    Args:
+        articles (Iterable[Dict[str, str]]): The articles to save.
+        save_file (Path): The file to write.
+    """
+    with open(save_file, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=ARTICLE_FIELDS)
+        writer.writeheader()
+        writer.writerows(articles)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    articles = [
+        {"title": "Kept", "url": "https://example.com/kept", "publishedAt": "2024-07-19T12:34:56Z"},
+        {"title": "[Removed]", "url": "https://removed.com", "publishedAt": "2024-07-19T12:34:56Z"},
+    ]
+    save_file = history_csv_path(Path("history"), "example topic", "en")
+    save_articles_csv(filter_removed_articles(articles), save_file)
+    print(f"Saved to {save_file}")
@@ -2,9 +2,15 @@
 search_news.py
 
 This module provides a function to search for news articles using the News API.
+Requests go through a pooled session with timeouts and retries (see src/utils/http_session.py).
 
 Functions:
     - search_news_articles: Searches for news articles related to the given topic using the News API and returns a list of articles.
+    - cached_search_news_articles: Same as search_news_articles, but served from a persistent response cache when possible.
+    - iter_news_pages: Fetches result pages concurrently and yields each page as soon as it arrives.
+    - iter_news_articles: Same as iter_news_pages, but yields single articles.
+    - cached_iter_news_pages: Same as iter_news_pages, but served from a persistent response cache when possible.
+    - news_api_url: Builds the endpoint URL from the news_api section of config.yaml.
 
 Example Usage:
     api_key = "your_news_api_key"
@@ -15,18 +21,44 @@ Example Usage:
 """
 
 # Import Relevant Packages
-import requests  # type: ignore[import-untyped]
-from datetime import datetime, timedelta
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from src.utils.get_keys import get_env
+from src.utils.http_session import PooledSession, get_session
+from src.utils.response_cache import ResponseCache
 
 # Type Hints
-from typing import Optional, List, Dict
+from typing import Any, Iterator, Optional, List, Dict, Tuple
 from typing import Literal, TypeAlias
 
 # Type Aliases
 Language: TypeAlias = Literal["en", "de"]
 
 
+def news_api_url(news_api_config: Dict[str, Any]) -> str:
+    """
+    Build the endpoint URL from the news_api section of config.yaml.
+
+    Args:
+        news_api_config (Dict[str, Any]): The news_api settings with base_url and endpoint.
+
+    Returns:
+        str: The endpoint URL, "https://newsapi.org/v2/everything" by default.
+    """
+    base_url = news_api_config.get("base_url", "https://newsapi.org/v2/")
+    return f"{base_url.rstrip('/')}/{news_api_config.get('endpoint', 'everything')}"
+
+
+def _format_date(date: Optional[datetime]) -> Optional[str]:
+    """Format a start or end date the way NewsAPI expects it, ISO 8601 in UTC"""
+    if date is None:
+        return None
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date.isoformat(timespec="seconds")
+
+
 def search_news_articles(
     topic: str,
     api_key: Optional[str],
@@ -35,6 +67,7 @@ def search_news_articles(
     url: Optional[str] = "https://newsapi.org/v2/everything",
     from_date: Optional[datetime] = None,
     sort_type: Optional[str] = "relevancy",
+    session: Optional[PooledSession] = None,
 ) -> List[Dict[str, str]]:
     """
     Search for news articles related to the given topic using the News API.
@@ -46,6 +79,7 @@ def search_news_articles(
         language (Optional[Language]): The language of the news articles. Can only be en for English or de for German.
         from_date (Optional[datetime]): The start date for the news articles (format: YYYY-MM-DD).
         sort_type (Optional[str]): The sort type for the news articles. Default is "relevancy".
+        session (Optional[PooledSession]): Session to send the request with. Default is the process-wide session.
 
     Returns:
         List[Dict[str, str]]: A list of dictionaries containing the title, URL, and publication date of the articles.
@@ -53,6 +87,7 @@ def search_news_articles(
     Raises:
         AssertionError: If no API key is provided.
         requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
+        requests.exceptions.RequestException: If the request still failed after all retries.
     """
     assert (
         api_key
@@ -68,28 +103,52 @@ def search_news_articles(
     # Set Params
     params = {
         "q": topic,
-        "from": from_date,
+        "from": _format_date(from_date),
         "sortBy": sort_type,
         "language": language,
         "apiKey": api_key,
     }
 
-    # Make GET Request
-    response = requests.get(
+    # Make GET Request through the pooled Session, retrying on 429 and 5xx
+    if session is None:
+        session = get_session()
+    articles, _ = _fetch_page(url, params, session)
+    return articles
+
+
+def _fetch_page(
+    url: Optional[str],
+    params: Dict[str, Any],
+    session: PooledSession,
+) -> Tuple[List[Dict[str, str]], int]:
+    """
+    Request one page of results from the News API.
+
+    Args:
+        url (Optional[str]): The URL endpoint for the News API.
+        params (Dict[str, Any]): The query parameters, including the API key.
+        session (PooledSession): Session to send the request with.
+
+    Returns:
+        Tuple[List[Dict[str, str]], int]: The articles on the page and the total number of results.
+
+    Raises:
+        requests.exceptions.HTTPError: If the HTTP request returned an unsuccessful status code.
+    """
+    response = session.get(
         url,
         params=params,
     )
 
     # Initialize Empty List to Store Articles
     articles = []
-
-    # print(response.status_code)
+    total_results = 0
 
     # Conditionally Treat Different Status Codes
     match response.status_code:
         case 200:
             data = response.json()
-            # print(data)
+            total_results = data.get("totalResults", 0)
             for article in data.get("articles", []):
                 articles.append(
                     {
@@ -103,7 +162,196 @@ def search_news_articles(
             response.raise_for_status()
             print("Use command !help to get instruction on how to search")
             print("If the API itself is overburdened, wait before trying again")
-    return articles
+    return articles, total_results
+
+
+def iter_news_pages(
+    topic: str,
+    api_key: Optional[str],
+    *,
+    language: Optional[Language] = "en",
+    url: Optional[str] = "https://newsapi.org/v2/everything",
+    from_date: Optional[datetime] = None,
+    sort_type: Optional[str] = "relevancy",
+    page_size: int = 100,
+    max_articles: int = 100,
+    max_workers: int = 4,
+    session: Optional[PooledSession] = None,
+    to_date: Optional[datetime] = None,
+) -> Iterator[List[Dict[str, str]]]:
+    """
+    Search for news articles page by page, yielding each page as soon as it arrives.
+
+    The first page is requested on its own to learn the total number of results. The
+    remaining pages are then requested concurrently by a bounded pool of workers and yielded
+    in the order they complete. Closing the generator early cancels pages not yet requested.
+
+    Args:
+        topic (str): The topic to search for.
+        api_key (str): Your News API key.
+        language (Optional[Language]): The language of the news articles.
+        url (Optional[str]): The URL endpoint for the News API.
+        from_date (Optional[datetime]): The start date for the news articles.
+        sort_type (Optional[str]): The sort type for the news articles. Default is "relevancy".
+        page_size (int): Articles per page, at most 100. Default is 100.
+        max_articles (int): Maximum number of articles yielded in total. Default is 100.
+        max_workers (int): Maximum number of pages requested at the same time. Default is 4.
+        session (Optional[PooledSession]): Session to send requests with. Default is the process-wide session.
+        to_date (Optional[datetime]): The end date for the news articles, inclusive. Default is no end.
+
+    Yields:
+        List[Dict[str, str]]: The articles of one page, with title, URL, and publication date.
+
+    Raises:
+        AssertionError: If no API key is provided.
+        requests.exceptions.HTTPError: If a page request returned an unsuccessful status code.
+    """
+    assert (
+        api_key
+    ), "There are no API Key passed to function\n\
+        Consult README on how to set .env up properly"
+
+    if session is None:
+        session = get_session()
+    page_size = max(1, min(page_size, 100, max_articles))
+    params = {
+        "q": topic,
+        "from": _format_date(from_date),
+        "to": _format_date(to_date),
+        "sortBy": sort_type,
+        "language": language,
+        "apiKey": api_key,
+        "pageSize": page_size,
+    }
+
+    # The first Page tells how many Pages there are
+    articles, total_results = _fetch_page(url, {**params, "page": 1}, session)
+    remaining = max_articles
+    if not articles:
+        return
+    yield articles[:remaining]
+    remaining -= len(articles)
+
+    last_page = math.ceil(min(total_results, max_articles) / page_size)
+    if remaining <= 0 or last_page < 2:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(_fetch_page, url, {**params, "page": page}, session)
+            for page in range(2, last_page + 1)
+        ]
+        for future in as_completed(futures):
+            articles, _ = future.result()
+            if articles:
+                yield articles[:remaining]
+                remaining -= len(articles)
+            if remaining <= 0:
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_news_articles(
+    topic: str,
+    api_key: Optional[str],
+    **kwargs: Any,
+) -> Iterator[Dict[str, str]]:
+    """
+    Search for news articles, yielding articles one by one as their pages arrive.
+
+    Args:
+        topic (str): The topic to search for.
+        api_key (str): Your News API key.
+        **kwargs (Any): Keyword arguments of iter_news_pages, such as max_articles.
+
+    Yields:
+        Dict[str, str]: An article with title, URL, and publication date.
+    """
+    for page in iter_news_pages(topic, api_key, **kwargs):
+        yield from page
+
+
+def cached_search_news_articles(
+    topic: str,
+    api_key: Optional[str],
+    *,
+    cache: ResponseCache,
+    language: Optional[Language] = "en",
+    url: Optional[str] = "https://newsapi.org/v2/everything",
+    from_date: Optional[datetime] = None,
+    sort_type: Optional[str] = "relevancy",
+    session: Optional[PooledSession] = None,
+) -> List[Dict[str, str]]:
+    """
+    Search for news articles like search_news_articles, answering repeated queries from a cache.
+
+    Queries are identified by topic, language, from date, sort type and URL. The API key is
+    not part of the cache key.
+
+    Args:
+        topic (str): The topic to search for.
+        api_key (str): Your News API key.
+        cache (ResponseCache): The cache to look results up in and store them to.
+        language (Optional[Language]): The language of the news articles.
+        url (Optional[str]): The URL endpoint for the News API.
+        from_date (Optional[datetime]): The start date for the news articles.
+        sort_type (Optional[str]): The sort type for the news articles. Default is "relevancy".
+        session (Optional[PooledSession]): Session to send requests with. Default is the process-wide session.
+
+    Returns:
+        List[Dict[str, str]]: A list of dictionaries containing the title, URL, and publication date of the articles.
+    """
+    return cache.get_or_fetch(
+        {
+            "q": topic,
+            "language": language,
+            "from": from_date,
+            "sortBy": sort_type,
+            "url": url,
+        },
+        lambda: search_news_articles(
+            topic,
+            api_key,
+            language=language,
+            url=url,
+            from_date=from_date,
+            sort_type=sort_type,
+            session=session,
+        ),
+    )
+
+
+def cached_iter_news_pages(
+    topic: str,
+    api_key: Optional[str],
+    *,
+    cache: ResponseCache,
+    **kwargs: Any,
+) -> Iterator[List[Dict[str, str]]]:
+    """
+    Search for news articles page by page like iter_news_pages, answering repeated queries from a cache.
+
+    A cached result is yielded as a single page. Streamed results are only stored once every
+    page has arrived, so an interrupted search is not cached.
+
+    Args:
+        topic (str): The topic to search for.
+        api_key (str): Your News API key.
+        cache (ResponseCache): The cache to look results up in and store them to.
+        **kwargs (Any): Keyword arguments of iter_news_pages, such as max_articles.
+
+    Yields:
+        List[Dict[str, str]]: The articles of one page, with title, URL, and publication date.
+    """
+    params = {
+        "q": topic,
+        **{key: value for key, value in kwargs.items() if key != "session"},
+    }
+    yield from cache.iter_or_fetch(
+        params, lambda: iter_news_pages(topic, api_key, **kwargs)
+    )
 
 
 # Example Usage:
@@ -3,9 +3,21 @@ summarize_content.py
 
 This module provides functions for summarizing content using a Hugging Face pipeline and extracting named entities using NLTK.
 
+Classes:
+    - MapReduceSummary: The final summary of a map-reduce run with its chunk and round counts.
+
 Functions:
+    - load_summarizer: Loads a summarization pipeline through the process-wide model registry.
     - summarize_content_pipeline: Summarizes the given content using a specified Hugging Face model.
+                                  Loaded models are reused through the process-wide model registry.
+    - summarize_contents_batch: Summarizes many contents in padded batches of similar length.
+    - stream_summary: Yields the summary of a content piece by piece while it is generated.
+    - chunk_by_tokens: Packs texts into chunks that fit a token budget.
+    - summarize_map_reduce: Summarizes any number of texts by summarizing chunks, then their summaries.
     - extract_named_entities_nltk: Extracts named entities from the given content using NLTK.
+    - extract_named_entities_batch: Extracts named entities from many titles in one tagging pass,
+                                    optionally spread over a process pool.
+    - warm_up_nltk: Loads the NLTK resources used for named entity extraction into memory.
 
 Example Usage:
     content = '''1. "Tech Giant Unveils Revolutionary AI Model, Promising to Transform Healthcare"
@@ -24,29 +36,31 @@ Example Usage:
 """
 
 # Import Relevant Packages
-from langchain_huggingface import HuggingFacePipeline
-
-import nltk  # type: ignore[import-untyped]
+# NLTK is imported inside the functions using it to keep module import fast
 
 # import spacy
+import re
+import threading
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+# Import Model Registry
+from src.model_registry import ModelRegistry, get_model_registry
+
+# Import Entity and Summary Caches
+from src.utils.entity_cache import EntityCache
+from src.utils.summary_cache import SummaryCache
 
 # Type Hints
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from src.search_news import Language
 
 # Import Enum
 from enum import Enum
 
-# Download Language Processing Packs
-# For NLTK
-try:
-    nltk.download("punkt")
-    nltk.download("averaged_perceptron_tagger")
-    nltk.download("maxent_ne_chunker")
-    nltk.download("words")
-except Exception as e:
-    print("Could not load NLTK packages")
-    print(f"{e}")
+# Language Processing Packs
+# For NLTK, resources are provisioned by src.utils.nltk_resources (python main.py --prefetch)
 
 # For Spacy
 # try:
@@ -65,33 +79,401 @@ class EntityTypes(Enum):
     LOCATION = "LOC"
 
 
+# Input Budget when the Tokenizer does not tell the Context Window of its Model
+DEFAULT_MAX_INPUT_TOKENS = 512
+
+
+@dataclass
+class MapReduceSummary:
+    """Final summary of a map-reduce run"""
+
+    summary: str
+    chunks: int  # Chunks summarized in the map step
+    rounds: int  # Summarization passes, the map step included
+
+
+# Function to Load a Summarization Pipeline from the Model Registry
+def load_summarizer(
+    model_id: str = "facebook/bart-large-cnn",
+    *,
+    max_length: int = 100,
+    min_length: int = 30,
+    do_sample: bool = False,
+    registry: Optional[ModelRegistry] = None,
+) -> Any:
+    """
+    Load a summarization pipeline, or take it from the model registry if already loaded.
+
+    Args:
+        model_id Optional(str): The model ID for the Hugging Face pipeline. Default is "facebook/bart-large-cnn".
+        max_length (int): Maximum length of the summary in tokens. Default is 100.
+        min_length (int): Minimum length of the summary in tokens. Default is 30.
+        do_sample (bool): Whether to sample during generation. Default is False.
+        registry (Optional[ModelRegistry]): Registry to take the pipeline from. Default is the process-wide registry.
+
+    Returns:
+        Any: The loaded HuggingFacePipeline, including its tokenizer.
+    """
+    if registry is None:
+        registry = get_model_registry()
+    return registry.get(
+        model_id,
+        {
+            "max_length": max_length,
+            "min_length": min_length,
+            "do_sample": do_sample,
+        },
+    )
+
+
 # Function to Summarize Content using Local Resources with Hugging Face Pipeline
 def summarize_content_pipeline(
     content: str,
     model_id: str = "facebook/bart-large-cnn",
+    *,
+    max_length: int = 100,
+    min_length: int = 30,
+    do_sample: bool = False,
+    registry: Optional[ModelRegistry] = None,
+    cache: Optional[SummaryCache] = None,
 ) -> str:
     """
     Summarize the given content using a Hugging Face pipeline. This function will use local
-    resources to operate.
+    resources to operate. The pipeline is taken from the model registry, so the model is only
+    loaded from disk the first time it is used. With a cache, content summarized before with
+    the same model and parameters is answered without loading or running the model.
 
     Args:
         content (str): The content to be summarized.
         model_id Optional(str): The model ID for the Hugging Face pipeline. Default is "facebook/bart-large-cnn".
+        max_length (int): Maximum length of the summary in tokens. Default is 100.
+        min_length (int): Minimum length of the summary in tokens. Default is 30.
+        do_sample (bool): Whether to sample during generation. Default is False.
+        registry (Optional[ModelRegistry]): Registry to take the pipeline from. Default is the process-wide registry.
+        cache (Optional[SummaryCache]): Cache of earlier summaries, bypassed when sampling. Default is no cache.
 
     Returns:
         str: The summarized content.
     """
-    hf_llm = HuggingFacePipeline.from_model_id(
-        model_id=model_id,
-        task="summarization",
-        pipeline_kwargs={
-            "max_length": 100,
-            "min_length": 30,
-            "do_sample": False,
-        },
+    params = {"max_length": max_length, "min_length": min_length, "do_sample": do_sample}
+
+    def summarize(contents: List[str]) -> List[str]:
+        hf_llm = load_summarizer(model_id, **params, registry=registry)
+        return [hf_llm.invoke(content) for content in contents]
+
+    if cache is None:
+        return summarize([content])[0]
+    return cache.get_or_summarize(
+        [content], _cache_params(model_id, params, registry), summarize
+    )[0]
+
+
+# Function to Summarize many Contents in Batches with Hugging Face Pipeline
+def summarize_contents_batch(
+    contents: List[str],
+    model_id: str = "facebook/bart-large-cnn",
+    *,
+    batch_size: int = 8,
+    max_length: int = 100,
+    min_length: int = 30,
+    do_sample: bool = False,
+    registry: Optional[ModelRegistry] = None,
+    cache: Optional[SummaryCache] = None,
+) -> List[str]:
+    """
+    Summarize many contents, running them through the model in padded batches.
+
+    Contents are sorted by length before batching, so every batch holds inputs of similar
+    length and little compute is spent on padding. Summaries are returned in input order.
+    Empty contents are not sent to the model and get an empty summary. With a cache, only
+    contents not summarized before are sent to the model.
+
+    Args:
+        contents (List[str]): The contents to be summarized.
+        model_id Optional(str): The model ID for the Hugging Face pipeline. Default is "facebook/bart-large-cnn".
+        batch_size (int): Number of contents run through the model at once. Default is 8.
+        max_length (int): Maximum length of each summary in tokens. Default is 100.
+        min_length (int): Minimum length of each summary in tokens. Default is 30.
+        do_sample (bool): Whether to sample during generation. Default is False.
+        registry (Optional[ModelRegistry]): Registry to take the pipeline from. Default is the process-wide registry.
+        cache (Optional[SummaryCache]): Cache of earlier summaries, bypassed when sampling. Default is no cache.
+
+    Returns:
+        List[str]: One summary per content, in the order of contents.
+    """
+    params = {"max_length": max_length, "min_length": min_length, "do_sample": do_sample}
+    batch_size = max(1, batch_size)
+
+    def summarize(contents: List[str]) -> List[str]:
+        summaries = [""] * len(contents)
+        order = sorted(
+            (index for index, content in enumerate(contents) if content.strip()),
+            key=lambda index: len(contents[index]),
+        )
+        if not order:
+            return summaries
+
+        hf_llm = load_summarizer(model_id, **params, registry=registry)
+        for start in range(0, len(order), batch_size):
+            bucket = order[start : start + batch_size]
+            outputs = hf_llm.pipeline(
+                [contents[index] for index in bucket],
+                batch_size=len(bucket),
+                truncation=True,
+            )
+            for index, output in zip(bucket, outputs):
+                if isinstance(output, list):  # Some pipeline versions wrap every result
+                    output = output[0]
+                summaries[index] = output["summary_text"]
+        return summaries
+
+    if cache is None:
+        return summarize(contents)
+    return cache.get_or_summarize(
+        contents, _cache_params(model_id, params, registry), summarize
+    )
+
+
+# Function to Stream a Summary while it is generated with Hugging Face Pipeline
+def stream_summary(
+    content: str,
+    model_id: str = "facebook/bart-large-cnn",
+    *,
+    max_length: int = 100,
+    min_length: int = 30,
+    do_sample: bool = False,
+    registry: Optional[ModelRegistry] = None,
+    cache: Optional[SummaryCache] = None,
+    timeout: Optional[float] = 120.0,
+) -> Iterator[str]:
+    """
+    Summarize the given content and yield the summary text piece by piece as tokens are generated.
+
+    The model generates in a background thread and a transformers TextIteratorStreamer hands
+    decoded text over as soon as it is ready, so the first words arrive after one decoder step
+    instead of after the whole summary. Streamers do not support beam search, so the summary
+    is decoded greedily and may differ from the one of summarize_content_pipeline. Pipelines
+    without a model and tokenizer fall back to the stream interface of the HuggingFacePipeline.
+    With a cache, a content streamed before is yielded at once without loading the model.
+
+    Args:
+        content (str): The content to be summarized.
+        model_id Optional(str): The model ID for the Hugging Face pipeline. Default is "facebook/bart-large-cnn".
+        max_length (int): Maximum length of the summary in tokens. Default is 100.
+        min_length (int): Minimum length of the summary in tokens. Default is 30.
+        do_sample (bool): Whether to sample during generation. Default is False.
+        registry (Optional[ModelRegistry]): Registry to take the pipeline from. Default is the process-wide registry.
+        cache (Optional[SummaryCache]): Cache of earlier summaries, bypassed when sampling. Default is no cache.
+        timeout (Optional[float]): Seconds to wait for the next piece before giving up. Default is 120.
+
+    Yields:
+        str: The next piece of the summary.
+
+    Raises:
+        Exception: Errors of loading the model or of generation, raised in the calling thread.
+    """
+    params = {"max_length": max_length, "min_length": min_length, "do_sample": do_sample}
+    cache_params = {**_cache_params(model_id, params, registry), "num_beams": 1}
+    if cache is not None:
+        cached = cache.get(content, cache_params)
+        if cached is not None:
+            yield cached
+            return
+
+    hf_llm = load_summarizer(model_id, **params, registry=registry)
+    pipeline = getattr(hf_llm, "pipeline", None)
+    if getattr(pipeline, "model", None) is None or getattr(pipeline, "tokenizer", None) is None:
+        pieces = hf_llm.stream(content)
+    else:
+        pieces = _stream_generate(pipeline, content, {**params, "num_beams": 1}, timeout)
+
+    summary = []
+    for piece in pieces:
+        if piece:
+            summary.append(piece)
+            yield piece
+    if cache is not None:
+        cache.set(content, cache_params, "".join(summary).strip())
+
+
+def _stream_generate(
+    pipeline: Any, content: str, generate_kwargs: Dict[str, Any], timeout: Optional[float]
+) -> Iterator[str]:
+    """Run generate in a thread and yield the text its streamer decodes"""
+    from transformers import TextIteratorStreamer  # type: ignore[import-untyped]
+
+    tokenizer = pipeline.tokenizer
+    model = pipeline.model
+    streamer = TextIteratorStreamer(
+        tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=timeout
     )
-    summary = hf_llm.invoke(content)
-    return summary
+    inputs = tokenizer([content], return_tensors="pt", truncation=True)
+    if hasattr(inputs, "to"):
+        inputs = inputs.to(model.device)
+    errors: List[BaseException] = []
+
+    def generate() -> None:
+        try:
+            model.generate(**inputs, streamer=streamer, **generate_kwargs)
+        except BaseException as e:
+            errors.append(e)
+            streamer.end()  # Wake up the reader waiting for text
+
+    thread = threading.Thread(target=generate, name="summary-stream", daemon=True)
+    thread.start()
+    # An abandoned Stream leaves the Thread to finish on its own
+    yield from streamer
+    thread.join(timeout)
+    if errors:
+        raise errors[0]
+
+
+# Function to Pack Texts into Chunks that fit the Context Window of a Model
+def chunk_by_tokens(
+    texts: List[str],
+    max_tokens: int,
+    count_tokens: Callable[[List[str]], List[int]],
+    *,
+    separator: str = "\n",
+) -> List[str]:
+    """
+    Pack texts in order into as few chunks as possible, each within a token budget.
+
+    Texts longer than the budget, such as article bodies, are split at sentence ends first
+    and at word boundaries if a single sentence is still too long. Every separator is
+    counted as one token.
+
+    Args:
+        texts (List[str]): The texts to pack, such as headlines or article bodies.
+        max_tokens (int): Maximum number of tokens per chunk.
+        count_tokens (Callable[[List[str]], List[int]]): Returns the token count of every text.
+        separator (str): Joins the texts of a chunk. Default is a newline.
+
+    Returns:
+        List[str]: The chunks, in the order of texts.
+    """
+    max_tokens = max(1, max_tokens)
+    pieces = [text.strip() for text in texts if text.strip()]
+    for splitter in (r"(?<=[.!?])\s+", r"\s+"):
+        counts = count_tokens(pieces) if pieces else []
+        if all(count <= max_tokens for count in counts):
+            break
+        pieces = [
+            part
+            for piece, count in zip(pieces, counts)
+            for part in ([piece] if count <= max_tokens else re.split(splitter, piece))
+            if part
+        ]
+    else:
+        counts = count_tokens(pieces) if pieces else []
+
+    chunks: List[str] = []
+    current: List[str] = []
+    used = 0
+    for piece, count in zip(pieces, counts):
+        if current and used + 1 + count > max_tokens:
+            chunks.append(separator.join(current))
+            current, used = [], 0
+        used += count + (1 if current else 0)
+        current.append(piece)
+    if current:
+        chunks.append(separator.join(current))
+    return chunks
+
+
+# Function to Summarize any Number of Texts in a Map and a Reduce Step
+def summarize_map_reduce(
+    texts: List[str],
+    model_id: str = "facebook/bart-large-cnn",
+    *,
+    max_input_tokens: Optional[int] = None,
+    batch_size: int = 8,
+    max_rounds: int = 3,
+    max_length: int = 100,
+    min_length: int = 30,
+    do_sample: bool = False,
+    registry: Optional[ModelRegistry] = None,
+    cache: Optional[SummaryCache] = None,
+) -> MapReduceSummary:
+    """
+    Summarize more text than fits into the context window of the model.
+
+    The texts are packed into chunks that fit the model input, counted with the model's own
+    tokenizer. The map step summarizes all chunks in padded batches, and the reduce step
+    packs and summarizes these summaries again until a single summary is left. Every pass
+    shrinks the text by about the ratio of chunk size to summary length, so hundreds of
+    headlines are reduced in two or three passes. After max_rounds passes, the remaining
+    summaries are summarized once more, truncated to the model input. With a cache, chunks
+    summarized before are not run through the model again.
+
+    Args:
+        texts (List[str]): The texts to summarize, such as headlines or article bodies.
+        model_id Optional(str): The model ID for the Hugging Face pipeline. Default is "facebook/bart-large-cnn".
+        max_input_tokens (Optional[int]): Token budget of a chunk. Default is the context window of the model.
+        batch_size (int): Number of chunks run through the model at once. Default is 8.
+        max_rounds (int): Maximum number of passes before the final truncated pass. Default is 3.
+        max_length (int): Maximum length of each summary in tokens. Default is 100.
+        min_length (int): Minimum length of each summary in tokens. Default is 30.
+        do_sample (bool): Whether to sample during generation. Default is False.
+        registry (Optional[ModelRegistry]): Registry to take the pipeline from. Default is the process-wide registry.
+        cache (Optional[SummaryCache]): Cache of earlier summaries, bypassed when sampling. Default is no cache.
+
+    Returns:
+        MapReduceSummary: The final summary, the number of map chunks and the number of passes.
+    """
+    params = {"max_length": max_length, "min_length": min_length, "do_sample": do_sample}
+    tokenizer = getattr(
+        getattr(load_summarizer(model_id, **params, registry=registry), "pipeline", None),
+        "tokenizer",
+        None,
+    )
+    max_input_tokens = max_input_tokens or _max_input_tokens(tokenizer)
+
+    def count_tokens(texts: List[str]) -> List[int]:
+        if tokenizer is None:
+            return [len(text.split()) for text in texts]
+        return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+    def summarize(chunks: List[str]) -> List[str]:
+        return summarize_contents_batch(
+            chunks, model_id, batch_size=batch_size, **params, registry=registry, cache=cache
+        )
+
+    chunks = chunk_by_tokens(texts, max_input_tokens, count_tokens)
+    if not chunks:
+        return MapReduceSummary(summary="", chunks=0, rounds=0)
+    summaries = summarize(chunks)
+    rounds = 1
+    while len(summaries) > 1:
+        if rounds >= max_rounds:
+            summaries = summarize(["\n".join(summaries)])
+        else:
+            summaries = summarize(chunk_by_tokens(summaries, max_input_tokens, count_tokens))
+        rounds += 1
+    return MapReduceSummary(summary=summaries[0], chunks=len(chunks), rounds=rounds)
+
+
+def _max_input_tokens(tokenizer: Any) -> int:
+    """Return the input tokens a model takes besides its special tokens"""
+    model_max_length = getattr(tokenizer, "model_max_length", None)
+    # Tokenizers without a known Limit report a huge Number instead
+    if not model_max_length or model_max_length > 100_000:
+        return DEFAULT_MAX_INPUT_TOKENS
+    try:
+        special = tokenizer.num_special_tokens_to_add()
+    except Exception:
+        special = 2
+    return model_max_length - special
+
+
+def _cache_params(
+    model_id: str, params: Dict[str, Any], registry: Optional[ModelRegistry]
+) -> Dict[str, Any]:
+    """Return the summary cache parameters, telling apart summaries of other backends"""
+    backend = (registry if registry is not None else get_model_registry()).backend
+    if backend == "torch":  # Keys of fp32 summaries stay the same as before backends
+        return {"model_id": model_id, **params}
+    return {"model_id": model_id, **params, "backend": backend}
 
 
 # Extract Named Entities using NLTK Packs and Tokenization
@@ -105,24 +487,107 @@ def extract_named_entities_nltk(content: str) -> Counter:
     Returns:
         Counter: A dictionary of named entities and their counts.
     """
-    sentences = nltk.sent_tokenize(content)
-    tokens = [nltk.word_tokenize(sentence) for sentence in sentences]
-    pos_tags = [nltk.pos_tag(token) for token in tokens]
-    chunks = [nltk.ne_chunk(tag) for tag in pos_tags]
+    return _tag_named_entities([content])[0]
+
+
+# Extract Named Entities from many Titles in one Tagging Pass
+def extract_named_entities_batch(
+    titles: List[str],
+    *,
+    processes: Optional[int] = None,
+    chunk_size: int = 500,
+    cache: Optional[EntityCache] = None,
+    mp_context: Optional[Any] = None,
+) -> Tuple[List[Counter], Counter]:
+    """
+    Extract named entities from many titles at once using NLTK.
 
+    All sentences are POS tagged and chunked in one pass, so the tagger and chunker are set
+    up once per batch instead of once per title. With processes greater than 1, batches
+    larger than chunk_size are split into chunks that are tagged in a process pool. With a
+    cache, only titles not tagged before are tagged.
+
+    Args:
+        titles (List[str]): The titles from which to extract named entities.
+        processes (Optional[int]): Number of worker processes. Default is to tag in this process.
+        chunk_size (int): Number of titles tagged per worker task. Default is 500.
+        cache (Optional[EntityCache]): Cache of entities per title. Default is no cache.
+        mp_context (Optional[multiprocessing.context.BaseContext]): Start method of the worker processes. Default is the platform default.
+
+    Returns:
+        Tuple[List[Counter], Counter]: Named entity counts per title, in the order of titles,
+                                       and the number of titles naming each entity.
+    """
+    chunk_size = max(1, chunk_size)
+
+    def tag(titles: List[str]) -> List[Counter]:
+        if processes is None or processes <= 1 or len(titles) <= chunk_size:
+            return _tag_named_entities(titles)
+        chunks = [
+            titles[start : start + chunk_size]
+            for start in range(0, len(titles), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as executor:
+            return [
+                counter
+                for counters in executor.map(_tag_named_entities, chunks)
+                for counter in counters
+            ]
+
+    per_title = tag(titles) if cache is None else cache.get_or_extract(titles, tag)
+
+    # Every Title counts an Entity once, however often it names it
+    total: Counter = Counter()
+    for counter in per_title:
+        total.update(counter.keys())
+    return per_title, total
+
+
+def _tag_named_entities(contents: List[str]) -> List[Counter]:
+    """Tokenize, tag and chunk all sentences of the contents in one pass"""
+    import nltk  # type: ignore[import-untyped]
+
+    # Remember which Content every Sentence belongs to
+    owners = []
+    tokens = []
+    for index, content in enumerate(contents):
+        for sentence in nltk.sent_tokenize(content):
+            owners.append(index)
+            tokens.append(nltk.word_tokenize(sentence))
+
+    counters = [Counter() for _ in contents]
+    if not tokens:
+        return counters
+    pos_tags = nltk.pos_tag_sents(tokens)
+    for index, chunk in zip(owners, nltk.ne_chunk_sents(pos_tags)):
+        counters[index].update(_chunk_entities(chunk))
+    return counters
+
+
+def _chunk_entities(chunk: Any) -> List[str]:
+    """Join the words of consecutive named entity subtrees of a chunked sentence"""
     named_entities = []
-    for chunk in chunks:
-        current_chunk = []
-        for tree in chunk:
-            if hasattr(tree, "label"):
-                current_chunk.append(" ".join([child[0] for child in tree]))
-            elif current_chunk:
-                named_entities.append(" ".join(current_chunk))
-                current_chunk = []
-        if current_chunk:
+    current_chunk: List[str] = []
+    for tree in chunk:
+        if hasattr(tree, "label"):
+            current_chunk.append(" ".join([child[0] for child in tree]))
+        elif current_chunk:
             named_entities.append(" ".join(current_chunk))
+            current_chunk = []
+    if current_chunk:
+        named_entities.append(" ".join(current_chunk))
+    return named_entities
 
-    return Counter(named_entities)
+
+# Load NLTK Tokenizer, Tagger and Chunker ahead of the first Query
+def warm_up_nltk() -> None:
+    """
+    Load the NLTK tokenizer, POS tagger, NE chunker and word list into memory.
+
+    NLTK loads these resources lazily on first use. Running a tiny extraction once fills
+    NLTK's resource cache, so the first real query does not pay for loading them.
+    """
+    extract_named_entities_nltk("Warm Up Sentence for Named Entities in Berlin.")
 
 
 # Extract Named Entities using Statistical SpaCy Models
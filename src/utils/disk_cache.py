@@ -0,0 +1,280 @@
+"""
+disk_cache.py
+
+This module provides a small persistent key-value cache backed by SQLite. Values are stored
+as JSON together with their creation and last access time, entries older than the maximum
+age are dropped, and the least recently used entries are evicted once the cache grows past
+its entry or size limit. One connection is shared between threads behind a lock.
+
+Classes:
+    - CacheEntry: A cached value together with its age.
+    - DiskCache: A SQLite backed cache with age and size bounded eviction.
+
+Functions:
+    - make_cache_key: Builds a stable hash key from any JSON serializable parts.
+
+Usage Example:
+    cache = DiskCache(Path("history/.cache/example.sqlite"), max_age=3600, max_entries=100)
+    key = make_cache_key("technology", "en")
+    cache.set(key, [{"title": "Example"}])
+    entry = cache.get(key)
+    print(entry.value, entry.age)
+"""
+
+# Import Relevant Packages
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# Type Hints
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+@dataclass
+class CacheEntry:
+    """A cached value together with how old it is"""
+
+    value: Any
+    age: float  # Seconds since the value was stored
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable hash key from JSON serializable parts.
+
+    Args:
+        *parts (Any): Values identifying the cached item. Non JSON values are converted with str.
+
+    Returns:
+        str: The SHA-256 hex digest of the parts.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_age: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open or create a cache database
+
+        Args:
+            path (Path): Location of the SQLite file. Parent folders are created as needed.
+            max_age (Optional[float]): Seconds after which entries are dropped. None keeps them.
+            max_entries (Optional[int]): Maximum number of entries. None disables the limit.
+            max_bytes (Optional[int]): Maximum total size of stored values. None disables the limit.
+            clock (Callable[[], float]): Source of the current time. Defaults to time.time.
+        """
+        self.path = Path(path)
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return the entry stored under a key and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if it is missing or older than max_age.
+        """
+        now = self.clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (
+                self.max_age is not None and now - row[1] > self.max_age
+            ):
+                self.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._connection.commit()
+            self.hits += 1
+        return CacheEntry(json.loads(row[0]), now - row[1])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON serializable value under a key and evict entries beyond the limits.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to store.
+        """
+        payload = json.dumps(value)
+        now = self.clock()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now, now, len(payload)),
+            )
+            self._evict(now)
+            self._connection.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """
+        Return the entries stored under many keys in one transaction and mark them as recently used.
+
+        Args:
+            keys (Iterable[str]): The cache keys.
+
+        Returns:
+            Dict[str, CacheEntry]: The entries found, keyed by cache key. Missing and expired keys are left out.
+        """
+        keys = list(dict.fromkeys(keys))
+        now = self.clock()
+        found: Dict[str, CacheEntry] = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):  # Stay below SQLite's variable limit
+                chunk = keys[start : start + 500]
+                rows = self._connection.execute(
+                    "SELECT key, value, created_at FROM entries WHERE key IN "
+                    f"({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, value, created_at in rows:
+                    if self.max_age is None or now - created_at <= self.max_age:
+                        found[key] = CacheEntry(json.loads(value), now - created_at)
+            self._connection.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            self._connection.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """
+        Store many JSON serializable values in one transaction and evict entries beyond the limits.
+
+        Args:
+            items (Dict[str, Any]): The values to store, keyed by cache key.
+        """
+        now = self.clock()
+        rows = []
+        for key, value in items.items():
+            payload = json.dumps(value)
+            rows.append((key, payload, now, now, len(payload)))
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._evict(now)
+            self._connection.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def clear(self) -> int:
+        """
+        Remove all entries and reset the counters.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            removed = self._connection.execute("DELETE FROM entries").rowcount
+            self._connection.commit()
+            self._connection.execute("VACUUM")
+            self.hits = 0
+            self.misses = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the number of entries, their total size and the hit counters.
+
+        Returns:
+            Dict[str, Any]: Entries, bytes, hits, misses and hit ratio.
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones until the limits hold"""
+        if self.max_age is not None:
+            self._connection.execute(
+                "DELETE FROM entries WHERE created_at < ?", (now - self.max_age,)
+            )
+        if self.max_entries is not None:
+            self._connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries "
+                "ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            total = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            rows = self._connection.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at ASC, rowid ASC"
+            ).fetchall()
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+
+
+# Example Usage:
+if __name__ == "__main__":
+    cache = DiskCache(Path("history/.cache/example.sqlite"), max_age=3600, max_entries=100)
+    key = make_cache_key("technology", "en")
+    cache.set(key, [{"title": "Example"}])
+    print(cache.get(key))
+    print(cache.stats())
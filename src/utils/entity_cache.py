@@ -0,0 +1,200 @@
+"""
+entity_cache.py
+
+This module provides a persistent cache for named entities extracted from titles. Syndicated
+headlines come back across topics and across searches, so entities are stored per title,
+keyed by a hash of the normalized title and the NER backend with its version. A small
+in-memory LRU answers repeated titles within a session before the SQLite store is asked,
+and only titles missing from both are tagged.
+
+Classes:
+    - EntityCache: An in-memory LRU in front of a disk cache of per-title entity counts.
+
+Functions:
+    - normalize_title: Normalizes unicode and whitespace of a title before hashing.
+
+Usage Example:
+    cache = EntityCache(Path("history/.cache/entities.sqlite"))
+    per_title = cache.get_or_extract(
+        ["Elon Musk visits Berlin"],
+        lambda titles: extract_named_entities_batch(titles)[0],
+    )
+    print(per_title, cache.stats())
+"""
+
+# Import Relevant Packages
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from importlib import metadata
+from pathlib import Path
+
+# Import Disk Cache
+from src.utils.disk_cache import DiskCache, make_cache_key
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a title so that trivially different copies share a cache entry.
+
+    Unicode is NFKC normalized and runs of whitespace collapse to a single space. Case is
+    kept, since NER relies on capitalization.
+
+    Args:
+        title (str): The title to normalize.
+
+    Returns:
+        str: The normalized title.
+    """
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", title)).strip()
+
+
+def _backend_version(backend: str) -> str:
+    """Return the installed version of the NER backend package without importing it"""
+    try:
+        return metadata.version(backend)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class EntityCache:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        memory_entries: int = 4096,
+        max_entries: Optional[int] = 100_000,
+        backend: str = "nltk",
+        version: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open or create an entity cache
+
+        Args:
+            path (Path): Location of the SQLite file.
+            memory_entries (int): Titles kept in the in-memory LRU. Defaults to 4096.
+            max_entries (Optional[int]): Maximum number of titles on disk. Defaults to 100000.
+            backend (str): Name of the NER backend, part of every key. Defaults to "nltk".
+            version (Optional[str]): Version of the backend. Defaults to the installed package version.
+            clock (Callable[[], float]): Source of the current time. Defaults to time.time.
+        """
+        self.backend = backend
+        self.version = version or _backend_version(backend)
+        self.memory_entries = memory_entries
+        self.store = DiskCache(path, max_entries=max_entries, clock=clock)
+        self.counts: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        self._memory: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, title: str) -> str:
+        """Return the cache key of a title for this backend and version"""
+        return make_cache_key(self.backend, self.version, normalize_title(title))
+
+    def get_or_extract(
+        self,
+        titles: List[str],
+        extract: Callable[[List[str]], List[Counter]],
+    ) -> List[Counter]:
+        """
+        Return entity counts per title, extracting them only for titles not cached yet.
+
+        Args:
+            titles (List[str]): The titles to look up.
+            extract (Callable[[List[str]], List[Counter]]): Function tagging a list of titles.
+
+        Returns:
+            List[Counter]: Named entity counts per title, in the order of titles.
+        """
+        keys = [self.key(title) for title in titles]
+        found: Dict[str, Dict[str, int]] = {}
+
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            self.counts["memory_hits"] += sum(key in found for key in keys)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        from_disk = {
+            key: entry.value for key, entry in self.store.get_many(missing).items()
+        }
+        found.update(from_disk)
+
+        # Tag every missing Title once, even if it appears several times
+        to_tag: Dict[str, str] = {}
+        for key, title in zip(keys, titles):
+            if key not in found:
+                to_tag.setdefault(key, title)
+        if to_tag:
+            tagged = {
+                key: dict(counter)
+                for key, counter in zip(to_tag, extract(list(to_tag.values())))
+            }
+            self.store.set_many(tagged)
+            found.update(tagged)
+
+        with self._lock:
+            self.counts["disk_hits"] += sum(key in from_disk for key in keys)
+            self.counts["misses"] += sum(key in to_tag for key in keys)
+            for key in dict.fromkeys(keys):
+                self._remember(key, found[key])
+        return [Counter(found[key]) for key in keys]
+
+    def clear(self) -> int:
+        """
+        Remove all cached titles from memory and disk and reset the counters.
+
+        Returns:
+            int: The number of removed titles on disk.
+        """
+        with self._lock:
+            self._memory.clear()
+            self.counts = dict.fromkeys(self.counts, 0)
+        return self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return entry counts, size on disk and how lookups were served.
+
+        Returns:
+            Dict[str, Any]: Entries on disk and in memory, bytes, memory and disk hits, misses and hit ratio.
+        """
+        store = self.store.stats()
+        with self._lock:
+            counts = dict(self.counts)
+            in_memory = len(self._memory)
+        lookups = sum(counts.values())
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        return {
+            "entries": store["entries"],
+            "memory_entries": in_memory,
+            "bytes": store["bytes"],
+            **counts,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, entities: Dict[str, int]) -> None:
+        """Put a title into the in-memory LRU, dropping the least recently used beyond the limit"""
+        self._memory[key] = entities
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    cache = EntityCache(Path("history/.cache/entities.sqlite"))
+    titles = ["Elon Musk visits Berlin", "Elon  Musk visits Berlin"]
+    per_title = cache.get_or_extract(
+        titles,
+        lambda titles: [Counter(word for word in title.split() if word.istitle()) for title in titles],
+    )
+    print(per_title)
+    print(cache.stats())
@@ -0,0 +1,242 @@
+"""
+http_session.py
+
+This module provides a pooled HTTP session for the News API. A single requests.Session keeps
+TLS connections alive between queries, every request has a connect and read timeout, and
+throttled (429) or failing (5xx) responses are retried with exponential backoff and jitter.
+A Retry-After header sent by the server takes precedence over the computed backoff.
+
+Classes:
+    - RequestStats: Latency, retry count and status of a single request.
+    - PooledSession: A requests.Session wrapper with pooling, timeouts and retries.
+
+Functions:
+    - get_session: Returns the process-wide session.
+    - configure_session: Replaces the process-wide session with new settings.
+
+Usage Example:
+    session = get_session()
+    response = session.get("https://newsapi.org/v2/everything", params={"q": "technology"})
+    print(session.last.latency, session.last.retries)
+"""
+
+# Import Relevant Packages
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import requests  # type: ignore[import-untyped]
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+
+# Type Hints
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Status Codes worth retrying
+RETRY_STATUSES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class RequestStats:
+    """Outcome of a single request, including all of its retries"""
+
+    url: str
+    status_code: Optional[int]  # None if no response was received
+    latency: float  # Seconds from first attempt until the final response
+    retries: int
+
+
+class PooledSession:
+    def __init__(
+        self,
+        *,
+        pool_size: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """
+        Initialize a pooled session
+
+        Args:
+            pool_size (int): Number of connections kept alive per host. Defaults to 10.
+            connect_timeout (float): Seconds to wait for a connection. Defaults to 3.05.
+            read_timeout (float): Seconds to wait for the server to respond. Defaults to 10.
+            max_retries (int): Retries after the first attempt. Defaults to 3.
+            backoff_factor (float): Base of the exponential backoff in seconds. Defaults to 0.5.
+            max_backoff (float): Upper bound of a single wait in seconds. Defaults to 30.
+            session (Optional[requests.Session]): Session to wrap. Defaults to a new session.
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.history: Deque[RequestStats] = deque(maxlen=100)
+        self._lock = threading.Lock()
+
+    @property
+    def last(self) -> Optional[RequestStats]:
+        """Stats of the most recent request, or None if nothing was requested yet"""
+        return self.history[-1] if self.history else None
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        """
+        Send a GET request, retrying on connection errors, timeouts, 429 and 5xx responses.
+
+        The final response is returned as is, so callers decide how to treat its status code.
+
+        Args:
+            url (str): The URL to request.
+            params (Optional[Dict[str, Any]]): Query parameters.
+            **kwargs (Any): Further arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: The final response.
+
+        Raises:
+            requests.exceptions.RequestException: If the last attempt fails without a response.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(url, params=params, **kwargs)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ):
+                if attempt >= self.max_retries:
+                    self._record(url, None, start, attempt)
+                    raise
+                time.sleep(self.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                delay = self.retry_after(response)
+                time.sleep(delay if delay is not None else self.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self._record(url, response.status_code, start, attempt)
+            return response
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Return the wait before the next attempt using exponential backoff with full jitter.
+
+        Args:
+            attempt (int): Number of attempts made so far, starting at 0.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
+
+    def retry_after(self, response) -> Optional[float]:
+        """
+        Read the wait requested by the server from the Retry-After header.
+
+        Args:
+            response (requests.Response): The throttled or failed response.
+
+        Returns:
+            Optional[float]: Seconds to wait, capped at max_backoff, or None without a valid header.
+        """
+        value = getattr(response, "headers", {}).get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:  # A -0000 zone is parsed as naive, it means UTC
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(self.max_backoff, max(0.0, seconds))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the recent requests of this session.
+
+        Returns:
+            Dict[str, Any]: Request count, total retries, mean and last latency in seconds.
+        """
+        with self._lock:
+            history = list(self.history)
+        return {
+            "requests": len(history),
+            "retries": sum(stats.retries for stats in history),
+            "mean_latency": (
+                sum(stats.latency for stats in history) / len(history) if history else 0.0
+            ),
+            "last_latency": history[-1].latency if history else 0.0,
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+    def _record(
+        self, url: str, status_code: Optional[int], start: float, retries: int
+    ) -> None:
+        """Append the stats of a finished request to the history"""
+        with self._lock:
+            self.history.append(
+                RequestStats(url, status_code, time.perf_counter() - start, retries)
+            )
+
+
+# Process-wide Session shared by all News API Calls
+_session: Optional[PooledSession] = None
+
+
+def get_session() -> PooledSession:
+    """
+    Return the process-wide session, creating it with default settings on first use.
+
+    Returns:
+        PooledSession: The shared session.
+    """
+    global _session
+    if _session is None:
+        _session = PooledSession()
+    return _session
+
+
+def configure_session(**settings: Any) -> PooledSession:
+    """
+    Replace the process-wide session with one using the given settings.
+
+    Args:
+        **settings (Any): Keyword arguments for PooledSession.
+
+    Returns:
+        PooledSession: The new shared session.
+    """
+    global _session
+    if _session is not None:
+        _session.close()
+    _session = PooledSession(**settings)
+    return _session
+
+
+# Example Usage:
+if __name__ == "__main__":
+    session = get_session()
+    response = session.get("https://newsapi.org/v2/everything", params={"q": "technology"})
+    print(response.status_code, session.last)
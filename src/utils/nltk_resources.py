@@ -0,0 +1,199 @@
+"""
+nltk_resources.py
+
+This module provides functions to check for and provision the NLTK resources used for
+named entity extraction. Looking resources up with NLTK means scanning every data path on
+every start, so the result is stored in a small manifest file and reused as long as the
+recorded locations still exist. With a valid manifest NLTK itself is not even imported.
+Resources are only downloaded when explicitly asked for, and never in offline mode.
+
+Constants:
+    - NLTK_RESOURCES: Mapping of NLTK package names to the resource paths they provide.
+
+Functions:
+    - is_offline: Checks whether the application runs in offline mode.
+    - set_offline: Switches offline mode on for this process and its model downloads.
+    - check_resources: Returns the local location of each resource, using the cached manifest.
+    - missing_resources: Returns the names of the resources that are not available locally.
+    - ensure_resources: Downloads missing resources if allowed and returns those still missing.
+
+Usage Example:
+    missing = missing_resources()
+    if missing:
+        print(f"Missing NLTK resources: {missing}")
+        ensure_resources(download=True)
+"""
+
+# Import Relevant Packages
+import json
+import os
+from pathlib import Path
+
+# Type Hints
+from typing import Any, Dict, List, Optional
+
+# Resources needed by extract_named_entities_nltk
+NLTK_RESOURCES: Dict[str, str] = {
+    "punkt": "tokenizers/punkt",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "maxent_ne_chunker": "chunkers/maxent_ne_chunker",
+    "words": "corpora/words",
+}
+
+# Environment Variable that switches on Offline Mode
+OFFLINE_ENV = "NEWS_AGGREGATOR_OFFLINE"
+
+# Default Location of the cached Manifest
+DEFAULT_MANIFEST = Path.home() / ".cache" / "news-topic-aggregator" / "nltk_manifest.json"
+
+
+def is_offline() -> bool:
+    """
+    Check whether the application runs in offline mode.
+
+    Returns:
+        bool: True if the NEWS_AGGREGATOR_OFFLINE environment variable is set to a true value.
+    """
+    return os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def set_offline() -> None:
+    """
+    Switch on offline mode for this process.
+
+    Besides NLTK provisioning, this also tells the Hugging Face libraries to only use models
+    that are already in the local cache.
+    """
+    os.environ[OFFLINE_ENV] = "1"
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+
+def _pointer_location(pointer: Any) -> str:
+    """Return the file system location behind an NLTK path pointer"""
+    zipfile = getattr(pointer, "zipfile", None)
+    if zipfile is not None:
+        return zipfile.filename
+    return getattr(pointer, "path", str(pointer))
+
+
+def _read_manifest(manifest_path: Path) -> Optional[Dict[str, Any]]:
+    """Return the manifest if it exists, is readable and still matches the disk"""
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if manifest.get("nltk_data_env") != os.environ.get("NLTK_DATA"):
+        return None
+    locations = manifest.get("resources", {})
+    if set(locations) != set(NLTK_RESOURCES):
+        return None
+    for location in locations.values():
+        if location is not None and not Path(location).exists():
+            return None
+    return manifest
+
+
+def check_resources(
+    manifest_path: Optional[Path] = None,
+    *,
+    refresh: bool = False,
+) -> Dict[str, Optional[str]]:
+    """
+    Return the local location of each NLTK resource, or None if it is missing.
+
+    The locations are read from the cached manifest when it is still valid. Otherwise NLTK is
+    asked to find each resource and the manifest is rewritten. Missing resources are always
+    looked up again, so a resource installed by hand is picked up on the next start.
+
+    Args:
+        manifest_path (Optional[Path]): Location of the manifest file. Default is DEFAULT_MANIFEST.
+        refresh (bool): Ignore the cached manifest. Default is False.
+
+    Returns:
+        Dict[str, Optional[str]]: Resource names mapped to their location on disk.
+    """
+    manifest_path = manifest_path or DEFAULT_MANIFEST
+    manifest = None if refresh else _read_manifest(manifest_path)
+    if manifest is not None and all(manifest["resources"].values()):
+        return manifest["resources"]
+
+    import nltk  # type: ignore[import-untyped]
+
+    locations: Dict[str, Optional[str]] = {}
+    for name, resource in NLTK_RESOURCES.items():
+        try:
+            locations[name] = _pointer_location(nltk.data.find(resource))
+        except LookupError:
+            locations[name] = None
+
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "nltk_data_env": os.environ.get("NLTK_DATA"),
+                    "resources": locations,
+                },
+                indent=2,
+            )
+        )
+    except OSError:
+        pass  # A read-only home directory only costs the lookup on the next start
+    return locations
+
+
+def missing_resources(manifest_path: Optional[Path] = None) -> List[str]:
+    """
+    Return the names of the NLTK resources that are not available locally.
+
+    Args:
+        manifest_path (Optional[Path]): Location of the manifest file. Default is DEFAULT_MANIFEST.
+
+    Returns:
+        List[str]: Names of the missing resources.
+    """
+    return [
+        name
+        for name, location in check_resources(manifest_path).items()
+        if location is None
+    ]
+
+
+def ensure_resources(
+    *,
+    download: bool = False,
+    offline: Optional[bool] = None,
+    manifest_path: Optional[Path] = None,
+) -> List[str]:
+    """
+    Make sure the NLTK resources exist locally, downloading only those that are missing.
+
+    Args:
+        download (bool): Download missing resources. Default is False.
+        offline (Optional[bool]): Never touch the network. Default is taken from is_offline().
+        manifest_path (Optional[Path]): Location of the manifest file. Default is DEFAULT_MANIFEST.
+
+    Returns:
+        List[str]: Names of the resources that are still missing.
+    """
+    offline = is_offline() if offline is None else offline
+    missing = missing_resources(manifest_path)
+    if not missing or not download or offline:
+        return missing
+
+    import nltk  # type: ignore[import-untyped]
+
+    for name in missing:
+        nltk.download(name, quiet=True)
+    return [
+        name
+        for name, location in check_resources(manifest_path, refresh=True).items()
+        if location is None
+    ]
+
+
+# Example Usage:
+if __name__ == "__main__":
+    for name, location in check_resources().items():
+        print(f"{name}: {location or 'missing'}")
@@ -0,0 +1,193 @@
+"""
+response_cache.py
+
+This module provides a persistent cache for News API search results. Results younger than
+the TTL are served straight from disk. Results past the TTL but within the stale window are
+still served immediately, while a background thread fetches a fresh copy for the next
+lookup (stale-while-revalidate). Anything older is fetched again before returning.
+
+Classes:
+    - ResponseCache: A TTL cache with stale-while-revalidate in front of a fetch function.
+
+Usage Example:
+    cache = ResponseCache(Path("history/.cache/news_api.sqlite"), ttl=600, stale_ttl=3600)
+    articles = cache.get_or_fetch(
+        {"q": "technology", "language": "en"},
+        lambda: search_news_articles("technology", api_key),
+    )
+    print(cache.last_outcome, cache.stats())
+"""
+
+# Import Relevant Packages
+import threading
+import time
+from pathlib import Path
+
+# Import Disk Cache
+from src.utils.disk_cache import DiskCache, make_cache_key
+
+# Type Hints
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Set
+from typing import TypeAlias
+
+# Type Aliases
+Outcome: TypeAlias = Literal["fresh", "stale", "miss"]
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl: float = 600,
+        stale_ttl: float = 3600,
+        max_entries: int = 500,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open or create a response cache
+
+        Args:
+            path (Path): Location of the SQLite file.
+            ttl (float): Seconds a result is served without revalidation. Defaults to 600.
+            stale_ttl (float): Further seconds a result is served while being revalidated. Defaults to 3600.
+            max_entries (int): Maximum number of cached results. Defaults to 500.
+            clock (Callable[[], float]): Source of the current time. Defaults to time.time.
+        """
+        self.ttl = ttl
+        self.store = DiskCache(
+            path, max_age=ttl + stale_ttl, max_entries=max_entries, clock=clock
+        )
+        self.counts: Dict[str, int] = {"fresh": 0, "stale": 0, "miss": 0, "revalidated": 0}
+        self.last_outcome: Optional[Outcome] = None
+        self._revalidating: Set[str] = set()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self, params: Dict[str, Any], fetch: Callable[[], List[Dict[str, str]]]
+    ) -> List[Dict[str, str]]:
+        """
+        Return cached results for the query parameters, fetching them if necessary.
+
+        Args:
+            params (Dict[str, Any]): Parameters identifying the query. Secrets must not be included.
+            fetch (Callable[[], List[Dict[str, str]]]): Function fetching fresh results.
+
+        Returns:
+            List[Dict[str, str]]: The cached or freshly fetched results.
+        """
+        key = make_cache_key(params)
+        entry = self.store.get(key)
+
+        if entry is not None and entry.age <= self.ttl:
+            self._count("fresh")
+            return entry.value
+
+        if entry is not None:
+            self._count("stale")
+            self._revalidate(key, fetch)
+            return entry.value
+
+        self._count("miss")
+        articles = fetch()
+        self.store.set(key, articles)
+        return articles
+
+    def iter_or_fetch(
+        self,
+        params: Dict[str, Any],
+        stream: Callable[[], Iterator[List[Dict[str, str]]]],
+    ) -> Iterator[List[Dict[str, str]]]:
+        """
+        Yield cached results as one page, or stream pages and cache them once complete.
+
+        Args:
+            params (Dict[str, Any]): Parameters identifying the query. Secrets must not be included.
+            stream (Callable[[], Iterator[List[Dict[str, str]]]]): Function streaming fresh result pages.
+
+        Yields:
+            List[Dict[str, str]]: Pages of results.
+        """
+        key = make_cache_key(params)
+        entry = self.store.get(key)
+
+        if entry is not None and entry.age <= self.ttl:
+            self._count("fresh")
+            yield entry.value
+            return
+
+        if entry is not None:
+            self._count("stale")
+            self._revalidate(key, lambda: [item for page in stream() for item in page])
+            yield entry.value
+            return
+
+        self._count("miss")
+        articles: List[Dict[str, str]] = []
+        for page in stream():
+            articles.extend(page)
+            yield page
+        self.store.set(key, articles)
+
+    def wait(self) -> None:
+        """Block until all running background revalidations have finished"""
+        for thread in list(self._threads):
+            thread.join()
+
+    def clear(self) -> int:
+        """
+        Remove all cached results and reset the counters.
+
+        Returns:
+            int: The number of removed results.
+        """
+        self.wait()
+        self.counts = dict.fromkeys(self.counts, 0)
+        return self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return entry count, size on disk and how lookups were served.
+
+        Returns:
+            Dict[str, Any]: Entries, bytes, fresh and stale hits, misses, revalidations and hit ratio.
+        """
+        lookups = self.counts["fresh"] + self.counts["stale"] + self.counts["miss"]
+        hits = self.counts["fresh"] + self.counts["stale"]
+        store = self.store.stats()
+        return {
+            "entries": store["entries"],
+            "bytes": store["bytes"],
+            **self.counts,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    def _count(self, outcome: Outcome) -> None:
+        """Record how a lookup was served"""
+        with self._lock:
+            self.counts[outcome] += 1
+        self.last_outcome = outcome
+
+    def _revalidate(self, key: str, fetch: Callable[[], List[Dict[str, str]]]) -> None:
+        """Fetch a fresh copy in the background unless one is already being fetched"""
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+
+        def refresh() -> None:
+            try:
+                self.store.set(key, fetch())
+                with self._lock:
+                    self.counts["revalidated"] += 1
+            except Exception:
+                pass  # Keep serving the stale copy; the next lookup tries again
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        thread = threading.Thread(target=refresh, name="cache-revalidate", daemon=True)
+        self._threads.append(thread)
+        thread.start()
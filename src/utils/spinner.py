@@ -45,6 +45,7 @@ class Spinner:
         self.animation_speed = animation_speed
         self.spinner_sequence: Iterator[str] = itertools.cycle(["/", "─", "\\", "|"])
         self.stop_spinner: bool = False
+        self._stopped = threading.Event()  # Wakes the animation as soon as stop is called
         self.thread: threading.Thread = threading.Thread(target=self._spin)
 
     def __enter__(self) -> "Spinner":
@@ -68,11 +69,13 @@ class Spinner:
         """Start new thread for spinner animation"""
         if not self.thread.is_alive():
             self.stop_spinner = False
+            self._stopped.clear()
             self.thread.start()
 
     def stop(self) -> None:
         """Stop spinner animation and clear out line"""
         self.stop_spinner = True
+        self._stopped.set()
         self.thread.join()
         sys.stdout.write("\r" + " " * (len(self.message) + 2) + "\r")
         sys.stdout.flush()
@@ -82,7 +85,7 @@ class Spinner:
         while not self.stop_spinner:
             sys.stdout.write("\r" + self.message + next(self.spinner_sequence))
             sys.stdout.flush()
-            time.sleep(self.animation_speed)
+            self._stopped.wait(self.animation_speed)
 
 
 if __name__ == "__main__":
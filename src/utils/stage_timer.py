@@ -0,0 +1,198 @@
+"""
+stage_timer.py
+
+This module provides a lightweight timer for the stages of a query, such as fetching,
+saving, summarizing and listing named entities. Every stage records its wall time, the CPU
+time of the process and the peak resident memory so far. After each query the stages are
+printed as a table and appended to a JSONL metrics file. Optionally the whole query runs
+under cProfile and the statistics are dumped to a file for inspection with pstats. cProfile
+only follows the thread that started the query, so work done in background threads is not
+attributed to their functions.
+
+Classes:
+    - StageRecord: Wall time, CPU time and peak memory of a single stage.
+    - StageTimer: Records stages per query, reports them and optionally profiles the query.
+
+Functions:
+    - peak_rss_mb: Returns the peak resident memory of the process in MB.
+    - format_stage_table: Formats stage records as a plain text table.
+
+Usage Example:
+    timer = StageTimer(metrics_path=Path("history/metrics.jsonl"))
+    with timer.query("elon musk"):
+        with timer.stage("fetch"), Spinner("Fetching Articles..."):
+            articles = search_news_articles("elon musk", api_key)
+"""
+
+# Import Relevant Packages
+import cProfile
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+# Type Hints
+from typing import Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class StageRecord:
+    """Measurements of a single stage"""
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float  # CPU time of the whole process, background threads included
+    peak_rss_mb: Optional[float]  # Peak of the process so far, None if unavailable
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Return the peak resident memory of the process.
+
+    Returns:
+        Optional[float]: Peak resident set size in MB, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def format_stage_table(records: List[StageRecord]) -> str:
+    """
+    Format stage records as a plain text table with a total row.
+
+    Args:
+        records (List[StageRecord]): The stages to show.
+
+    Returns:
+        str: The table.
+    """
+    lines = [f"{'Stage':<20} {'Wall s':>8} {'CPU s':>8} {'Peak RSS MB':>12}"]
+    for record in records:
+        rss = f"{record.peak_rss_mb:.1f}" if record.peak_rss_mb is not None else "-"
+        lines.append(
+            f"{record.stage:<20} {record.wall_seconds:>8.3f} "
+            f"{record.cpu_seconds:>8.3f} {rss:>12}"
+        )
+    lines.append(
+        f"{'Total':<20} {sum(record.wall_seconds for record in records):>8.3f} "
+        f"{sum(record.cpu_seconds for record in records):>8.3f}"
+    )
+    return "\n".join(lines)
+
+
+class StageTimer:
+    def __init__(
+        self,
+        *,
+        metrics_path: Optional[Path] = None,
+        profile_dir: Optional[Path] = None,
+        show_table: bool = True,
+    ) -> None:
+        """
+        Initialize a stage timer
+
+        Args:
+            metrics_path (Optional[Path]): JSONL file stage records are appended to. None keeps them in memory only.
+            profile_dir (Optional[Path]): Folder cProfile statistics are dumped to per query. None disables profiling.
+            show_table (bool): Whether to print the stage table after each query. Defaults to True.
+        """
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.show_table = show_table
+        self.records: List[StageRecord] = []
+        self.last_profile: Optional[Path] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure the enclosed block as one stage of the current query.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.records.append(
+                StageRecord(
+                    name,
+                    time.perf_counter() - wall_start,
+                    time.process_time() - cpu_start,
+                    peak_rss_mb(),
+                )
+            )
+
+    @contextmanager
+    def query(self, label: str) -> Iterator[None]:
+        """
+        Collect the stages of one query, then report them.
+
+        On leaving the block, also through continue or an exception, the stage table is
+        printed, the records are appended to the metrics file and, if profiling is enabled,
+        the cProfile statistics are dumped.
+
+        Args:
+            label (str): Label of the query, such as the searched topic.
+        """
+        self.records = []
+        profiler = cProfile.Profile() if self.profile_dir else None
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self.last_profile = self._dump_profile(profiler, label)
+            if self.records:
+                self._write_metrics(label)
+                if self.show_table:
+                    print(f"\n{format_stage_table(self.records)}")
+            if self.last_profile is not None and profiler is not None:
+                print(f"Profile written to Path('{self.last_profile}')")
+
+    def _write_metrics(self, label: str) -> None:
+        """Append one JSON line per recorded stage to the metrics file"""
+        if self.metrics_path is None:
+            return
+        self.metrics_path.parent.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        with open(self.metrics_path, "a", encoding="utf-8") as metrics_file:
+            for record in self.records:
+                metrics_file.write(
+                    json.dumps({"timestamp": timestamp, "query": label, **asdict(record)})
+                    + "\n"
+                )
+
+    def _dump_profile(self, profiler: cProfile.Profile, label: str) -> Path:
+        """Dump the statistics of a profiled query to the profile folder"""
+        assert self.profile_dir is not None
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^a-zA-Z0-9]+", "_", label).strip("_").lower() or "query"
+        path = self.profile_dir / f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+        profiler.dump_stats(path)
+        return path
+
+
+# Example Usage:
+if __name__ == "__main__":
+    timer = StageTimer(profile_dir=Path("history/profiles"))
+    with timer.query("example"):
+        with timer.stage("sum"):
+            sum(range(10**6))
+        with timer.stage("sort"):
+            sorted(range(10**6), reverse=True)
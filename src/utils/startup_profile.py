@@ -0,0 +1,124 @@
+"""
+startup_profile.py
+
+This module provides functions to measure how long importing the application takes and
+which packages that time goes to. It runs the import in a fresh interpreter with
+`-X importtime` and condenses the per-module output into one row per top-level package,
+so growing time-to-prompt can be traced back to the import that caused it.
+
+Classes:
+    - ImportCost: Import time of one top-level package.
+
+Functions:
+    - parse_importtime: Parses `-X importtime` output into per-package import costs.
+    - profile_startup: Imports a module in a fresh interpreter and returns its import costs.
+    - format_startup_profile: Formats import costs as a table.
+
+Usage Example:
+    costs = profile_startup("main")
+    print(format_startup_profile(costs))
+"""
+
+# Import Relevant Packages
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+# Type Hints
+from typing import Dict, Iterable, List, Optional
+
+# Pattern of a single `-X importtime` line: self time | cumulative time | indented module
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+@dataclass
+class ImportCost:
+    """Import time of one top-level package, in milliseconds"""
+
+    package: str
+    self_ms: float  # Time spent in the package's own modules
+    cumulative_ms: float  # Time until the package's first import returned
+    modules: int  # Number of modules imported from the package
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportCost]:
+    """
+    Parse `-X importtime` output into per-package import costs.
+
+    Self times are summed over every module of a top-level package. The cumulative time is
+    taken from the outermost import of the package, which includes everything it pulled in.
+
+    Args:
+        lines (Iterable[str]): Lines written to stderr by `python -X importtime`.
+
+    Returns:
+        List[ImportCost]: Import costs sorted by self time, most expensive first.
+    """
+    costs: Dict[str, ImportCost] = {}
+    for line in lines:
+        match = IMPORTTIME_LINE.match(line.rstrip("\n"))
+        if not match:
+            continue
+        self_us, cumulative_us, _, module = match.groups()
+        package = module.split(".")[0]
+        cost = costs.setdefault(package, ImportCost(package, 0.0, 0.0, 0))
+        cost.self_ms += int(self_us) / 1000
+        cost.cumulative_ms = max(cost.cumulative_ms, int(cumulative_us) / 1000)
+        cost.modules += 1
+    return sorted(costs.values(), key=lambda cost: cost.self_ms, reverse=True)
+
+
+def profile_startup(module: str = "main", cwd: Optional[Path] = None) -> List[ImportCost]:
+    """
+    Import a module in a fresh interpreter and return its import costs.
+
+    Args:
+        module (str): The module to import. Default is "main".
+        cwd (Optional[Path]): Directory to run the interpreter in. Default is the project root.
+
+    Returns:
+        List[ImportCost]: Import costs sorted by self time, most expensive first.
+    """
+    cwd = cwd or Path(__file__).resolve().parents[2]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr.splitlines())
+
+
+def format_startup_profile(costs: List[ImportCost], top: int = 15) -> str:
+    """
+    Format import costs as a plain text table with a total row.
+
+    Args:
+        costs (List[ImportCost]): Import costs as returned by profile_startup.
+        top (int): Number of packages to list. Default is 15.
+
+    Returns:
+        str: The formatted table.
+    """
+    rows = [
+        f"{'Package':<28}{'Self ms':>10}{'Cumulative ms':>15}{'Modules':>9}",
+        "-" * 62,
+    ]
+    for cost in costs[:top]:
+        rows.append(
+            f"{cost.package:<28}{cost.self_ms:>10.1f}{cost.cumulative_ms:>15.1f}{cost.modules:>9}"
+        )
+    rows.append("-" * 62)
+    rows.append(
+        f"{'Total':<28}{sum(cost.self_ms for cost in costs):>10.1f}{'':>15}"
+        f"{sum(cost.modules for cost in costs):>9}"
+    )
+    return "\n".join(rows)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    print(format_startup_profile(profile_startup("main")))
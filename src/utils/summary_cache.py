@@ -0,0 +1,209 @@
+"""
+summary_cache.py
+
+This module provides a persistent cache for generated summaries. When the same set of
+headlines comes back, the summary is read from disk instead of running the model again.
+Summaries are keyed by the model ID, the generation parameters and a hash of the content,
+entries are dropped once they are older than the maximum age, and the least recently used
+ones are evicted when the cache grows past its size limit. Sampled summaries are never
+cached, since every run is meant to produce a different one.
+
+Classes:
+    - SummaryCache: A disk cache of summaries keyed by model, parameters and content.
+
+Usage Example:
+    cache = SummaryCache(Path("history/.cache/summaries.sqlite"))
+    params = {"model_id": "facebook/bart-large-cnn", "max_length": 100, "min_length": 30, "do_sample": False}
+    summaries = cache.get_or_summarize(["Headline one\nHeadline two"], params, summarize_many)
+    print(summaries, cache.stats())
+"""
+
+# Import Relevant Packages
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+# Import Disk Cache
+from src.utils.disk_cache import DiskCache, make_cache_key
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional
+
+# Parameters every Cache Key is made of
+BASE_PARAMS = ("model_id", "max_length", "min_length", "do_sample")
+
+
+class SummaryCache:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_age: Optional[float] = 7 * 24 * 3600,
+        max_bytes: Optional[int] = 50 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Open or create a summary cache
+
+        Args:
+            path (Path): Location of the SQLite file.
+            max_age (Optional[float]): Seconds after which summaries are dropped. Defaults to one week.
+            max_bytes (Optional[int]): Maximum total size of stored summaries. Defaults to 50 MB.
+            clock (Callable[[], float]): Source of the current time. Defaults to time.time.
+        """
+        self.store = DiskCache(path, max_age=max_age, max_bytes=max_bytes, clock=clock)
+        self.counts: Dict[str, int] = {"hits": 0, "misses": 0, "bypassed": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content: str, params: Dict[str, Any]) -> str:
+        """
+        Return the cache key of a content summarized with the given parameters.
+
+        Args:
+            content (str): The content to be summarized.
+            params (Dict[str, Any]): Model ID and generation parameters.
+
+        Returns:
+            str: The cache key.
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        # Further Parameters such as the Decoding only extend the Key, so older Keys stay valid
+        extra = sorted(
+            (name, value) for name, value in params.items() if name not in BASE_PARAMS
+        )
+        return make_cache_key(
+            params.get("model_id"),
+            params.get("max_length"),
+            params.get("min_length"),
+            params.get("do_sample"),
+            content_hash,
+            *[f"{name}={value}" for name, value in extra],
+        )
+
+    def get(self, content: str, params: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the cached summary of a content, or None if it has not been summarized yet.
+
+        Lookups are bypassed when params["do_sample"] is true.
+
+        Args:
+            content (str): The content to be summarized.
+            params (Dict[str, Any]): Model ID and generation parameters.
+
+        Returns:
+            Optional[str]: The cached summary, or None.
+        """
+        if params.get("do_sample"):
+            with self._lock:
+                self.counts["bypassed"] += 1
+            return None
+        found = self.store.get_many([self.key(content, params)])
+        with self._lock:
+            self.counts["hits" if found else "misses"] += 1
+        return next(iter(found.values())).value if found else None
+
+    def set(self, content: str, params: Dict[str, Any], summary: str) -> None:
+        """
+        Store the summary of a content. Sampled summaries are not stored.
+
+        Args:
+            content (str): The summarized content.
+            params (Dict[str, Any]): Model ID and generation parameters.
+            summary (str): The summary to store.
+        """
+        if not params.get("do_sample"):
+            self.store.set_many({self.key(content, params): summary})
+
+    def get_or_summarize(
+        self,
+        contents: List[str],
+        params: Dict[str, Any],
+        summarize: Callable[[List[str]], List[str]],
+    ) -> List[str]:
+        """
+        Return summaries of the contents, summarizing only those not cached yet.
+
+        The cache is bypassed entirely when params["do_sample"] is true.
+
+        Args:
+            contents (List[str]): The contents to be summarized.
+            params (Dict[str, Any]): Model ID, max_length, min_length and do_sample.
+            summarize (Callable[[List[str]], List[str]]): Function summarizing a list of contents.
+
+        Returns:
+            List[str]: One summary per content, in the order of contents.
+        """
+        if params.get("do_sample"):
+            with self._lock:
+                self.counts["bypassed"] += len(contents)
+            return summarize(contents)
+
+        keys = [self.key(content, params) for content in contents]
+        found = {key: entry.value for key, entry in self.store.get_many(keys).items()}
+
+        # Summarize every missing Content once, even if it appears several times
+        to_summarize: Dict[str, str] = {}
+        for key, content in zip(keys, contents):
+            if key not in found:
+                to_summarize.setdefault(key, content)
+        if to_summarize:
+            summaries = dict(
+                zip(to_summarize, summarize(list(to_summarize.values())))
+            )
+            self.store.set_many(summaries)
+            found.update(summaries)
+
+        with self._lock:
+            self.counts["misses"] += sum(key in to_summarize for key in keys)
+            self.counts["hits"] += sum(key not in to_summarize for key in keys)
+        return [found[key] for key in keys]
+
+    def clear(self) -> int:
+        """
+        Remove all cached summaries and reset the counters.
+
+        Returns:
+            int: The number of removed summaries.
+        """
+        with self._lock:
+            self.counts = dict.fromkeys(self.counts, 0)
+        return self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return entry count, size on disk and how lookups were served.
+
+        Returns:
+            Dict[str, Any]: Entries, bytes, hits, misses, bypassed lookups and hit ratio.
+        """
+        store = self.store.stats()
+        with self._lock:
+            counts = dict(self.counts)
+        lookups = counts["hits"] + counts["misses"]
+        return {
+            "entries": store["entries"],
+            "bytes": store["bytes"],
+            **counts,
+            "hit_ratio": counts["hits"] / lookups if lookups else 0.0,
+        }
+
+
+# Example Usage:
+if __name__ == "__main__":
+    cache = SummaryCache(Path("history/.cache/summaries.sqlite"))
+    params = {
+        "model_id": "facebook/bart-large-cnn",
+        "max_length": 100,
+        "min_length": 30,
+        "do_sample": False,
+    }
+    for _ in range(2):
+        summaries = cache.get_or_summarize(
+            ["Headline one\nHeadline two"],
+            params,
+            lambda contents: [content.splitlines()[0] for content in contents],
+        )
+    print(summaries)
+    print(cache.stats())
@@ -0,0 +1,125 @@
+"""
+warmup.py
+
+This module provides a WarmUp class to run slow loading steps on a background thread while
+the user is still typing at the prompt. Each step is registered under a name, and callers
+wait only on the step they need. The time spent waiting is tracked, so the amount of loading
+time that was hidden behind the prompt can be reported.
+
+Classes:
+    - WarmUp: A class to run and wait on named warm-up tasks in a background thread.
+
+Usage Example:
+    warmup = WarmUp()
+    warmup.add("model", lambda: time.sleep(5))
+    warmup.start()
+    # Wait for user input, etc.
+    warmup.wait("model")
+    print(warmup.report())
+"""
+
+# Import Relevant Packages
+import threading
+import time
+
+# Type Hints
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class WarmUp:
+    def __init__(self) -> None:
+        """Initialize an empty warm-up with no registered tasks"""
+        self.tasks: List[Tuple[str, Callable[[], Any]]] = []
+        self.done: Dict[str, threading.Event] = {}
+        self.durations: Dict[str, float] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.blocked_time: float = 0.0
+        self.thread: threading.Thread = threading.Thread(
+            target=self._run, name="warmup", daemon=True
+        )
+
+    def add(self, name: str, task: Callable[[], Any]) -> "WarmUp":
+        """
+        Register a task to run during warm-up
+
+        Args:
+            name (str): Name used to wait on the task.
+            task (Callable[[], Any]): Callable that performs the loading step.
+
+        Returns:
+            WarmUp: The warm-up itself, to allow chaining.
+        """
+        self.tasks.append((name, task))
+        self.done[name] = threading.Event()
+        return self
+
+    def start(self) -> None:
+        """Start the background thread running all registered tasks in order"""
+        if not self.thread.is_alive():
+            self.thread.start()
+
+    def wait(self, name: Optional[str] = None) -> float:
+        """
+        Block until a task, or all tasks, have finished.
+
+        Unknown task names and warm-ups that were never started return immediately.
+
+        Args:
+            name (Optional[str]): Name of the task to wait on. None waits on all tasks.
+
+        Returns:
+            float: Seconds spent blocking in this call.
+        """
+        if not self.thread.is_alive():
+            return 0.0
+        if name is None:
+            events = list(self.done.values())
+        elif name in self.done:
+            events = [self.done[name]]
+        else:
+            return 0.0
+
+        start = time.perf_counter()
+        for event in events:
+            event.wait()
+        blocked = time.perf_counter() - start
+        self.blocked_time += blocked
+        return blocked
+
+    def report(self) -> Dict[str, float]:
+        """
+        Summarize how much loading time the warm-up hid from the user.
+
+        Returns:
+            Dict[str, float]: Seconds of loading per finished task, the total loading time,
+                the time callers spent blocking and the hidden time.
+        """
+        total = sum(self.durations.values())
+        return {
+            **{f"{name}_seconds": seconds for name, seconds in self.durations.items()},
+            "total_seconds": total,
+            "blocked_seconds": self.blocked_time,
+            "hidden_seconds": max(0.0, total - self.blocked_time),
+        }
+
+    def _run(self) -> None:
+        """Run each task, recording its duration and any error it raises"""
+        for name, task in self.tasks:
+            start = time.perf_counter()
+            try:
+                task()
+            except Exception as e:
+                self.errors[name] = e
+            finally:
+                self.durations[name] = time.perf_counter() - start
+                self.done[name].set()
+
+
+if __name__ == "__main__":
+    # Usage Example
+    warmup = WarmUp()
+    warmup.add("slow", lambda: time.sleep(2))
+    warmup.start()
+    time.sleep(1)  # Simulate the user typing
+    warmup.wait("slow")
+    print(warmup.report())
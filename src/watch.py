@@ -0,0 +1,408 @@
+"""
+watch.py
+
+This module provides an incremental watch mode for standing topics. Each watched topic
+remembers the newest publication date it has seen in the history store and passes it as
+the start date of the next search, so a poll only downloads recent articles. A search cut
+off at news_api.max_articles is followed by one for the older articles up to where it was
+cut, so a busy topic loses no articles between two polls. Articles an
+earlier search already found are skipped, only the new ones are saved, indexed, summarized
+and tagged, and their named entities are added to running counts instead of recounting
+everything.
+
+Classes:
+    - WatchUpdate: New articles, summary and entity counts of one poll.
+    - TopicWatch: Polls one topic and handles only its new articles.
+
+Functions:
+    - parse_interval: Reads a poll interval such as 90, 5m or 1h.
+    - make_topic_watch: Builds a topic watch from config.
+    - run_watches: Polls topics every interval until stopped.
+    - format_watch_update: Formats a poll result for the terminal.
+
+Example Usage:
+    watch = make_topic_watch(config, store, "spacex", language="en", api_key=api_key, model_id=model_id)
+    run_watches([watch], parse_interval("5m"), on_update=lambda update: print(format_watch_update(update)))
+"""
+
+# Import Relevant Packages
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+# Import Pipeline Stages
+from src.dedupe_articles import deduplicate_articles
+from src.embedding_index import EmbeddingIndex
+from src.history_store import HistoryStore
+from src.save_articles import filter_removed_articles
+from src.search_news import iter_news_pages, news_api_url
+from src.summarize_content import extract_named_entities_batch, summarize_content_pipeline
+from src.utils.entity_cache import EntityCache
+from src.utils.summary_cache import SummaryCache
+
+# Type Hints
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Number of new Articles summarized per Poll
+TOP_ARTICLES = 15
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+@dataclass
+class WatchUpdate:
+    """Outcome of one poll of a watched topic"""
+
+    topic: str
+    language: str
+    new_articles: List[Dict[str, str]] = field(default_factory=list)
+    summary: Optional[str] = None
+    new_entities: Counter = field(default_factory=Counter)  # Entities of the new articles
+    entities: Counter = field(default_factory=Counter)  # Running counts of all polls
+    newest_published_at: Optional[str] = None
+    error: Optional[str] = None
+
+
+def parse_interval(text: str) -> float:
+    """
+    Read a poll interval given in seconds, minutes or hours.
+
+    Args:
+        text (str): A number with an optional unit, such as "90", "5m" or "1h".
+
+    Returns:
+        float: The interval in seconds.
+
+    Raises:
+        ValueError: If the text is not a positive interval.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", text.lower())
+    if match is None or float(match[1]) <= 0:
+        raise ValueError(f"Invalid interval >>{text}<<, use e.g. 90, 5m or 1h")
+    return float(match[1]) * INTERVAL_UNITS[match[2] or "s"]
+
+
+def _parse_published_at(published_at: str) -> Optional[datetime]:
+    """Parse a NewsAPI publication date such as 2024-07-19T12:34:56Z, in UTC"""
+    try:
+        parsed = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class TopicWatch:
+    def __init__(
+        self,
+        topic: str,
+        language: str,
+        *,
+        store: HistoryStore,
+        fetch: Callable[[str, str, Optional[datetime], Optional[datetime]], Iterable[List[Dict[str, str]]]],
+        extract_entities: Callable[[List[str]], Counter],
+        summarize: Optional[Callable[[List[str]], str]] = None,
+        select: Callable[[List[Dict[str, str]]], List[Dict[str, str]]] = lambda articles: articles[:TOP_ARTICLES],
+        start_date: Optional[datetime] = None,
+        index: Optional[Callable[[List[Dict[str, str]]], Any]] = None,
+        max_articles: Optional[int] = None,
+    ) -> None:
+        """
+        Watch a topic for new articles
+
+        Args:
+            topic (str): The topic to watch.
+            language (str): Language of the searches.
+            store (HistoryStore): Store keeping the articles and the state of the watch.
+            fetch (Callable): Returns result pages for a topic, language, start and end date, newest first.
+            extract_entities (Callable[[List[str]], Counter]): Counts the named entities of titles.
+            summarize (Optional[Callable[[List[str]], str]]): Summarizes titles. Default is no summary.
+            select (Callable): Picks the new articles to summarize. Default is the first 15.
+            start_date (Optional[datetime]): Start date of the first poll. Default is no limit.
+            index (Optional[Callable]): Adds saved articles to the embedding index. Default is no index.
+            max_articles (Optional[int]): Most articles one fetch returns. Default is no limit.
+        """
+        self.topic = topic
+        self.language = language
+        self.store = store
+        self.fetch = fetch
+        self.extract_entities = extract_entities
+        self.summarize = summarize
+        self.select = select
+        self.start_date = start_date
+        self.index = index
+        self.max_articles = max_articles
+
+    def poll(self) -> WatchUpdate:
+        """
+        Search for articles published since the newest one seen and handle the new ones.
+
+        New articles are tagged first and only saved afterwards, so a poll failing in between
+        leaves them to be handled by the next poll. A failing summary or index update is
+        reported in the update's error without stopping the poll.
+
+        Returns:
+            WatchUpdate: The new articles, their summary and entities, and the running counts.
+
+        Raises:
+            Exception: Errors of fetching or tagging, such as requests.exceptions.HTTPError.
+        """
+        newest, entities = self.store.watch_state(self.topic, self.language)
+        from_date = _parse_published_at(newest) if newest else self.start_date
+        # Only a poll after an earlier one must reach back to where that one stopped
+        fetched = self._fetch_since(from_date, complete=newest is not None)
+        update = WatchUpdate(self.topic, self.language, entities=entities)
+        update.new_articles = self.store.unseen_articles(self.topic, self.language, fetched)
+        update.newest_published_at = max(
+            [newest or ""] + [article.get("publishedAt") or "" for article in fetched]
+        ) or None
+
+        if update.new_articles:
+            update.new_entities = self.extract_entities(
+                [article["title"] for article in update.new_articles]
+            )
+            if self.summarize is not None:
+                try:
+                    update.summary = self.summarize(
+                        [article["title"] for article in self.select(update.new_articles)]
+                    )
+                except Exception as e:
+                    update.error = f"summarize: {e}"
+            run_id = self.store.start_run(self.topic, self.language, source="watch")
+            self.store.add_articles(run_id, update.new_articles, language=self.language)
+            if self.index is not None:
+                try:
+                    self.index(
+                        [{**article, "language": self.language} for article in update.new_articles]
+                    )
+                except Exception as e:
+                    update.error = update.error or f"index: {e}"
+
+        self.store.update_watch(
+            self.topic,
+            self.language,
+            newest_published_at=update.newest_published_at,
+            entities=update.new_entities,
+        )
+        update.entities = entities + update.new_entities
+        return update
+
+    def _fetch_since(
+        self, from_date: Optional[datetime], *, complete: bool
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch the articles published since the start date, newest first.
+
+        With complete, a fetch returning max_articles may have been cut off before reaching
+        the start date, so the next fetch asks for the articles published up to the oldest one
+        returned, until a fetch returns fewer or the end date stops moving back.
+        """
+        if from_date is not None and from_date.tzinfo is None:
+            from_date = from_date.replace(tzinfo=timezone.utc)
+        fetched: Dict[str, Dict[str, str]] = {}
+        to_date: Optional[datetime] = None
+        while True:
+            found = [
+                article
+                for page in self.fetch(self.topic, self.language, from_date, to_date)
+                for article in page
+            ]
+            for article in filter_removed_articles(found):
+                fetched.setdefault(article["url"], article)
+            if not complete or self.max_articles is None or len(found) < self.max_articles:
+                break
+            oldest = _parse_published_at(
+                min((article.get("publishedAt") or "" for article in found), default="")
+            )
+            if oldest is None or (to_date is not None and oldest >= to_date):
+                break
+            if from_date is not None and oldest <= from_date:
+                break
+            to_date = oldest
+        return list(fetched.values())
+
+
+def make_topic_watch(
+    config: Dict[str, Any],
+    store: HistoryStore,
+    topic: str,
+    *,
+    language: str,
+    api_key: Optional[str],
+    model_id: str,
+    entity_cache: Optional[EntityCache] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    embedding_index: Optional[EmbeddingIndex] = None,
+) -> TopicWatch:
+    """
+    Build a topic watch from the application config.
+
+    Polls ask for the newest articles first and bypass the response cache, so new articles
+    are never hidden by a cached result. The first poll starts news_api.from_date.months_before
+    months ago.
+
+    Args:
+        config (Dict[str, Any]): The parsed config.yaml.
+        store (HistoryStore): Store keeping the articles and the state of the watch.
+        topic (str): The topic to watch.
+        language (str): Language of the searches.
+        api_key (Optional[str]): Your News API key.
+        model_id (str): The model ID used for summarization.
+        entity_cache (Optional[EntityCache]): Cache of named entities per title. Default is no cache.
+        summary_cache (Optional[SummaryCache]): Cache of earlier summaries. Default is no cache.
+        embedding_index (Optional[EmbeddingIndex]): Index new articles are added to. Default is no index.
+
+    Returns:
+        TopicWatch: The watch, ready to poll.
+    """
+    news_api = config["news_api"]
+    dedupe_config = config.get("dedupe", {})
+    months_before = news_api.get("from_date", {}).get("months_before")
+
+    def fetch(
+        topic: str, language: str, from_date: Optional[datetime], to_date: Optional[datetime]
+    ) -> Iterable[List[Dict[str, str]]]:
+        return iter_news_pages(
+            topic,
+            api_key,
+            language=language,  # type: ignore[arg-type]
+            url=news_api_url(news_api),
+            from_date=from_date,
+            to_date=to_date,
+            sort_type="publishedAt",
+            page_size=news_api.get("page_size", 100),
+            max_articles=news_api.get("max_articles", 100),
+            max_workers=news_api.get("max_workers", 4),
+        )
+
+    def select(articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        if not dedupe_config.get("enabled", False):
+            return articles[:TOP_ARTICLES]
+        return deduplicate_articles(
+            articles,
+            threshold=dedupe_config.get("threshold", 0.8),
+            num_perm=dedupe_config.get("num_perm", 64),
+        ).kept[:TOP_ARTICLES]
+
+    def summarize(titles: List[str]) -> str:
+        return summarize_content_pipeline(
+            "\n".join(titles),
+            model_id=model_id,
+            max_length=config["hugging_face"]["max_length"],
+            min_length=config["hugging_face"]["min_length"],
+            do_sample=config["hugging_face"]["do_sample"],
+            cache=summary_cache,
+        )
+
+    def extract_entities(titles: List[str]) -> Counter:
+        return extract_named_entities_batch(titles, cache=entity_cache)[1]
+
+    return TopicWatch(
+        topic,
+        language,
+        store=store,
+        fetch=fetch,
+        extract_entities=extract_entities,
+        summarize=summarize,
+        select=select,
+        start_date=(
+            datetime.now(timezone.utc) - timedelta(days=30 * months_before)
+            if months_before
+            else None
+        ),
+        index=embedding_index.add if embedding_index is not None else None,
+        max_articles=news_api.get("max_articles", 100),
+    )
+
+
+def run_watches(
+    watches: List[TopicWatch],
+    interval: float,
+    *,
+    rounds: Optional[int] = None,
+    on_update: Optional[Callable[[WatchUpdate], None]] = None,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Poll every topic, then wait for the interval, until stopped.
+
+    A poll that fails is reported as an update with an error, and the topic is polled again
+    in the next round.
+
+    Args:
+        watches (List[TopicWatch]): The topics to poll.
+        interval (float): Seconds between the start of two rounds.
+        rounds (Optional[int]): Number of rounds. Default is until stopped or interrupted.
+        on_update (Optional[Callable[[WatchUpdate], None]]): Called with the result of every poll.
+        stop (Optional[threading.Event]): Ends the watch when set. Default is never.
+
+    Returns:
+        int: The number of completed rounds.
+    """
+    stop = stop or threading.Event()
+    completed = 0
+    while rounds is None or completed < rounds:
+        started = datetime.now()
+        for watch in watches:
+            try:
+                update = watch.poll()
+            except Exception as e:
+                update = WatchUpdate(watch.topic, watch.language, error=str(e))
+            if on_update is not None:
+                on_update(update)
+        completed += 1
+        if rounds is not None and completed >= rounds:
+            break
+        elapsed = (datetime.now() - started).total_seconds()
+        if stop.wait(max(0.0, interval - elapsed)):
+            break
+    return completed
+
+
+def format_watch_update(update: WatchUpdate, *, top_entities: int = 10) -> str:
+    """
+    Format a poll result for the terminal.
+
+    Args:
+        update (WatchUpdate): The poll result.
+        top_entities (int): Number of most frequent entities listed. Default is 10.
+
+    Returns:
+        str: The new articles, the summary and the running entity counts with their change.
+    """
+    stamp = datetime.now().strftime("%H:%M:%S")
+    if not update.new_articles:
+        line = f"[{stamp}] {update.topic}: no new articles"
+        return f"{line} ({update.error})" if update.error else line
+
+    lines = [
+        f"[{stamp}] {update.topic}: {len(update.new_articles)} new articles, "
+        f"newest from {update.newest_published_at}"
+    ]
+    lines += [f"  - {article['title']}" for article in update.new_articles[:TOP_ARTICLES]]
+    if update.summary:
+        lines += ["*--Summary of New Headlines--*", update.summary]
+    if update.error:
+        lines.append(f"WARNING: {update.error}")
+    lines.append("*--Named Entities so far--*")
+    for entity, count in update.entities.most_common(top_entities):
+        change = update.new_entities.get(entity, 0)
+        lines.append(f"{entity}: {count}" + (f" (+{change})" if change else ""))
+    return "\n".join(lines)
+
+
+# Example Usage:
+if __name__ == "__main__":
+    from pathlib import Path
+
+    store = HistoryStore(Path("history/history.sqlite"))
+    watch = TopicWatch(
+        "spacex",
+        "en",
+        store=store,
+        fetch=lambda topic, language, from_date: [
+            [{"title": "SpaceX launches Starship", "url": "https://example.com/1", "publishedAt": "2024-07-19T12:00:00Z"}]
+        ],
+        extract_entities=lambda titles: Counter(word for title in titles for word in title.split() if word.istitle()),
+    )
+    run_watches([watch], parse_interval("1s"), rounds=2, on_update=lambda update: print(format_watch_update(update)))
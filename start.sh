@@ -9,6 +9,8 @@ run_app() {
     # Download SpaCy Packs if choosing SpaCy over NLTK
     # python -m spacy download en_core_web_lg
     # python -m spacy download de_core_news_lg
+    # Download missing NLTK Resources
+    python main.py --prefetch
     # Run CLI app
     python main.py
     # Deactivate Venv
@@ -25,6 +27,8 @@ run_app_with_test(){
     # python -m spacy download de_core_news_lg
     # Run Pytest suite
     pytest
+    # Download missing NLTK Resources
+    python main.py --prefetch
     # Run CLI app
     python main.py
     # Deactivate Venv
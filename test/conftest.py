@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from src.history_store import HistoryStore
+
+VOCABULARY = ["spacex", "starship", "launch", "tesla", "recall", "cybertruck", "nasa", "moon"]
+
+
+def embed(titles):
+    """Normalized bag of words over a tiny vocabulary"""
+    vectors = np.array(
+        [[title.lower().split().count(word) for word in VOCABULARY] for title in titles],
+        dtype=np.float32,
+    )
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+def article(index, title=None, published_at="2024-07-19T12:00:00Z", **fields):
+    """A NewsAPI article whose URL ends in its index"""
+    return {
+        "title": title or f"Headline {index}",
+        "url": f"https://example.com/{index}",
+        "publishedAt": published_at,
+        **fields,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(tmp_path / "history.sqlite")
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests  # type: ignore[import-untyped]
+from src.async_search_news import async_search_news_articles, search_many
+from src.utils.http_session import PooledSession
+
+
+@pytest.fixture
+def news_server():
+    state = {"active": 0, "peak": 0, "lock": threading.Lock()}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            topic = parse_qs(urlparse(self.path).query)["q"][0]
+            with state["lock"]:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with state["lock"]:
+                state["active"] -= 1
+
+            status = 401 if topic == "unauthorized" else 200
+            body = {
+                "status": "ok",
+                "totalResults": 1,
+                "articles": [
+                    {
+                        "title": f"{topic} headline",
+                        "url": f"http://test.test/{topic}",
+                        "publishedAt": "2024-07-19T12:34:56Z",
+                    }
+                ],
+            }
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}/v2/everything"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def session():
+    return PooledSession(max_retries=0)
+
+
+def test_async_search_returns_articles(news_server, session):
+    articles = asyncio.run(
+        async_search_news_articles(
+            "space", "dummy", url=news_server["url"], session=session
+        )
+    )
+    assert articles == [
+        {
+            "title": "space headline",
+            "url": "http://test.test/space",
+            "publishedAt": "2024-07-19T12:34:56Z",
+        }
+    ]
+
+
+def test_search_many_caps_concurrency(news_server, session):
+    topics = [f"topic{index}" for index in range(12)]
+    results = asyncio.run(
+        search_many(
+            topics, "dummy", concurrency=3, session=session, url=news_server["url"]
+        )
+    )
+    assert list(results) == topics
+    assert all(len(result.articles) == 1 for result in results.values())
+    assert news_server["peak"] <= 3
+
+
+def test_search_many_reports_errors_per_topic(news_server, session):
+    results = asyncio.run(
+        search_many(
+            ["space", "unauthorized"],
+            "dummy",
+            session=session,
+            url=news_server["url"],
+        )
+    )
+    assert results["space"].error is None
+    assert isinstance(results["unauthorized"].error, requests.exceptions.HTTPError)
+    assert results["unauthorized"].articles == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+
+import pytest
+from src.batch import TopicJob, make_default_stages, read_topics_file, run_batch
+
+
+def test_read_topics_file_skips_comments_and_blanks(tmp_path):
+    topics_file = tmp_path / "topics.txt"
+    topics_file.write_text("elon musk\n# standing topics\n\ncrypto; DROP\n")
+    assert read_topics_file(topics_file) == ["elon musk", "crypto DROP"]
+
+
+def test_run_batch_writes_jsonl(tmp_path):
+    def fetch(job):
+        job.articles = [{"title": f"{job.topic} news", "url": "u", "publishedAt": "p"}]
+
+    def summarize(job):
+        job.summary = f"Summary of {job.topic}"
+
+    output = tmp_path / "results.jsonl"
+    report = run_batch(
+        ["a", "b", "c"], [("fetch", fetch), ("summarize", summarize)], output
+    )
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["topic"] for record in records] == ["a", "b", "c"]
+    assert records[0]["summary"] == "Summary of a"
+    assert records[0]["article_count"] == 1
+    assert set(records[0]["seconds"]) == {"fetch", "summarize"}
+    assert report.topics == 3
+    assert report.failed == 0
+    assert report.topics_per_minute > 0
+
+
+def test_run_batch_overlaps_stages(tmp_path):
+    events = []
+    lock = threading.Lock()
+
+    def record(name):
+        def stage(job):
+            with lock:
+                events.append((name, job.topic, "start"))
+            time.sleep(0.05)
+            with lock:
+                events.append((name, job.topic, "end"))
+
+        return stage
+
+    run_batch(
+        ["a", "b"],
+        [("fetch", record("fetch")), ("summarize", record("summarize"))],
+        tmp_path / "results.jsonl",
+    )
+    fetch_b_start = events.index(("fetch", "b", "start"))
+    summarize_a_end = events.index(("summarize", "a", "end"))
+    assert fetch_b_start < summarize_a_end
+
+
+def test_run_batch_records_errors_and_skips_later_stages(tmp_path):
+    calls = []
+
+    def fetch(job):
+        if job.topic == "bad":
+            raise RuntimeError("429 Too Many Requests")
+
+    def summarize(job):
+        calls.append(job.topic)
+
+    output = tmp_path / "results.jsonl"
+    report = run_batch(["good", "bad"], [("fetch", fetch), ("summarize", summarize)], output)
+    records = {
+        record["topic"]: record
+        for record in map(json.loads, output.read_text().splitlines())
+    }
+    assert records["bad"]["error"] == "fetch: 429 Too Many Requests"
+    assert calls == ["good"]
+    assert report.failed == 1
+
+
+def test_run_batch_micro_batches_queued_topics(tmp_path):
+    batches = []
+
+    def fetch(job):
+        job.articles = [{"title": job.topic, "url": "u", "publishedAt": "p"}]
+
+    def summarize(jobs):
+        batches.append([job.topic for job in jobs])
+        time.sleep(0.05)  # Topics queue up while the model is busy
+        for job in jobs:
+            job.summary = job.topic.upper()
+
+    output = tmp_path / "results.jsonl"
+    report = run_batch(
+        list("abcdef"), [("fetch", fetch), ("summarize", summarize, 4)], output
+    )
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["summary"] for record in records] == list("ABCDEF")
+    assert sorted(topic for batch in batches for topic in batch) == list("abcdef")
+    assert max(len(batch) for batch in batches) > 1
+    assert all(len(batch) <= 4 for batch in batches)
+    assert report.failed == 0
+
+
+def test_default_stages_index_saved_articles(tmp_path):
+    class FakeIndex:
+        def __init__(self, error=None):
+            self.added, self.error = [], error
+
+        def add(self, articles):
+            if self.error:
+                raise self.error
+            self.added += list(articles)
+            return 1
+
+    config = {
+        "news_api": {"base_url": "http://test.test/v2", "endpoint": "everything"},
+        "hugging_face": {"batch_size": 2},
+        "output": {"folder": str(tmp_path)},
+    }
+    job = TopicJob("spacex", "en", articles=[{"title": "Starship", "url": "u", "publishedAt": "p"}])
+
+    def stages(embedding_index=None):
+        specs = make_default_stages(config, api_key="key", model_id="m", embedding_index=embedding_index)
+        return {spec[0]: spec[1] for spec in specs}
+
+    index = FakeIndex()
+    assert list(stages(index))[:3] == ["fetch", "save", "index"]
+    stages(index)["index"](job)
+    assert job.indexed == 1
+    assert index.added == [{"title": "Starship", "url": "u", "publishedAt": "p", "language": "en"}]
+
+    # A failing index keeps the topic going with a warning
+    stages(FakeIndex(ImportError("no encoder")))["index"](job)
+    assert job.warning == "index: no encoder" and job.error is None
+    assert "index" not in stages()
+
+
+if __name__ == "__main__":
+    pytest.main()
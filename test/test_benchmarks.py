@@ -0,0 +1,127 @@
+import time
+
+import pytest
+from src.corpus import generate_articles
+from benchmarks.backend_benchmark import compare_backends, measure_backend, rouge_l, rouge_n
+from src.model_registry import ModelRegistry
+from src.summarize_content import summarize_contents_batch
+from benchmarks.run_benchmarks import build_tiny_summarizer, compare_results, run_suite, time_stage
+
+
+def test_run_suite_times_every_stage_offline():
+    results = run_suite({"small": generate_articles(300)}, repeat=1, ner_limit=50)
+    stages = {result["stage"]: result for result in results["results"]}
+    assert set(stages) == {
+        "csv_export",
+        "dedupe",
+        "fetch_parse",
+        "filter",
+        "ner",
+        "summarize",
+    }
+    assert stages["fetch_parse"]["items"] == 300
+    assert stages["fetch_parse"]["seconds"] > 0
+    assert stages["ner"]["items"] == 50
+    assert stages["ner"]["seconds"] is not None or stages["ner"]["skipped"]
+    assert stages["summarize"]["seconds"] is not None or stages["summarize"]["skipped"]
+
+
+def test_tiny_summarizer_runs_through_the_real_pipeline(tmp_path):
+    for package in ("torch", "transformers", "tokenizers"):
+        pytest.importorskip(package)
+    model_id = str(build_tiny_summarizer(tmp_path / "tiny-bart"))
+    registry = ModelRegistry()
+    summaries = summarize_contents_batch(
+        ["SpaceX launches Starship\nTesla recalls Cybertruck", "", "NASA returns to the Moon"],
+        model_id,
+        max_length=8,
+        min_length=8,
+        registry=registry,
+    )
+    assert summaries[0] and summaries[2] and summaries[1] == ""
+    assert registry.stats()["misses"] == 1
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"results": [
+        {"corpus": "1k", "stage": "filter", "seconds": 1.0},
+        {"corpus": "1k", "stage": "csv_export", "seconds": 1.0},
+        {"corpus": "1k", "stage": "summarize", "seconds": 0.0001},
+    ]}
+    current = {"results": [
+        {"corpus": "1k", "stage": "filter", "seconds": 1.1},
+        {"corpus": "1k", "stage": "csv_export", "seconds": 2.0},
+        {"corpus": "1k", "stage": "ner", "seconds": None},
+        {"corpus": "1k", "stage": "summarize", "seconds": 0.001},
+    ]}
+    comparison = compare_results(current, baseline, tolerance=0.25)
+    assert [(row["stage"], row["regressed"], row["missing"]) for row in comparison] == [
+        ("filter", False, False),
+        ("csv_export", True, False),
+        ("ner", False, True),
+        ("summarize", False, False),
+    ]
+    # Stages faster than min_seconds are too noisy to regress
+    noisy = {"results": [{"corpus": "1k", "stage": "filter", "seconds": 0.02}]}
+    slower = {"results": [{"corpus": "1k", "stage": "filter", "seconds": 0.04}]}
+    assert not compare_results(slower, noisy)[0]["regressed"]
+    assert compare_results(slower, noisy, min_seconds=0.01)[0]["regressed"]
+
+
+def test_compare_results_reports_skipped_stages():
+    baseline = {"results": [
+        {"corpus": "1k", "stage": "ner", "seconds": None, "skipped": "missing NLTK resources"},
+        {"corpus": "1k", "stage": "dedupe", "seconds": 1.0},
+    ]}
+    current = {"results": [
+        {"corpus": "1k", "stage": "ner", "seconds": 0.5},
+        {"corpus": "1k", "stage": "dedupe", "seconds": None, "skipped": "failed"},
+    ]}
+    comparison = compare_results(current, baseline)
+    assert [(row["stage"], row["skipped"], row["regressed"]) for row in comparison] == [
+        ("ner", True, False),
+        ("dedupe", True, False),
+    ]
+
+
+def test_time_stage_takes_the_median_run():
+    durations = iter([0.0, 5.0, 0.0, 0.0, 0.0])
+    assert time_stage(lambda: time.sleep(next(durations) / 1000), repeat=5) < 0.004
+
+
+def test_rouge_scores():
+    assert rouge_n("SpaceX launches Starship", "spacex launches starship") == 1.0
+    assert rouge_n("SpaceX launches Starship", "Tesla recalls Cybertruck") == 0.0
+    assert rouge_n("a b c d", "a b x d", 2) == pytest.approx(1 / 3)
+    assert rouge_l("a b c d", "a x c d") == pytest.approx(0.75)
+
+
+def test_compare_backends_against_fp32(monkeypatch):
+    class StubPipeline:
+        def __init__(self, backend):
+            self.backend = backend
+
+        def invoke(self, content):
+            words = content.split()
+            return " ".join(words[:-1] if self.backend == "torch-int8" else words)
+
+    def loader(model_id, pipeline_kwargs, *, backend, **threads):
+        return StubPipeline(backend)
+
+    contents = ["one two three four", "five six seven eight"]
+    measurements = [
+        measure_backend(backend, "stub", contents, pipeline_kwargs={}, loader=loader)
+        for backend in ("torch", "torch-int8")
+    ]
+    assert measurements[1]["summaries"] == ["one two three", "five six seven"]
+
+    rows = {row["backend"]: row for row in compare_backends(measurements)}
+    assert rows["torch"]["rougeL"] == 1.0
+    assert rows["torch-int8"]["rouge1"] == pytest.approx(6 / 7, abs=1e-4)
+    assert rows["torch-int8"]["speedup"] > 0
+    with pytest.raises(ValueError):
+        compare_backends(measurements[1:])
+
+
+if __name__ == "__main__":
+    pytest.main()
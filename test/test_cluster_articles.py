@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+from src.cluster_articles import cluster_articles, cluster_embeddings, embed_titles
+from src.model_registry import ModelRegistry
+from test.conftest import VOCABULARY, article, embed
+
+def test_cluster_articles_groups_sub_topics_largest_first():
+    articles = [
+        article(1, "Tesla recall Cybertruck"),
+        article(2, "SpaceX Starship launch"),
+        article(3, "NASA moon"),
+        article(4, "Starship launch SpaceX"),
+        article(5, "SpaceX Starship"),
+        article(6, "Cybertruck recall Tesla"),
+    ]
+    clusters = cluster_articles(articles, threshold=0.6, embed=embed)
+    assert [len(cluster.articles) for cluster in clusters] == [3, 2, 1]
+    # Articles keep their order of relevance, the center is the best connected headline
+    assert [item["url"][-1] for item in clusters[0].articles] == ["2", "4", "5"]
+    assert clusters[0].center["url"][-1] == "2"
+    assert [item["url"][-1] for item in clusters[1].articles] == ["1", "6"]
+    assert cluster_articles([], embed=embed) == []
+
+
+def test_cluster_embeddings_respects_threshold():
+    vectors = embed(["spacex starship", "spacex launch", "spacex"])
+    assert cluster_embeddings(vectors, threshold=0.99) == [[0], [1], [2]]
+    assert cluster_embeddings(vectors, threshold=0.7) == [[2, 0, 1]]
+    assert cluster_embeddings(np.empty((0, 8))) == []
+
+
+def test_cluster_embeddings_groups_thousands_of_articles():
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(100, 384))
+    vectors = centers[rng.integers(0, 100, 2_000)] + rng.normal(scale=0.3, size=(2_000, 384))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    clusters = cluster_embeddings(vectors, threshold=0.6)
+    assert len(clusters) == 100
+    assert sorted(index for cluster in clusters for index in cluster) == list(range(2_000))
+
+
+def test_embed_titles_batches_through_the_registry():
+    calls = []
+
+    class MockEncoder:
+        def __init__(self, model_id, model_kwargs):
+            calls.append(model_id)
+
+        def encode(self, titles, batch_size, normalize_embeddings, convert_to_numpy, show_progress_bar):
+            assert normalize_embeddings and batch_size == 2
+            return embed(titles)
+
+    registry = ModelRegistry(loader=MockEncoder)
+    for _ in range(2):
+        vectors = embed_titles(["spacex", "tesla recall"], "encoder", batch_size=2, registry=registry)
+    assert vectors.dtype == np.float32 and vectors.shape == (2, len(VOCABULARY))
+    assert calls == ["encoder"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,18 @@
+import pytest
+from src.corpus import corpus_label, generate_articles
+
+
+def test_generate_articles_is_deterministic():
+    articles = generate_articles(200)
+    assert articles == generate_articles(200)
+    assert articles != generate_articles(200, seed=1)
+    assert sum(article["url"] == "https://removed.com" for article in articles) == 4
+    assert len({article["title"] for article in articles}) < len(articles)
+
+
+def test_corpus_label():
+    assert [corpus_label(size) for size in (1_000, 100_000, 250)] == ["1k", "100k", "250"]
+
+
+if __name__ == "__main__":
+    pytest.main()
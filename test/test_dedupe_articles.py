@@ -0,0 +1,57 @@
+import random
+
+from src.dedupe_articles import (
+    deduplicate_articles,
+    find_near_duplicates,
+    minhash_signatures,
+    normalize_for_shingles,
+)
+from test.conftest import article
+
+
+def test_normalize_for_shingles_ignores_case_and_punctuation():
+    assert normalize_for_shingles("  SpaceX -- Launches: Starship!! ") == "spacex launches starship"
+
+
+def test_identical_titles_have_identical_signatures():
+    signatures = minhash_signatures(["Tesla recalls Cybertruck", "tesla recalls cybertruck!", "Hi"])
+    assert (signatures[0] == signatures[1]).all()
+    assert not (signatures[0] == signatures[2]).all()
+
+
+def test_near_duplicates_keep_the_first_article():
+    articles = [
+        article(0, "SpaceX launches Starship on fifth test flight"),
+        article(1, "Tesla recalls Cybertruck over loose trim panels"),
+        article(2, "SpaceX Launches Starship on Fifth Test Flight!"),
+        article(3, "SpaceX launches Starship on its fifth test flight"),
+        article(4, "Apple unveils new iPhone at September event"),
+    ]
+    result = deduplicate_articles(articles, threshold=0.7)
+
+    assert [item["url"][-1] for item in result.kept] == ["0", "1", "4"]
+    assert result.clusters == [[0, 2, 3]]
+    assert result.removed == 2
+
+
+def test_threshold_controls_what_counts_as_duplicate():
+    titles = [
+        "SpaceX launches Starship on fifth test flight",
+        "SpaceX launches Starship on its fifth test flight",
+    ]
+    assert find_near_duplicates(titles, threshold=0.6) == [0, 0]
+    assert find_near_duplicates(titles, threshold=0.95) == [0, 1]
+
+
+def test_distinct_titles_are_all_kept():
+    rng = random.Random(3)
+    words = ["market", "storm", "election", "rocket", "court", "vaccine", "merger", "festival"]
+    titles = [f"{index * 7919} {' '.join(rng.sample(words, 5))}" for index in range(300)]
+    labels = find_near_duplicates(titles, threshold=0.9)
+    assert labels == list(range(len(labels)))
+
+
+def test_empty_and_short_titles():
+    assert find_near_duplicates([]) == []
+    assert find_near_duplicates(["", "A", "A"]) == [0, 1, 1]
+    assert deduplicate_articles([]).kept == []
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+from src.embedding_index import EmbeddingIndex, top_k_rows
+from src.history_store import HistoryStore
+from test.conftest import VOCABULARY, article, embed
+
+ARTICLES = [
+    article(1, "Tesla recall Cybertruck", "2024-07-01T00:00:00Z", language="en"),
+    article(2, "SpaceX Starship launch", "2024-07-02T00:00:00Z", language="en"),
+    article(3, "NASA moon", "2024-07-03T00:00:00Z", language="en"),
+    article(4, "Starship launch", "2024-07-04T00:00:00Z", language="en"),
+]
+
+
+def test_add_embeds_only_new_articles(tmp_path):
+    calls = []
+
+    def counting_embed(titles):
+        calls.append(list(titles))
+        return embed(titles)
+
+    index = EmbeddingIndex(tmp_path, embed=counting_embed, model_id="bag")
+    assert index.add(ARTICLES) == 4
+    assert index.add(ARTICLES[2:] + [article(5, "Moon launch", "2024-07-05T00:00:00Z", language="en")]) == 1
+    assert calls[-1] == ["Moon launch"]
+    assert len(index) == 5
+    assert index.add([{"title": "", "url": "https://example.com/6"}]) == 0
+    index.close()
+
+
+def test_search_ranks_by_meaning(tmp_path):
+    index = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    index.add(ARTICLES)
+    hits = index.search("starship launch", k=2)
+    assert [hit.url[-1] for hit in hits] == ["4", "2"]
+    assert hits[0].score == pytest.approx(1.0)
+    assert hits[0].publishedAt == "2024-07-04T00:00:00Z"
+    assert hits[0].language == "en"
+    assert index.search("starship", k=0) == []
+    index.close()
+
+
+def test_index_persists_and_checks_model(tmp_path):
+    index = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    index.add(ARTICLES)
+    index.close()
+
+    reopened = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    assert len(reopened) == 4
+    assert reopened.search("tesla recall", k=1)[0].url.endswith("/1")
+    reopened.close()
+    with pytest.raises(ValueError):
+        EmbeddingIndex(tmp_path, embed=embed, model_id="other")
+
+
+def test_interrupted_save_is_repaired(tmp_path):
+    index = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    index.add(ARTICLES)
+    index.close()
+    # Rows of an interrupted save that reached the matrix but not the metadata
+    with open(tmp_path / "embeddings.f32", "ab") as file:
+        embed(["nasa moon"]).tofile(file)
+
+    reopened = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    assert (tmp_path / "embeddings.f32").stat().st_size == 4 * len(VOCABULARY) * 4
+    assert reopened.add([article(5, "NASA moon launch", "2024-07-05T00:00:00Z", language="en")]) == 1
+    assert reopened.search("nasa moon launch", k=1)[0].url.endswith("/5")
+    reopened.close()
+
+    # Metadata of rows whose embeddings never reached the disk
+    with open(tmp_path / "embeddings.f32", "r+b") as file:
+        file.truncate(3 * len(VOCABULARY) * 4)
+    truncated = EmbeddingIndex(tmp_path, embed=embed, model_id="bag")
+    assert len(truncated) == 3
+    assert truncated.add(ARTICLES) == 1
+    truncated.close()
+
+
+def test_top_k_rows_reads_in_blocks():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(1000, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+    rows, scores = top_k_rows(matrix, query, 5, block_rows=64)
+    expected = np.argsort(-(matrix @ query))[:5]
+    assert list(rows) == list(expected)
+    assert list(scores) == pytest.approx(list((matrix @ query)[expected]), rel=1e-5)
+    assert len(top_k_rows(matrix[:3], query, 5)[0]) == 3
+
+
+def test_approximate_search_finds_exact_neighbours(tmp_path):
+    rng = np.random.default_rng(0)
+    topics = rng.normal(size=(50, 32)).astype(np.float32)
+    vectors = topics[rng.integers(0, 50, 12_000)] + 0.3 * rng.normal(size=(12_000, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = EmbeddingIndex(tmp_path, embed=embed, model_id="random")
+    index.add(
+        ({"title": f"Headline {row}", "url": f"https://example.com/{row}"} for row in range(len(vectors))),
+        vectors=vectors,
+    )
+    assert index.build_approximate(cells=50) == 50
+
+    queries = vectors[:20]
+    recall = np.mean(
+        [
+            len(
+                {hit.url for hit in index.search(query, 10, approximate=True, probes=8)}
+                & {hit.url for hit in index.search(query, 10)}
+            )
+            / 10
+            for query in queries
+        ]
+    )
+    assert recall >= 0.9
+    assert index.stats()["cells"] == 50
+    index.close()
+
+
+def test_backfill_only_reads_articles_saved_since(tmp_path):
+    store = HistoryStore(tmp_path / "history.sqlite")
+    run_id = store.start_run("space", "en")
+    store.add_articles(run_id, ARTICLES[:3], language="en")
+    calls = []
+
+    def counting_embed(titles):
+        calls.append(list(titles))
+        return embed(titles)
+
+    index = EmbeddingIndex(tmp_path / "index", embed=counting_embed, model_id="bag")
+    index.add([ARTICLES[0]])  # Indexed when it was saved
+    assert index.backfill(store, batch_size=2) == 2
+    assert calls[1:] == [["SpaceX Starship launch"], ["NASA moon"]]
+
+    reads = []
+    articles_after = store.articles_after
+    store.articles_after = lambda row, limit: reads.append(row) or articles_after(row, limit=limit)
+    store.add_articles(run_id, ARTICLES[3:], language="en")
+    assert index.backfill(store) == 1
+    assert reads[0] == 3  # Continues after the rows read before
+    assert index.search("starship launch", k=1)[0].language == "en"
+    index.close()
@@ -0,0 +1,72 @@
+from collections import Counter
+
+import pytest
+from src.utils.entity_cache import EntityCache, normalize_title
+
+
+def make_extract():
+    calls = []
+
+    def extract(titles):
+        calls.append(list(titles))
+        return [Counter(word for word in title.split() if word.istitle()) for title in titles]
+
+    return extract, calls
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EntityCache(tmp_path / "entities.sqlite", memory_entries=2, version="1.0")
+
+
+def test_normalize_title_collapses_whitespace_and_keeps_case():
+    assert normalize_title("  Elon Musk \n visits  Berlin ") == "Elon Musk visits Berlin"
+
+
+def test_cache_tags_only_unseen_titles(cache):
+    extract, calls = make_extract()
+    first = cache.get_or_extract(["Musk in Berlin", "Musk  in Berlin", "Apple news"], extract)
+    assert first[0] == first[1] == Counter({"Musk": 1, "Berlin": 1})
+    assert calls == [["Musk in Berlin", "Apple news"]]
+
+    second = cache.get_or_extract(["Apple news", "Tesla in Paris"], extract)
+    assert second == [Counter({"Apple": 1}), Counter({"Tesla": 1, "Paris": 1})]
+    assert calls[1:] == [["Tesla in Paris"]]
+
+
+def test_cache_serves_from_disk_after_memory_eviction(tmp_path, cache):
+    extract, calls = make_extract()
+    cache.get_or_extract(["A one", "B two", "C three"], extract)
+    cache.get_or_extract(["A one", "C three"], extract)
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["memory_entries"] == 2
+    assert stats["memory_hits"] == 1
+    assert stats["disk_hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["hit_ratio"] == pytest.approx(2 / 5)
+
+    reopened = EntityCache(tmp_path / "entities.sqlite", version="1.0")
+    assert reopened.get_or_extract(["B two"], extract) == [Counter({"B": 1})]
+    assert len(calls) == 1
+
+
+def test_cache_is_keyed_on_backend_version(tmp_path, cache):
+    extract, calls = make_extract()
+    cache.get_or_extract(["Musk in Berlin"], extract)
+    upgraded = EntityCache(tmp_path / "entities.sqlite", version="2.0")
+    upgraded.get_or_extract(["Musk in Berlin"], extract)
+    assert len(calls) == 2
+
+
+def test_cache_clear(cache):
+    extract, calls = make_extract()
+    cache.get_or_extract(["Musk in Berlin"], extract)
+    assert cache.clear() == 1
+    assert cache.stats()["misses"] == 0
+    cache.get_or_extract(["Musk in Berlin"], extract)
+    assert len(calls) == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
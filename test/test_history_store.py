@@ -0,0 +1,152 @@
+import csv
+from datetime import datetime
+
+import pytest
+from src.history_store import (
+    HistoryStore,
+    build_match_query,
+    import_history_csvs,
+    parse_history_filename,
+)
+from test.conftest import article
+
+
+def test_articles_are_upserted_by_url(store):
+    first = store.start_run("Elon Musk", "en")
+    store.add_articles(first, [article(1), article(2)], language="en")
+    second = store.start_run("elon musk", "en")
+    store.add_articles(second, [article(2, title="Headline 2 (updated)"), article(3)], language="en")
+
+    assert store.stats()["articles"] == 3
+    assert store.stats()["runs"] == 2
+    assert store.stats()["sightings"] == 4
+    assert store.run_articles(second)[0]["title"] == "Headline 2 (updated)"
+    assert store.topics() == [("elon musk", "en", 2, 3)]
+
+
+def test_run_keeps_arrival_order_across_pages(store):
+    run_id = store.start_run("spacex", "en")
+    store.add_articles(run_id, [article(5), article(4)], language="en")
+    assert store.add_articles(run_id, [article(4), article(3)], language="en") == 1
+    assert [item["url"][-1] for item in store.run_articles(run_id)] == ["5", "4", "3"]
+
+
+def test_articles_for_topic_filters_and_sorts(store):
+    english = store.start_run("spacex", "en")
+    store.add_articles(
+        english,
+        [article(1, published_at="2024-07-01T00:00:00Z"), article(2, published_at="2024-07-20T00:00:00Z")],
+        language="en",
+    )
+    german = store.start_run("spacex", "de")
+    store.add_articles(german, [article(3, published_at="2024-07-10T00:00:00Z")], language="de")
+
+    assert [item["url"][-1] for item in store.articles_for_topic("SpaceX")] == ["2", "3", "1"]
+    assert len(store.articles_for_topic("spacex", language="de")) == 1
+    assert len(store.articles_for_topic("spacex", since="2024-07-05")) == 2
+    assert len(store.articles_for_topic("spacex", limit=1)) == 1
+
+
+def test_export_csv(store, tmp_path):
+    run_id = store.start_run("spacex", "en")
+    store.add_articles(run_id, [article(1), article(2)], language="en")
+    save_file = tmp_path / "export.csv"
+    assert store.export_csv(save_file, run_id=run_id) == 2
+    with open(save_file, newline="") as csv_file:
+        assert [row["url"] for row in csv.DictReader(csv_file)] == [
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+    with pytest.raises(ValueError):
+        store.export_csv(save_file)
+
+
+def test_parse_history_filename():
+    topic, language, started_at = parse_history_filename(
+        "crypto_and_blockchain__articles_en_20240724_155026.csv"
+    )
+    assert (topic, language, started_at) == (
+        "crypto and blockchain",
+        "en",
+        datetime(2024, 7, 24, 15, 50, 26),
+    )
+    assert parse_history_filename("notes.csv") == ("notes", "en", None)
+
+
+def test_import_history_csvs_runs_once(store, tmp_path):
+    folder = tmp_path / "history"
+    folder.mkdir()
+    with open(folder / "spacex_articles_de_20240724_155108.csv", "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=["title", "url", "publishedAt"])
+        writer.writeheader()
+        writer.writerows([article(1), article(2), {"title": "[Removed]", "url": "https://removed.com", "publishedAt": ""}])
+
+    report = import_history_csvs(store, folder)
+    assert (report.files, report.skipped, report.articles) == (1, 0, 2)
+    assert store.topics() == [("spacex", "de", 1, 2)]
+
+    again = import_history_csvs(store, folder)
+    assert (again.files, again.skipped, again.articles) == (0, 1, 0)
+
+
+def test_articles_after_pages_in_save_order(store):
+    run_id = store.start_run("spacex", "en")
+    store.add_articles(run_id, [article(1), article(2), article(3)], language="en")
+    first = store.articles_after(0, limit=2)
+    assert [item["url"][-1] for _, item in first] == ["1", "2"]
+    assert first[0][1]["language"] == "en"
+    # Saving an article again keeps its row, new articles come after the last page
+    store.add_articles(run_id, [article(1, title="Headline 1 (updated)"), article(4)], language="en")
+    rest = store.articles_after(first[-1][0])
+    assert [item["url"][-1] for _, item in rest] == ["3", "4"]
+
+
+def test_search_ranks_title_matches_and_follows_updates(store):
+    run_id = store.start_run("spacex", "en")
+    store.add_articles(
+        run_id,
+        [
+            article(1, title="Starship lands after fifth test flight"),
+            article(2, title="Elon Musk talks about Starship plans"),
+            {"title": "Tesla earnings beat", "url": "https://starship.example.com/3", "publishedAt": ""},
+        ],
+        language="en",
+    )
+
+    assert [item["url"][-1] for item in store.search("starship")] == ["1", "2", "3"]
+    assert [item["url"][-1] for item in store.search('"elon musk" starship')] == ["2"]
+    assert store.search("starship", language="de") == []
+
+    # Saving an article again updates the index with its new title
+    store.add_articles(run_id, [article(1, title="Booster caught by the tower")], language="en")
+    assert [item["url"][-1] for item in store.search("booster")] == ["1"]
+    assert [item["url"][-1] for item in store.search("lands")] == []
+
+
+def test_search_falls_back_to_any_word(store):
+    run_id = store.start_run("keyboards", "en")
+    store.add_articles(
+        run_id, [article(1, title="Split keyboards"), article(2, title="Ergonomic chairs")], language="en"
+    )
+    assert [item["url"][-1] for item in store.search("ergonomic keyboards")] == ["1", "2"]
+    assert store.search("!!") == []
+
+
+def test_existing_database_is_indexed_on_open(tmp_path):
+    path = tmp_path / "history.sqlite"
+    store = HistoryStore(path)
+    store.add_articles(store.start_run("crypto", "en"), [article(1, title="Bitcoin rallies")], language="en")
+    store._connection.execute("DROP TABLE articles_fts")
+    store.close()
+
+    assert [item["url"][-1] for item in HistoryStore(path).search("bitcoin")] == ["1"]
+
+
+def test_build_match_query_quotes_terms():
+    assert build_match_query('"Elon Musk" star-ship NOT') == '"Elon Musk" "star ship" "NOT"'
+    assert build_match_query("crypto bitcoin", any_term=True) == '"crypto" OR "bitcoin"'
+    assert build_match_query('""') == ""
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests  # type: ignore[import-untyped]
+from src.utils import http_session
+from src.utils.http_session import PooledSession
+
+
+class MockResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class MockSession(requests.Session):
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr(http_session.time, "sleep", waited.append)
+    return waited
+
+
+def test_session_retries_rate_limit_with_retry_after(sleeps):
+    mock = MockSession([MockResponse(429, {"Retry-After": "2"}), MockResponse(200)])
+    session = PooledSession(session=mock)
+    response = session.get("http://test.test")
+    assert response.status_code == 200
+    assert sleeps == [2.0]
+    assert session.last.retries == 1
+    assert session.last.status_code == 200
+
+
+def test_session_backs_off_on_server_errors(sleeps):
+    mock = MockSession([MockResponse(503), MockResponse(500), MockResponse(200)])
+    session = PooledSession(session=mock, backoff_factor=1.0)
+    session.get("http://test.test")
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+
+
+def test_session_returns_last_response_after_retries(sleeps):
+    mock = MockSession([MockResponse(429)] * 3)
+    session = PooledSession(session=mock, max_retries=2)
+    assert session.get("http://test.test").status_code == 429
+    assert session.stats()["retries"] == 2
+
+
+def test_session_does_not_retry_client_errors(sleeps):
+    mock = MockSession([MockResponse(401)])
+    session = PooledSession(session=mock)
+    assert session.get("http://test.test").status_code == 401
+    assert sleeps == []
+
+
+def test_session_raises_after_connection_errors(sleeps):
+    error = requests.exceptions.ConnectionError("Network Error")
+    mock = MockSession([error, error])
+    session = PooledSession(session=mock, max_retries=1)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get("http://test.test")
+    assert session.last.status_code is None
+
+
+def test_session_sets_timeouts(sleeps):
+    mock = MockSession([MockResponse(200)])
+    session = PooledSession(session=mock, connect_timeout=1, read_timeout=5)
+    session.get("http://test.test")
+    assert mock.calls[0]["timeout"] == (1, 5)
+
+
+def test_retry_after_is_capped():
+    session = PooledSession(max_backoff=10)
+    assert session.retry_after(MockResponse(429, {"Retry-After": "600"})) == 10
+    assert session.retry_after(MockResponse(429, {"Retry-After": "soon"})) is None
+
+
+
+def test_retry_after_accepts_http_dates():
+    session = PooledSession(max_backoff=60)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    for zone in ("GMT", "+0000", "-0000"):
+        value = retry_at.strftime(f"%a, %d %b %Y %H:%M:%S {zone}")
+        assert 25 <= session.retry_after(MockResponse(429, {"Retry-After": value})) <= 30
+    past = "Wed, 21 Oct 2015 07:28:00 -0000"
+    assert session.retry_after(MockResponse(429, {"Retry-After": past})) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main()
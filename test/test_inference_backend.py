@@ -0,0 +1,122 @@
+import types
+from pathlib import Path
+
+import pytest
+from src import inference_backend, model_registry
+from src.inference_backend import load_backend_pipeline, missing_backend_packages, onnx_export_dir
+from src.model_registry import ModelRegistry, configure_model_registry, estimate_model_bytes
+from src.summarize_content import summarize_content_pipeline
+from src.utils.summary_cache import SummaryCache
+
+
+class FakeTensor:
+    def __init__(self, count, size):
+        self.count, self.size = count, size
+
+    def numel(self):
+        return self.count
+
+    def element_size(self):
+        return self.size
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="torch-int8"):
+        load_backend_pipeline("model", {}, backend="tensorrt")
+    with pytest.raises(ValueError):
+        configure_model_registry(backend="tensorrt")
+
+
+def test_onnx_export_dir_is_flat_per_model():
+    assert onnx_export_dir("facebook/bart-large-cnn", Path("exports")) == Path(
+        "exports/facebook--bart-large-cnn"
+    )
+
+
+def test_missing_backend_packages(monkeypatch):
+    monkeypatch.setattr(
+        inference_backend.importlib.util, "find_spec", lambda name: None if name == "optimum" else object()
+    )
+    assert missing_backend_packages("onnx") == ["optimum"]
+    assert missing_backend_packages("torch") == []
+
+
+def test_configured_registry_loads_through_backend(monkeypatch):
+    calls = []
+
+    def fake_load(model_id, pipeline_kwargs, **options):
+        calls.append((model_id, options))
+        return object()
+
+    monkeypatch.setattr(model_registry, "load_backend_pipeline", fake_load)
+    monkeypatch.setattr(model_registry, "_registry", ModelRegistry())
+    registry = configure_model_registry(
+        backend="torch-int8", intra_op_threads=4, onnx_dir=Path("history/replay/.cache/onnx")
+    )
+    registry.get("model", {"max_length": 10})
+    assert calls[0][0] == "model"
+    assert calls[0][1]["backend"] == "torch-int8"
+    assert calls[0][1]["intra_op_threads"] == 4
+    assert calls[0][1]["onnx_dir"] == Path("history/replay/.cache/onnx")
+    assert registry.stats()["backend"] == "torch-int8"
+    configure_model_registry()
+
+
+def test_torch_backend_keeps_fp32_loader(monkeypatch):
+    monkeypatch.setattr(
+        model_registry, "load_summarization_pipeline", lambda model_id, kwargs: ("fp32", model_id)
+    )
+    monkeypatch.setattr(inference_backend, "configure_threads", lambda *threads: None)
+    assert load_backend_pipeline("model", {}) == ("fp32", "model")
+
+
+def test_summaries_of_other_backends_are_cached_apart(monkeypatch, tmp_path):
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def invoke(self, content):
+            return content.upper()
+
+    cache = SummaryCache(tmp_path / "summaries.sqlite")
+    for backend in ("torch", "torch-int8", "torch-int8"):
+        registry = ModelRegistry(loader=MockSummarizer, backend=backend)
+        summarize_content_pipeline("headline", registry=registry, cache=cache)
+    assert cache.stats()["misses"] == 2 and cache.stats()["hits"] == 1
+
+
+def test_estimate_model_bytes_counts_packed_int8_weights():
+    model = types.SimpleNamespace(
+        state_dict=lambda: {
+            "embed.weight": FakeTensor(100, 4),
+            "linear._packed_params._packed_params": (FakeTensor(50, 1), FakeTensor(5, 4)),
+            "linear.scale": 1.0,
+        }
+    )
+    assert estimate_model_bytes(types.SimpleNamespace(pipeline=types.SimpleNamespace(model=model))) == 470
+
+
+def test_estimate_model_bytes_counts_tied_weights_once():
+    embeddings = FakeTensor(100, 4)
+    model = types.SimpleNamespace(
+        state_dict=lambda: {
+            "model.shared.weight": embeddings,
+            "model.encoder.embed_tokens.weight": embeddings,
+            "model.decoder.embed_tokens.weight": embeddings,
+            "lm_head.weight": embeddings,
+            "final_logits_bias": FakeTensor(10, 4),
+        }
+    )
+    assert estimate_model_bytes(types.SimpleNamespace(pipeline=types.SimpleNamespace(model=model))) == 440
+
+
+def test_estimate_model_bytes_of_onnx_export(tmp_path):
+    (tmp_path / "encoder_model.onnx").write_bytes(b"x" * 30)
+    (tmp_path / "decoder_model.onnx").write_bytes(b"x" * 20)
+    (tmp_path / "config.json").write_text("{}")
+    model = types.SimpleNamespace(model_save_dir=tmp_path)
+    assert estimate_model_bytes(types.SimpleNamespace(pipeline=types.SimpleNamespace(model=model))) == 50
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+import requests  # type: ignore[import-untyped]
+from src.history_store import HistoryStore
+from src.mock_news_api import MockNewsApiServer, load_corpus, parse_query
+from src.search_news import iter_news_pages, search_news_articles
+from src.utils.http_session import PooledSession
+from test.conftest import article
+
+
+ARTICLES = [
+    article(1, "SpaceX launches Starship", "2024-07-01T08:00:00Z", language="en"),
+    article(2, "Musk says SpaceX will reach Mars, SpaceX confirms", "2024-07-03T08:00:00Z", language="en"),
+    article(3, "Tesla recalls Cybertruck", "2024-07-02T08:00:00Z", language="en"),
+    article(4, "SpaceX startet Starship", "2024-07-04T08:00:00Z", language="de"),
+]
+
+
+@pytest.fixture
+def server():
+    with MockNewsApiServer(ARTICLES) as running:
+        yield running
+
+
+def urls(body):
+    return [item["url"][-1] for item in body["articles"]]
+
+
+def test_parse_query_supports_phrases_and_operators():
+    assert parse_query('"Elon Musk" +SpaceX -Tesla') == [(["elon musk", "spacex"], ["tesla"])]
+    assert parse_query("(crypto AND bitcoin) OR NOT ethereum") == [
+        (["crypto", "bitcoin"], []),
+        ([], ["ethereum"]),
+    ]
+
+
+def test_everything_filters_sorts_and_pages(server):
+    status, body, _ = server.respond("/v2/everything", {"q": "spacex", "apiKey": "key"})
+    assert status == 200
+    assert body["totalResults"] == 3
+    assert urls(body) == ["4", "2", "1"]  # publishedAt is the default order
+
+    _, body, _ = server.respond(
+        "/v2/everything", {"q": "spacex", "apiKey": "key", "language": "en", "sortBy": "relevancy"}
+    )
+    assert urls(body) == ["2", "1"]
+
+    _, body, _ = server.respond(
+        "/v2/everything",
+        {"q": "spacex OR tesla", "apiKey": "key", "from": "2024-07-02", "pageSize": "1", "page": "2"},
+    )
+    assert body["totalResults"] == 3
+    assert urls(body) == ["2"]
+    assert set(body["articles"][0]) >= {"source", "title", "url", "publishedAt", "description"}
+
+    # The end date includes the articles of its last second
+    _, body, _ = server.respond(
+        "/v2/everything",
+        {"q": "spacex OR tesla", "apiKey": "key", "from": "2024-07-02", "to": "2024-07-03T08:00:00"},
+    )
+    assert urls(body) == ["2", "3"]
+
+
+def test_error_responses_match_news_api():
+    server = MockNewsApiServer(ARTICLES, api_key="secret", max_requests=3, retry_after=7)
+
+    assert server.respond("/v2/everything", {"q": "x", "apiKey": ""})[1]["code"] == "apiKeyMissing"
+    assert server.respond("/v2/everything", {"q": "x", "apiKey": "wrong"})[0] == 401
+    status, body, _ = server.respond("/v2/everything", {"apiKey": "secret"})
+    assert (status, body["code"]) == (400, "parametersMissing")
+    status, body, headers = server.respond("/v2/everything", {"q": "x", "apiKey": "secret"})
+    assert (status, body["code"], headers["Retry-After"]) == (429, "rateLimited", "7")
+    assert server.stats()["statuses"] == {400: 1, 401: 2, 429: 1}
+
+    failing = MockNewsApiServer(ARTICLES, error_rate=1.0)
+    assert failing.respond("/v2/everything", {"q": "x", "apiKey": "key"})[0] == 500
+
+
+def test_search_functions_run_against_the_server(server):
+    session = PooledSession(max_retries=0)
+    articles = search_news_articles("tesla", "key", url=server.url, session=session)
+    assert [item["url"][-1] for item in articles] == ["3"]
+
+    pages = list(
+        iter_news_pages(
+            "spacex", "key", language=None, url=server.url, page_size=1, max_articles=3, session=session
+        )
+    )
+    assert sorted(item["url"][-1] for page in pages for item in page) == ["1", "2", "4"]
+    assert server.stats()["requests"] == 4
+
+    response = requests.get(server.url, params={"q": "spacex"})
+    assert response.status_code == 401
+    assert response.json()["status"] == "error"
+
+
+def test_failed_requests_are_retried_by_the_client():
+    with MockNewsApiServer(ARTICLES, error_rate=0.5, seed=3) as server:
+        session = PooledSession(max_retries=10, backoff_factor=0)
+        for _ in range(5):
+            assert len(search_news_articles("spacex", "key", url=server.url, session=session)) == 2
+        assert server.stats()["statuses"][500] > 0
+
+
+def test_load_corpus_reads_recorded_sources(tmp_path):
+    assert len(load_corpus("synthetic", size=20)) == 20
+
+    recorded = tmp_path / "responses.json"
+    recorded.write_text(json.dumps([{"status": "ok", "articles": ARTICLES[:2]}, {"articles": ARTICLES[2:]}]))
+    assert load_corpus(str(recorded)) == ARTICLES
+
+    store = HistoryStore(tmp_path / "history.sqlite")
+    store.add_articles(store.start_run("spacex", "en"), ARTICLES[:2], language="en")
+    store.close()
+    assert {item["language"] for item in load_corpus(str(tmp_path / "history.sqlite"))} == {"en"}
+
+    with pytest.raises(FileNotFoundError):
+        load_corpus(str(tmp_path / "missing.json"))
@@ -0,0 +1,69 @@
+import pytest
+from src.model_registry import ModelRegistry, make_registry_key
+
+
+@pytest.fixture
+def loader_calls():
+    return []
+
+
+@pytest.fixture
+def registry(loader_calls):
+    def fake_loader(model_id, pipeline_kwargs):
+        loader_calls.append(model_id)
+        return {"model_id": model_id, **pipeline_kwargs}
+
+    return ModelRegistry(max_models=2, loader=fake_loader, sizer=lambda _: 0)
+
+
+def test_registry_reuses_loaded_model(registry, loader_calls):
+    first = registry.get("model-a", {"max_length": 100})
+    second = registry.get("model-a", {"max_length": 100})
+    assert first is second
+    assert loader_calls == ["model-a"]
+    stats = registry.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_registry_key_includes_pipeline_kwargs(registry, loader_calls):
+    registry.get("model-a", {"max_length": 100})
+    registry.get("model-a", {"max_length": 50})
+    assert loader_calls == ["model-a", "model-a"]
+    assert make_registry_key("model-a", {"a": 1, "b": 2}) == make_registry_key(
+        "model-a", {"b": 2, "a": 1}
+    )
+
+
+def test_registry_evicts_least_recently_used(registry, loader_calls):
+    registry.get("model-a", {})
+    registry.get("model-b", {})
+    registry.get("model-a", {})
+    registry.get("model-c", {})
+    assert registry.stats()["models"] == ["model-a", "model-c"]
+    assert registry.stats()["evictions"] == 1
+
+
+def test_registry_memory_budget():
+    registry = ModelRegistry(
+        max_models=10,
+        memory_budget_mb=1,
+        loader=lambda model_id, kwargs: model_id,
+        sizer=lambda _: 700 * 1024,
+    )
+    registry.get("model-a", {})
+    registry.get("model-b", {})
+    assert registry.stats()["models"] == ["model-b"]
+
+
+def test_registry_release(registry):
+    registry.get("model-a", {})
+    registry.get("model-b", {})
+    assert registry.release("model-a") == 1
+    assert registry.stats()["models"] == ["model-b"]
+    assert registry.release() == 1
+    assert len(registry) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,109 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import nltk  # type: ignore[import-untyped]
+import pytest
+from src.utils import nltk_resources
+from src.utils.nltk_resources import (
+    NLTK_RESOURCES,
+    check_resources,
+    ensure_resources,
+    missing_resources,
+)
+
+
+@pytest.fixture
+def nltk_data(tmp_path, monkeypatch):
+    data_dir = tmp_path / "nltk_data"
+    for resource in NLTK_RESOURCES.values():
+        (data_dir / resource).mkdir(parents=True)
+    monkeypatch.setattr(nltk.data, "path", [str(data_dir)])
+    return data_dir
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    return tmp_path / "manifest.json"
+
+
+def test_check_resources_finds_local_resources(nltk_data, manifest):
+    locations = check_resources(manifest)
+    assert all(locations.values())
+    assert manifest.exists()
+
+
+def test_check_resources_uses_cached_manifest(nltk_data, manifest, monkeypatch):
+    check_resources(manifest)
+
+    def fail_find(*args, **kwargs):
+        raise AssertionError("Manifest should avoid NLTK lookups")
+
+    monkeypatch.setattr(nltk.data, "find", fail_find)
+    assert all(check_resources(manifest).values())
+
+
+def test_check_resources_detects_removed_resource(nltk_data, manifest):
+    check_resources(manifest)
+    (nltk_data / NLTK_RESOURCES["words"]).rmdir()
+    assert missing_resources(manifest) == ["words"]
+
+
+def test_ensure_resources_downloads_only_missing(nltk_data, manifest, monkeypatch):
+    (nltk_data / NLTK_RESOURCES["words"]).rmdir()
+    downloads = []
+
+    def fake_download(name, **kwargs):
+        downloads.append(name)
+        (nltk_data / NLTK_RESOURCES[name]).mkdir(parents=True)
+
+    monkeypatch.setattr(nltk, "download", fake_download)
+    assert ensure_resources(download=True, offline=False, manifest_path=manifest) == []
+    assert downloads == ["words"]
+
+
+def test_ensure_resources_offline_never_downloads(nltk_data, manifest, monkeypatch):
+    (nltk_data / NLTK_RESOURCES["words"]).rmdir()
+    monkeypatch.setattr(nltk, "download", lambda *a, **k: pytest.fail("Downloaded"))
+    missing = ensure_resources(download=True, offline=True, manifest_path=manifest)
+    assert missing == ["words"]
+
+
+def test_ensure_resources_honours_offline_env(nltk_data, manifest, monkeypatch):
+    (nltk_data / NLTK_RESOURCES["words"]).rmdir()
+    monkeypatch.setenv(nltk_resources.OFFLINE_ENV, "1")
+    monkeypatch.setattr(nltk, "download", lambda *a, **k: pytest.fail("Downloaded"))
+    assert ensure_resources(download=True, manifest_path=manifest) == ["words"]
+
+
+def test_import_does_not_touch_network():
+    script = (
+        "import socket, time\n"
+        "calls = []\n"
+        "def blocked(*args, **kwargs):\n"
+        "    calls.append(args)\n"
+        "    raise RuntimeError('Network access during import')\n"
+        "socket.socket.connect = blocked\n"
+        "socket.create_connection = blocked\n"
+        "import nltk\n"
+        "nltk.download = blocked\n"
+        "start = time.perf_counter()\n"
+        "import src.summarize_content\n"
+        "print(len(calls), time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    network_calls, import_time = result.stdout.split()[-2:]
+    assert network_calls == "0"
+    # Without resource checks at import time the module loads well within a second
+    assert float(import_time) < 2.0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,139 @@
+import pytest
+from src.utils.disk_cache import DiskCache, make_cache_key
+from src.utils.response_cache import ResponseCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return ResponseCache(
+        tmp_path / "cache.sqlite", ttl=60, stale_ttl=300, max_entries=10, clock=clock
+    )
+
+
+def make_fetch():
+    calls = []
+
+    def fetch():
+        calls.append(len(calls))
+        return [{"title": f"Article {len(calls)}", "url": "http://test.test"}]
+
+    return fetch, calls
+
+
+def test_cache_serves_fresh_results(cache):
+    fetch, calls = make_fetch()
+    first = cache.get_or_fetch({"q": "test"}, fetch)
+    second = cache.get_or_fetch({"q": "test"}, fetch)
+    assert first == second
+    assert len(calls) == 1
+    assert cache.last_outcome == "fresh"
+
+
+def test_cache_keys_on_query_parameters(cache):
+    fetch, calls = make_fetch()
+    cache.get_or_fetch({"q": "test", "language": "en"}, fetch)
+    cache.get_or_fetch({"q": "test", "language": "de"}, fetch)
+    assert len(calls) == 2
+
+
+def test_cache_revalidates_stale_results(cache, clock):
+    fetch, calls = make_fetch()
+    cache.get_or_fetch({"q": "test"}, fetch)
+    clock.now += 120
+    stale = cache.get_or_fetch({"q": "test"}, fetch)
+    assert stale[0]["title"] == "Article 1"
+    assert cache.last_outcome == "stale"
+    cache.wait()
+    assert len(calls) == 2
+    fresh = cache.get_or_fetch({"q": "test"}, fetch)
+    assert fresh[0]["title"] == "Article 2"
+    assert cache.last_outcome == "fresh"
+
+
+def test_cache_refetches_expired_results(cache, clock):
+    fetch, calls = make_fetch()
+    cache.get_or_fetch({"q": "test"}, fetch)
+    clock.now += 1000
+    cache.get_or_fetch({"q": "test"}, fetch)
+    assert cache.last_outcome == "miss"
+    assert len(calls) == 2
+
+
+def test_cache_stats_and_clear(cache):
+    fetch, _ = make_fetch()
+    cache.get_or_fetch({"q": "test"}, fetch)
+    cache.get_or_fetch({"q": "test"}, fetch)
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert cache.clear() == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_streams_pages_and_stores_complete_result(cache):
+    def stream():
+        yield [{"title": "Article 1"}]
+        yield [{"title": "Article 2"}]
+
+    pages = cache.iter_or_fetch({"q": "test"}, stream)
+    assert next(pages) == [{"title": "Article 1"}]
+    assert cache.stats()["entries"] == 0
+    assert list(pages) == [[{"title": "Article 2"}]]
+    cached = list(cache.iter_or_fetch({"q": "test"}, stream))
+    assert cached == [[{"title": "Article 1"}, {"title": "Article 2"}]]
+    assert cache.last_outcome == "fresh"
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, clock):
+    store = DiskCache(tmp_path / "store.sqlite", max_entries=2, clock=clock)
+    for key in ("a", "b"):
+        store.set(key, key)
+        clock.now += 1
+    store.get("a")
+    clock.now += 1
+    store.set("c", "c")
+    assert store.get("b") is None
+    assert store.get("a").value == "a"
+
+
+def test_disk_cache_respects_byte_limit(tmp_path, clock):
+    store = DiskCache(tmp_path / "store.sqlite", max_bytes=25, clock=clock)
+    for key in ("a", "b", "c"):
+        store.set(key, "x" * 10)
+        clock.now += 1
+    assert len(store) == 2
+    assert store.get("a") is None
+
+
+def test_disk_cache_get_and_set_many(tmp_path, clock):
+    store = DiskCache(tmp_path / "store.sqlite", max_age=100, clock=clock)
+    store.set_many({"a": 1, "b": [2]})
+    clock.now += 50
+    store.set("c", 3)
+    clock.now += 60
+    found = store.get_many(["a", "b", "c", "missing", "a"])
+    assert {key: entry.value for key, entry in found.items()} == {"c": 3}
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 3
+
+
+def test_make_cache_key_is_stable():
+    assert make_cache_key({"q": "a", "l": "en"}) == make_cache_key({"l": "en", "q": "a"})
+    assert make_cache_key({"q": "a"}) != make_cache_key({"q": "b"})
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,6 +1,13 @@
+import threading
 import pytest
 import requests # type: ignore[import-untyped]
-from src.search_news import search_news_articles
+from src.search_news import (
+    iter_news_articles,
+    iter_news_pages,
+    news_api_url,
+    search_news_articles,
+)
+from src.utils import http_session
 
 
 @pytest.fixture
@@ -9,6 +16,7 @@ def mock_requests(monkeypatch):
         def __init__(self, json_data, status_code):
             self.json_data = json_data
             self.status_code = status_code
+            self.headers = {}
 
         def json(self):
             return self.json_data
@@ -58,7 +66,10 @@ def mock_requests(monkeypatch):
             case _:
                 raise requests.exceptions.RequestException("Network Error")
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: mock_get(url, **kwargs)
+    )
+    monkeypatch.setattr(http_session.time, "sleep", lambda seconds: None)
 
 
 def test_search_news_articles_success(mock_requests):
@@ -89,5 +100,81 @@ def test_search_news_articles_network_error(mock_requests):
         search_news_articles("network_error", "dummy_api_key")
 
 
+class MockPagedSession:
+    """Serves 250 numbered articles in pages, remembering which pages were requested"""
+
+    def __init__(self, total=250):
+        self.total = total
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, **kwargs):
+        page, page_size = params["page"], params["pageSize"]
+        with self.lock:
+            self.pages.append(page)
+        start = (page - 1) * page_size
+        articles = [
+            {
+                "title": f"Article {index}",
+                "url": f"http://test.test/{index}",
+                "publishedAt": "2024-07-19T12:34:56Z",
+            }
+            for index in range(start, min(start + page_size, self.total))
+        ]
+
+        class Response:
+            status_code = 200
+
+            def json(self):
+                return {"totalResults": 250, "articles": articles}
+
+        return Response()
+
+
+def test_iter_news_pages_fetches_all_pages():
+    session = MockPagedSession()
+    pages = list(
+        iter_news_pages(
+            "test", "dummy", page_size=100, max_articles=1000, session=session
+        )
+    )
+    assert len(pages[0]) == 100
+    assert sorted(len(page) for page in pages) == [50, 100, 100]
+    assert sorted(session.pages) == [1, 2, 3]
+
+
+def test_iter_news_pages_first_page_comes_first():
+    session = MockPagedSession()
+    first_page = next(
+        iter_news_pages("test", "dummy", page_size=10, max_articles=50, session=session)
+    )
+    assert first_page[0]["title"] == "Article 0"
+    assert session.pages == [1]
+
+
+def test_iter_news_articles_respects_max_articles():
+    session = MockPagedSession()
+    articles = list(
+        iter_news_articles(
+            "test", "dummy", page_size=20, max_articles=45, session=session
+        )
+    )
+    assert len(articles) == 45
+    assert max(session.pages) == 3
+
+
+def test_iter_news_pages_requires_api_key():
+    with pytest.raises(AssertionError):
+        next(iter_news_pages("test", None, session=MockPagedSession()))
+
+
+
+def test_news_api_url_joins_base_url_and_endpoint():
+    assert news_api_url({}) == "https://newsapi.org/v2/everything"
+    assert news_api_url({"base_url": "http://127.0.0.1:8765/v2", "endpoint": "everything"}) == (
+        "http://127.0.0.1:8765/v2/everything"
+    )
+
+
 if __name__ == "__main__":
     pytest.main()
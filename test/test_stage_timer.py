@@ -0,0 +1,69 @@
+import json
+import pstats
+
+import pytest
+from src.utils.stage_timer import StageRecord, StageTimer, format_stage_table
+
+
+def test_stage_records_wall_and_cpu_time():
+    timer = StageTimer(show_table=False)
+    with timer.query("topic"):
+        with timer.stage("busy"):
+            sum(range(200_000))
+    (record,) = timer.records
+    assert record.stage == "busy"
+    assert record.wall_seconds > 0
+    assert record.cpu_seconds >= 0
+    assert record.peak_rss_mb is None or record.peak_rss_mb > 0
+
+
+def test_query_appends_metrics_and_prints_table(tmp_path, capsys):
+    metrics = tmp_path / "metrics.jsonl"
+    timer = StageTimer(metrics_path=metrics)
+    for topic in ("first", "second"):
+        with timer.query(topic):
+            with timer.stage("fetch"):
+                pass
+            with timer.stage("summarize"):
+                pass
+    records = [json.loads(line) for line in metrics.read_text().splitlines()]
+    assert [(record["query"], record["stage"]) for record in records] == [
+        ("first", "fetch"),
+        ("first", "summarize"),
+        ("second", "fetch"),
+        ("second", "summarize"),
+    ]
+    assert {"wall_seconds", "cpu_seconds", "peak_rss_mb", "timestamp"} <= set(records[0])
+    assert "summarize" in capsys.readouterr().out
+
+
+def test_query_reports_when_left_early(tmp_path):
+    metrics = tmp_path / "metrics.jsonl"
+    timer = StageTimer(metrics_path=metrics, show_table=False)
+    for _ in range(1):
+        with timer.query("topic"):
+            with timer.stage("fetch"):
+                pass
+            continue
+    assert len(metrics.read_text().splitlines()) == 1
+
+
+def test_query_dumps_profile(tmp_path):
+    timer = StageTimer(profile_dir=tmp_path / "profiles", show_table=False)
+    with timer.query("Elon Musk!"):
+        with timer.stage("sort"):
+            sorted(range(10_000), reverse=True)
+    assert timer.last_profile.name.startswith("elon_musk_")
+    stats = pstats.Stats(str(timer.last_profile))
+    assert any(function[2] == "<built-in method builtins.sorted>" for function in stats.stats)
+
+
+def test_format_stage_table_has_total_row():
+    table = format_stage_table(
+        [StageRecord("fetch", 1.5, 0.25, 100.0), StageRecord("ner", 0.5, 0.5, None)]
+    )
+    assert table.splitlines()[-1].split() == ["Total", "2.000", "0.750"]
+
+
+if __name__ == "__main__":
+    pytest.main()
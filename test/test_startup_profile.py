@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.utils.startup_profile import format_startup_profile, parse_importtime
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       500 |        500 |     yaml.error
+import time:      1500 |       2000 |   yaml
+import time:       300 |        300 |       requests.compat
+import time:       700 |       1000 |     requests
+import time:      1000 |       4000 | main
+"""
+
+
+def test_parse_importtime_groups_by_package():
+    costs = parse_importtime(IMPORTTIME_OUTPUT.splitlines())
+    by_package = {cost.package: cost for cost in costs}
+    assert [cost.package for cost in costs] == ["yaml", "requests", "main"]
+    assert by_package["yaml"].self_ms == pytest.approx(2.0)
+    assert by_package["yaml"].cumulative_ms == pytest.approx(2.0)
+    assert by_package["yaml"].modules == 2
+    assert by_package["main"].cumulative_ms == pytest.approx(4.0)
+
+
+def test_format_startup_profile_has_total():
+    table = format_startup_profile(parse_importtime(IMPORTTIME_OUTPUT.splitlines()))
+    assert table.splitlines()[-1].startswith("Total")
+    assert "4.0" in table.splitlines()[-1]
+
+
+def test_main_import_defers_heavy_packages():
+    script = (
+        "import sys, main\n"
+        "heavy = ('pandas', 'tabulate', 'langchain_huggingface', 'torch', 'transformers', 'nltk')\n"
+        "print(','.join(name for name in heavy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+if __name__ == "__main__":
+    pytest.main()
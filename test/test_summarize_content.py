@@ -1,5 +1,19 @@
+import sys
+import types
+from multiprocessing import get_all_start_methods, get_context
+
 import pytest
-from src.summarize_content import extract_named_entities_nltk, summarize_content_pipeline
+from src.model_registry import ModelRegistry
+from src.utils.summary_cache import SummaryCache
+from src.summarize_content import (
+    extract_named_entities_batch,
+    extract_named_entities_nltk,
+    summarize_content_pipeline,
+    summarize_contents_batch,
+    stream_summary,
+    chunk_by_tokens,
+    summarize_map_reduce,
+)
 
 
 def test_extract_named_entities():
@@ -19,12 +33,260 @@ def test_summarize_content(monkeypatch):
         def __call__(self, *args, **kwargs):
             return [{"summary_text": "This is a summary"}]
 
-    monkeypatch.setattr("langchain_huggingface.HuggingFacePipeline", MockSummarizer)
+        def invoke(self, content):
+            return self()[0]["summary_text"]
+
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
 
     content = "This is a longform content that serves solely to mock unittest a reusable function. The goal is to see if we get a sensible output that is shorter version of the content here whilst still containing the most important information"
     summary = summarize_content_pipeline(content)
     assert len(summary) < len(content)
 
 
+def test_summarize_contents_batch_buckets_by_length(monkeypatch):
+    calls = []
+
+    class MockPipeline:
+        def __call__(self, contents, batch_size, truncation):
+            calls.append(list(contents))
+            assert batch_size == len(contents) and truncation
+            return [{"summary_text": content.upper()} for content in contents]
+
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            self.pipeline = MockPipeline()
+
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
+
+    contents = ["ccc", "a", "", "dddd", "bb"]
+    summaries = summarize_contents_batch(contents, batch_size=2)
+    assert summaries == ["CCC", "A", "", "DDDD", "BB"]
+    assert calls == [["a", "bb"], ["ccc", "dddd"]]
+
+
+def test_summarize_content_uses_cache_without_loading_model(monkeypatch, tmp_path):
+    loads = []
+
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            loads.append(args)
+
+        def invoke(self, content):
+            return content[:10]
+
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
+    cache = SummaryCache(tmp_path / "summaries.sqlite")
+    first = summarize_content_pipeline("Headline one\nHeadline two", cache=cache)
+    second = summarize_content_pipeline("Headline one\nHeadline two", cache=cache)
+    assert first == second == "Headline o"
+    assert len(loads) == 1
+    assert cache.stats()["hits"] == 1
+
+
+class FakeStreamer:
+    """Stand-in TextIteratorStreamer handing over the text put by generate"""
+
+    def __init__(self, tokenizer, skip_prompt, skip_special_tokens, timeout):
+        self.pieces = []
+        self.ended = False
+
+    def put(self, text):
+        self.pieces.append(text)
+
+    def end(self):
+        self.ended = True
+
+    def __iter__(self):
+        return iter(self.pieces)
+
+
+@pytest.fixture
+def streaming_model(monkeypatch):
+    """Stand-in pipeline whose model generates one word per token into the streamer"""
+    calls = []
+
+    class Model:
+        def generate(self, input_ids, streamer, **kwargs):
+            calls.append(kwargs)
+            if input_ids == ["fail"]:
+                raise RuntimeError("out of memory")
+            for word in input_ids[0].split():
+                streamer.put(word.upper() + " ")
+            streamer.end()
+
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            self.pipeline = types.SimpleNamespace(
+                model=Model(),
+                tokenizer=lambda contents, return_tensors, truncation: {"input_ids": contents},
+            )
+
+    monkeypatch.setitem(
+        sys.modules, "transformers", types.SimpleNamespace(TextIteratorStreamer=FakeStreamer)
+    )
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
+    return calls
+
+
+def test_stream_summary_yields_pieces_and_caches_them(streaming_model, tmp_path):
+    cache = SummaryCache(tmp_path / "summaries.sqlite")
+    pieces = list(stream_summary("spacex launches starship", cache=cache))
+    assert pieces == ["SPACEX ", "LAUNCHES ", "STARSHIP "]
+    assert streaming_model == [
+        {"max_length": 100, "min_length": 30, "do_sample": False, "num_beams": 1}
+    ]
+
+    # Streamed again, the cached summary comes in one piece without generating
+    assert list(stream_summary("spacex launches starship", cache=cache)) == [
+        "SPACEX LAUNCHES STARSHIP"
+    ]
+    assert len(streaming_model) == 1
+
+
+def test_stream_summary_raises_generation_errors(streaming_model):
+    with pytest.raises(RuntimeError, match="out of memory"):
+        list(stream_summary("fail"))
+
+
+def test_stream_summary_falls_back_to_langchain_stream(monkeypatch):
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def stream(self, content):
+            yield "whole summary"
+
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
+    assert list(stream_summary("content")) == ["whole summary"]
+
+
+def count_words(texts):
+    return [len(text.split()) for text in texts]
+
+
+def test_chunk_by_tokens_packs_and_splits():
+    titles = ["one two", "three four five", "six", "seven eight"]
+    assert chunk_by_tokens(titles, 6, count_words) == ["one two\nthree four five", "six\nseven eight"]
+    assert chunk_by_tokens(titles, 100, count_words) == ["\n".join(titles)]
+    assert chunk_by_tokens(["", "  "], 10, count_words) == []
+
+    # Long bodies are split at sentence ends, then at words
+    body = "First sentence is here. Second one. " + " ".join(["word"] * 7)
+    chunks = chunk_by_tokens([body], 4, count_words)
+    assert chunks[0] == "First sentence is here."
+    assert all(len(chunk.split()) <= 4 for chunk in chunks)
+    assert sum(len(chunk.split()) for chunk in chunks) == len(body.split())
+
+
+def test_summarize_map_reduce_reduces_to_one_summary(monkeypatch):
+    calls = []
+
+    class MockTokenizer:
+        model_max_length = 12
+
+        def num_special_tokens_to_add(self):
+            return 2
+
+        def __call__(self, texts, add_special_tokens):
+            return {"input_ids": [text.split() for text in texts]}
+
+    class MockPipeline:
+        tokenizer = MockTokenizer()
+
+        def __call__(self, contents, batch_size, truncation):
+            calls.append(len(contents))
+            # Every summary keeps the first two words of its chunk
+            return [{"summary_text": " ".join(content.split()[:2])} for content in contents]
+
+    class MockSummarizer:
+        def __init__(self, *args, **kwargs):
+            self.pipeline = MockPipeline()
+
+    monkeypatch.setattr(
+        "src.summarize_content.get_model_registry",
+        lambda: ModelRegistry(loader=MockSummarizer),
+    )
+
+    titles = [f"headline {index} about spacex" for index in range(40)]
+    result = summarize_map_reduce(titles, batch_size=4)
+    assert result.chunks == 20  # Two four-word titles per ten-token chunk
+    assert result.rounds == 4  # 20 chunks, 7, 3, then the final pass
+    assert result.summary == "headline 0"
+    assert calls == [4] * 5 + [4, 3] + [3] + [1]
+
+    # The last pass summarizes whatever is left once max_rounds is reached
+    calls.clear()
+    assert summarize_map_reduce(titles, max_rounds=1).rounds == 2
+    assert summarize_map_reduce([]).summary == ""
+
+
+@pytest.fixture
+def fake_nltk(monkeypatch):
+    """Stand-in NLTK tagging capitalized words as named entities, counting tagger calls"""
+
+    class Tree(list):
+        def label(self):
+            return "NE"
+
+    def ne_chunk_sents(tagged_sentences):
+        for sentence in tagged_sentences:
+            yield [Tree([token]) if token[1] == "NNP" else token for token in sentence]
+
+    def pos_tag_sents(sentences):
+        calls.append(len(sentences))
+        return [
+            [(word, "NNP" if word[0].isupper() else "NN") for word in sentence]
+            for sentence in sentences
+        ]
+
+    calls = []
+    module = types.SimpleNamespace(
+        sent_tokenize=lambda text: [part for part in text.split(". ") if part],
+        word_tokenize=str.split,
+        pos_tag_sents=pos_tag_sents,
+        ne_chunk_sents=ne_chunk_sents,
+        calls=calls,
+    )
+    monkeypatch.setitem(sys.modules, "nltk", module)
+    return module
+
+
+def test_extract_named_entities_batch_tags_in_one_pass(fake_nltk):
+    titles = ["Elon Musk visits Berlin", "no entities here", "Berlin. Tesla in Berlin"]
+    per_title, total = extract_named_entities_batch(titles)
+    assert per_title[0] == {"Elon Musk": 1, "Berlin": 1}
+    assert per_title[1] == {}
+    assert per_title[2] == {"Berlin": 2, "Tesla": 1}
+    # The combined count is the number of titles naming an entity
+    assert total == {"Berlin": 2, "Elon Musk": 1, "Tesla": 1}
+    assert fake_nltk.calls == [4]  # All four sentences tagged in a single call
+
+
+@pytest.mark.skipif("fork" not in get_all_start_methods(), reason="needs the fork start method")
+def test_extract_named_entities_batch_process_pool(fake_nltk):
+    titles = [f"Title {index} from Reuters" for index in range(7)]
+    # Workers only see the stand-in NLTK if they are forked from this process
+    per_title, total = extract_named_entities_batch(
+        titles, processes=2, chunk_size=3, mp_context=get_context("fork")
+    )
+    assert per_title == extract_named_entities_batch(titles)[0]
+    assert total["Reuters"] == 7
+
+
 if __name__ == "__main__":
     pytest.main()
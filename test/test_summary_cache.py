@@ -0,0 +1,101 @@
+import pytest
+from src.utils.summary_cache import SummaryCache
+
+PARAMS = {
+    "model_id": "facebook/bart-large-cnn",
+    "max_length": 100,
+    "min_length": 30,
+    "do_sample": False,
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_summarize():
+    calls = []
+
+    def summarize(contents):
+        calls.append(list(contents))
+        return [content.upper() for content in contents]
+
+    return summarize, calls
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return SummaryCache(tmp_path / "summaries.sqlite", max_age=60, clock=clock)
+
+
+def test_cache_summarizes_only_new_contents(cache):
+    summarize, calls = make_summarize()
+    assert cache.get_or_summarize(["a", "b", "a"], PARAMS, summarize) == ["A", "B", "A"]
+    assert cache.get_or_summarize(["b", "c"], PARAMS, summarize) == ["B", "C"]
+    assert calls == [["a", "b"], ["c"]]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["entries"] == 3
+
+
+def test_cache_is_keyed_on_model_and_parameters(cache):
+    summarize, calls = make_summarize()
+    cache.get_or_summarize(["a"], PARAMS, summarize)
+    cache.get_or_summarize(["a"], {**PARAMS, "max_length": 50}, summarize)
+    cache.get_or_summarize(["a"], {**PARAMS, "model_id": "google/pegasus-xsum"}, summarize)
+    assert len(calls) == 3
+
+
+def test_cache_is_bypassed_when_sampling(cache):
+    summarize, calls = make_summarize()
+    for _ in range(2):
+        cache.get_or_summarize(["a"], {**PARAMS, "do_sample": True}, summarize)
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bypassed"] == 2
+
+
+def test_cache_drops_old_summaries(cache, clock):
+    summarize, calls = make_summarize()
+    cache.get_or_summarize(["a"], PARAMS, summarize)
+    clock.now += 61
+    cache.get_or_summarize(["a"], PARAMS, summarize)
+    assert len(calls) == 2
+
+
+def test_cache_evicts_beyond_size_limit(tmp_path, clock):
+    cache = SummaryCache(tmp_path / "summaries.sqlite", max_bytes=20, clock=clock)
+    summarize, _ = make_summarize()
+    for content in ("x" * 10, "y" * 10, "z" * 10):
+        cache.get_or_summarize([content], PARAMS, summarize)
+        clock.now += 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_get_and_set_single_summaries(cache):
+    assert cache.get("a", PARAMS) is None
+    cache.set("a", PARAMS, "A")
+    assert cache.get("a", PARAMS) == "A"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # Further parameters get their own entries, the base key stays unchanged
+    assert cache.get("a", {**PARAMS, "num_beams": 1}) is None
+    assert cache.key("a", PARAMS) != cache.key("a", {**PARAMS, "num_beams": 1})
+
+    cache.set("b", {**PARAMS, "do_sample": True}, "B")
+    assert cache.get("b", {**PARAMS, "do_sample": True}) is None
+    assert cache.stats()["entries"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,46 @@
+import time
+import pytest
+from src.utils.warmup import WarmUp
+
+
+def test_warmup_runs_tasks_in_background():
+    calls = []
+    warmup = WarmUp()
+    warmup.add("first", lambda: calls.append("first"))
+    warmup.add("second", lambda: calls.append("second"))
+    warmup.start()
+    warmup.wait()
+    assert calls == ["first", "second"]
+
+
+def test_warmup_reports_hidden_time():
+    warmup = WarmUp()
+    warmup.add("slow", lambda: time.sleep(0.2))
+    warmup.start()
+    time.sleep(0.3)  # Simulate the user typing while the task finishes
+    assert warmup.wait("slow") < 0.1
+    report = warmup.report()
+    assert report["slow_seconds"] >= 0.2
+    assert report["hidden_seconds"] >= 0.1
+
+
+def test_warmup_wait_without_start_returns_immediately():
+    warmup = WarmUp()
+    warmup.add("never", lambda: time.sleep(10))
+    assert warmup.wait("never") == 0.0
+    assert warmup.report()["total_seconds"] == 0.0
+
+
+def test_warmup_records_task_errors():
+    def broken():
+        raise RuntimeError("Model not found")
+
+    warmup = WarmUp()
+    warmup.add("broken", broken)
+    warmup.start()
+    warmup.wait("broken")
+    assert isinstance(warmup.errors["broken"], RuntimeError)
+
+
+if __name__ == "__main__":
+    pytest.main()
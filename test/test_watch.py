@@ -0,0 +1,170 @@
+import threading
+from collections import Counter
+
+import pytest
+from src.history_store import HistoryStore
+from src.watch import TopicWatch, format_watch_update, parse_interval, run_watches
+from test.conftest import article
+
+
+class FakeApi:
+    """Returns the newest articles published between the requested start and end date"""
+
+    def __init__(self, articles, max_articles=None):
+        self.articles = articles
+        self.max_articles = max_articles
+        self.from_dates = []
+        self.to_dates = []
+
+    def __call__(self, topic, language, from_date, to_date=None):
+        self.from_dates.append(from_date)
+        self.to_dates.append(to_date)
+        start = from_date.strftime("%Y-%m-%dT%H:%M:%SZ") if from_date else ""
+        end = to_date.strftime("%Y-%m-%dT%H:%M:%SZ") if to_date else "~"
+        found = [item for item in self.articles if start <= item["publishedAt"] <= end]
+        if self.max_articles is not None:
+            found = sorted(found, key=lambda item: item["publishedAt"], reverse=True)
+        return [found[: self.max_articles]]
+
+
+def make_watch(store, api, tagged):
+    def extract_entities(titles):
+        tagged.extend(titles)
+        return Counter({"SpaceX": len(titles)})
+
+    return TopicWatch(
+        "SpaceX",
+        "en",
+        store=store,
+        fetch=api,
+        extract_entities=extract_entities,
+        summarize=lambda titles: f"{len(titles)} headlines",
+    )
+
+
+def test_poll_only_handles_new_articles(store):
+    api = FakeApi(
+        [article(1, published_at="2024-07-19T10:00:00Z"), article(2, published_at="2024-07-19T11:00:00Z")]
+    )
+    tagged = []
+    watch = make_watch(store, api, tagged)
+
+    first = watch.poll()
+    assert len(first.new_articles) == 2
+    assert first.summary == "2 headlines"
+    assert first.newest_published_at == "2024-07-19T11:00:00Z"
+    assert first.entities == Counter({"SpaceX": 2})
+
+    api.articles.append(article(3, published_at="2024-07-19T12:00:00Z"))
+    second = watch.poll()
+    assert [item["url"][-1] for item in second.new_articles] == ["3"]
+    assert second.new_entities == Counter({"SpaceX": 1})
+    assert second.entities == Counter({"SpaceX": 3})
+    assert api.from_dates[0] is None
+    assert api.from_dates[1].isoformat() == "2024-07-19T11:00:00+00:00"
+
+    # Nothing new: no tagging, no summary, no new run
+    third = watch.poll()
+    assert third.new_articles == [] and third.summary is None
+    assert tagged == ["Headline 1", "Headline 2", "Headline 3"]
+    assert store.stats()["runs"] == 2
+
+
+def test_state_survives_restarts(store, tmp_path):
+    api = FakeApi([article(1, published_at="2024-07-19T10:00:00Z")])
+    make_watch(store, api, []).poll()
+    store.close()
+
+    reopened = HistoryStore(tmp_path / "history.sqlite")
+    tagged = []
+    update = make_watch(reopened, api, tagged).poll()
+    assert update.new_articles == [] and tagged == []
+    assert update.entities == Counter({"SpaceX": 1})
+    assert reopened.watch_state("spacex", "en") == ("2024-07-19T10:00:00Z", Counter({"SpaceX": 1}))
+
+
+def test_failed_tagging_leaves_articles_for_next_poll(store):
+    api = FakeApi([article(1, published_at="2024-07-19T10:00:00Z")])
+    watch = make_watch(store, api, [])
+
+    def missing_tagger(titles):
+        raise LookupError("punkt")
+
+    watch.extract_entities = missing_tagger
+    with pytest.raises(LookupError):
+        watch.poll()
+
+    watch.extract_entities = lambda titles: Counter({"SpaceX": len(titles)})
+    assert len(watch.poll().new_articles) == 1
+
+
+def test_failed_summary_is_reported(store):
+    watch = make_watch(store, FakeApi([article(1, published_at="2024-07-19T10:00:00Z")]), [])
+    watch.summarize = lambda titles: 1 / 0
+    update = watch.poll()
+    assert update.error.startswith("summarize:")
+    assert "WARNING: summarize" in format_watch_update(update)
+    assert update.entities == Counter({"SpaceX": 1})
+
+
+def test_run_watches_reports_errors_and_stops(store):
+    def fetch(topic, language, from_date, to_date):
+        raise ConnectionError("offline")
+
+    watch = make_watch(store, fetch, [])
+    updates = []
+    assert run_watches([watch], 0, rounds=3, on_update=updates.append) == 3
+    assert [update.error for update in updates] == ["offline"] * 3
+
+    stop = threading.Event()
+    stop.set()
+    assert run_watches([watch], 60, stop=stop) == 1
+
+
+def test_parse_interval():
+    assert parse_interval("90") == 90
+    assert parse_interval("5m") == 300
+    assert parse_interval("1.5h") == 5400
+    for text in ("", "0", "5 minutes", "-1"):
+        with pytest.raises(ValueError):
+            parse_interval(text)
+
+
+def test_new_articles_are_indexed(store):
+    watch = make_watch(store, FakeApi([article(1, published_at="2024-07-19T10:00:00Z")]), [])
+    indexed = []
+    watch.index = indexed.extend
+    watch.poll()
+    watch.poll()
+    assert indexed == [{**article(1, published_at="2024-07-19T10:00:00Z"), "language": "en"}]
+
+    watch.index = lambda articles: 1 / 0
+    watch.fetch = FakeApi([article(2, published_at="2024-07-19T11:00:00Z")])
+    update = watch.poll()
+    assert update.error.startswith("index:")
+    assert store.stats()["articles"] == 2  # Saved even though indexing failed
+
+
+def test_capped_poll_reaches_back_to_the_previous_poll(store):
+    api = FakeApi([article(1, published_at="2024-07-19T10:00:00Z")], max_articles=2)
+    watch = make_watch(store, api, [])
+    watch.max_articles = 2
+    watch.poll()
+
+    # Five articles arrive before the next poll, more than one search returns
+    api.articles += [article(index, published_at=f"2024-07-19T1{index}:00:00Z") for index in range(2, 7)]
+    update = watch.poll()
+    assert sorted(item["url"][-1] for item in update.new_articles) == ["2", "3", "4", "5", "6"]
+    assert update.newest_published_at == "2024-07-19T16:00:00Z"
+    assert api.to_dates[1] is None
+    assert api.to_dates[2].isoformat() == "2024-07-19T15:00:00+00:00"
+
+
+def test_first_poll_is_not_paged_back(store):
+    api = FakeApi(
+        [article(index, published_at=f"2024-07-19T1{index}:00:00Z") for index in range(5)], max_articles=2
+    )
+    watch = make_watch(store, api, [])
+    watch.max_articles = 2
+    assert len(watch.poll().new_articles) == 2
+    assert api.to_dates == [None]